@@ -31,7 +31,7 @@ class HabitFrequency(Enum):
     CUSTOM = "custom"  # Custom interval in days
 
 
-@dataclass
+@dataclass(slots=True)
 class HabitEntry:
     """
     Individual habit entry/record.
@@ -48,7 +48,7 @@ class HabitEntry:
     updated_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class Habit:
     """
     Habit model for tracking various types of habits.
@@ -86,6 +86,14 @@ class Habit:
     # Recent entries (not persisted, loaded on demand)
     recent_entries: List[HabitEntry] = field(default_factory=list)
 
+    # (entries key, value) of the last today value and streak calculations
+    _today_value_cache: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _streak_cache: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def get_display_value(self, value: Union[float, int, bool, str]) -> str:
         """Get a formatted display value for the habit entry."""
         if self.habit_type == HabitType.DURATION:
@@ -118,8 +126,20 @@ class Habit:
         else:
             return True  # Any entry counts as completion
 
+    def _entries_key(self) -> tuple:
+        """Get a key that changes with the day and with the recent entries."""
+        last_date = self.recent_entries[-1].date if self.recent_entries else None
+        return (date.today(), len(self.recent_entries), last_date)
+
     def get_today_value(self) -> Optional[Union[float, int, bool, str]]:
-        """Get today's value for this habit."""
+        """Get today's value for this habit, reusing it until the entries change."""
+        key = self._entries_key()
+        if self._today_value_cache is None or self._today_value_cache[0] != key:
+            self._today_value_cache = (key, self._calculate_today_value())
+        return self._today_value_cache[1]
+
+    def _calculate_today_value(self) -> Optional[Union[float, int, bool, str]]:
+        """Calculate today's value for this habit."""
         today = date.today()
         today_entries = [entry for entry in self.recent_entries if entry.date == today]
 
@@ -143,6 +163,13 @@ class Habit:
                 return total_value
 
     def get_streak_days(self) -> int:
+        """Get the current streak, reusing it until the entries change."""
+        key = self._entries_key()
+        if self._streak_cache is None or self._streak_cache[0] != key:
+            self._streak_cache = (key, self._calculate_streak_days())
+        return self._streak_cache[1]
+
+    def _calculate_streak_days(self) -> int:
         """Calculate current streak of completed days."""
         if not self.recent_entries:
             return 0
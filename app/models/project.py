@@ -9,8 +9,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 
+from app.models.tag import TagView
 
-@dataclass
+
+@dataclass(slots=True)
 class Project:
     """
     Project entity representing a work project.
@@ -26,7 +28,7 @@ class Project:
     estimated_hours: Optional[float] = None
     priority: str = "medium"  # low, medium, high, urgent
     status: str = "active"  # active, completed, paused, cancelled
-    tags: List[dict] = field(default_factory=list)
+    tags: List[TagView] = field(default_factory=list)
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
@@ -22,3 +22,44 @@ class Tag:
     usage_count: int = 0
     linked_projects: List[int] = field(default_factory=list)
     linked_tasks: List[int] = field(default_factory=list)
+
+
+class TagView:
+    """
+    Lightweight view of a tag attached to a project or task.
+
+    Uses __slots__ instead of a per-tag dict since these are built for
+    every tag row on each project/task list load.
+    """
+
+    __slots__ = ("name", "color", "description")
+
+    def __init__(
+        self, name: str, color: Optional[str] = None, description: Optional[str] = None
+    ):
+        self.name = name
+        self.color = color or "#FF5733"  # Default color if None
+        self.description = description or ""
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TagView):
+            return NotImplemented
+        return (self.name, self.color, self.description) == (
+            other.name,
+            other.color,
+            other.description,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"TagView(name={self.name!r}, color={self.color!r}, "
+            f"description={self.description!r})"
+        )
+
+    def to_dict(self) -> dict:
+        """Return the tag as a plain dict for callers that need one."""
+        return {
+            "name": self.name,
+            "color": self.color,
+            "description": self.description,
+        }
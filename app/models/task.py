@@ -9,8 +9,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 
+from app.models.tag import TagView
 
-@dataclass
+
+@dataclass(slots=True)
 class Task:
     """
     Task entity representing a work task.
@@ -27,7 +29,7 @@ class Task:
     due_date: Optional[datetime] = None
     estimated_hours: Optional[float] = None
     priority: str = "medium"  # low, medium, high, urgent
-    tags: List[dict] = field(default_factory=list)
+    tags: List[TagView] = field(default_factory=list)
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
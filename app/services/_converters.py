@@ -0,0 +1,93 @@
+"""
+Row converters for the database service.
+
+This module holds the per-row functions that turn ORM model instances
+into the application's dataclasses. They run once per fetched row, so
+they are kept as plain module-level functions with no service state.
+"""
+
+from typing import List
+from app.models.project import Project
+from app.models.task import Task
+from app.models.tag import TagView
+from app.models.timer import Timer
+from app.models.habit import HabitEntry
+
+# Casts restoring a habit entry's stored float value to its original type
+_VALUE_CASTS = {"bool": bool, "int": int, "str": str}
+
+
+def optional_float(value):
+    """Get a REAL column value as a float, keeping None.
+
+    SQLite's RETURNING hands whole-number REAL values back as ints, before
+    column affinity applies, so rows from INSERT ... RETURNING need this.
+    """
+    return None if value is None else float(value)
+
+
+def project_from_model(db_project, tags: List[TagView]) -> Project:
+    """Convert ProjectModel to Project dataclass."""
+    return Project(
+        id=db_project.id,
+        name=db_project.name,
+        description=db_project.description or "",
+        due_date=db_project.due_date,
+        estimated_hours=optional_float(db_project.estimated_hours),
+        priority=db_project.priority,
+        status=db_project.status,
+        tags=tags,
+        created_at=db_project.created_at,
+        updated_at=db_project.updated_at,
+        completed_at=db_project.completed_at,
+    )
+
+
+def task_from_model(db_task, tags: List[TagView]) -> Task:
+    """Convert TaskModel to Task dataclass."""
+    return Task(
+        id=db_task.id,
+        project_id=db_task.project_id,
+        name=db_task.name,
+        description=db_task.description or "",
+        completed=db_task.completed,
+        due_date=db_task.due_date,
+        estimated_hours=optional_float(db_task.estimated_hours),
+        priority=db_task.priority,
+        tags=tags,
+        created_at=db_task.created_at,
+        updated_at=db_task.updated_at,
+    )
+
+
+def timer_from_model(db_timer) -> Timer:
+    """Convert TimerModel to Timer dataclass."""
+    return Timer(
+        id=db_timer.id,
+        task_id=db_timer.task_id,
+        start=db_timer.start,
+        end=db_timer.end,
+        type=db_timer.type,
+        duration=db_timer.duration,
+        pomodoro_session_type=db_timer.pomodoro_session_type,
+        pomodoro_session_number=db_timer.pomodoro_session_number,
+    )
+
+
+def habit_entry_from_model(db_entry) -> HabitEntry:
+    """Convert HabitEntryModel to HabitEntry dataclass."""
+    # Convert stored float value back to original type
+    value = float(db_entry.value)
+    cast = _VALUE_CASTS.get(db_entry.value_type)
+    if cast is not None:
+        value = cast(value)
+
+    return HabitEntry(
+        id=db_entry.id,
+        habit_id=db_entry.habit_id,
+        date=db_entry.date.date(),  # Convert datetime to date
+        value=value,
+        notes=db_entry.notes,
+        created_at=db_entry.created_at,
+        updated_at=db_entry.updated_at,
+    )
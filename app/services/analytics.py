@@ -5,6 +5,7 @@ This module provides data analysis and statistics for productivity insights
 and visualization components.
 """
 
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import List, Dict
 from app.models.project import Project
@@ -20,6 +21,16 @@ from app.services.adapters import (
 )
 
 
+def _timer_hours(row) -> float:
+    """Get the hours covered by a finished timer row."""
+    return (row.end - row.start).total_seconds() / 3600
+
+
+def _is_work_timer(row) -> bool:
+    """Check whether a timer row is work time rather than a pomodoro break."""
+    return row.type != "pomodoro" or row.pomodoro_session_type == "work"
+
+
 class AnalyticsService:
     """
     Service for analyzing productivity data and generating insights.
@@ -44,29 +55,7 @@ class AnalyticsService:
         Returns:
             Dictionary mapping project names to total hours spent
         """
-        project_times = {}
-
-        # Get all projects from database
-        db_projects = self.db_service.get_projects()
-
-        for db_project in db_projects:
-            total_hours = 0
-
-            # Get all tasks for this project
-            project_tasks = self.db_service.get_tasks(project_id=db_project.id)
-
-            for task in project_tasks:
-                # Get all timers for this task
-                task_timers = self.db_service.get_timers(task_id=task.id)
-
-                for timer in task_timers:
-                    if timer.end:
-                        duration = timer.end - timer.start
-                        total_hours += duration.total_seconds() / 3600
-
-            project_times[db_project.name] = total_hours
-
-        return project_times
+        return self.db_service.get_project_hours()
 
     def get_time_by_tag(self) -> Dict[str, float]:
         """
@@ -75,26 +64,16 @@ class AnalyticsService:
         Returns:
             Dictionary mapping tag names to total hours spent
         """
-        tag_times = {}
-
-        # Get all tags from database
-        db_tags = self.db_service.get_tags()
-
-        for db_tag in db_tags:
-            total_hours = 0
-
-            if db_tag.linked_type == "task":
-                # Get all timers for this task
-                task_timers = self.db_service.get_timers(task_id=db_tag.linked_id)
-
-                for timer in task_timers:
-                    if timer.end:
-                        duration = timer.end - timer.start
-                        total_hours += duration.total_seconds() / 3600
-
-            tag_times[db_tag.name] = total_hours
+        hours_by_task = defaultdict(float)
+        for row in self.db_service.get_timer_rows_for_chart():
+            hours_by_task[row.task_id] += _timer_hours(row)
 
-        return tag_times
+        return {
+            tag.name: sum(
+                hours_by_task.get(task_id, 0.0) for task_id in tag.linked_tasks
+            )
+            for tag in self.db_service.get_tags()
+        }
 
     def get_daily_productivity(self, days: int = 7) -> Dict[str, float]:
         """
@@ -110,23 +89,15 @@ class AnalyticsService:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
 
+        # Bucket every finished timer by its start date in a single pass
+        hours_by_date = defaultdict(float)
+        for row in self.db_service.get_timer_rows_for_chart():
+            hours_by_date[row.start.date()] += _timer_hours(row)
+
         for i in range(days):
             current_date = start_date + timedelta(days=i)
             date_str = current_date.strftime("%Y-%m-%d")
-
-            # Get all timers for this date
-            all_timers = self.db_service.get_timers()
-            day_timers = [
-                timer
-                for timer in all_timers
-                if timer.start.date() == current_date.date() and timer.end
-            ]
-
-            total_hours = sum(
-                (timer.end - timer.start).total_seconds() / 3600 for timer in day_timers
-            )
-
-            daily_hours[date_str] = total_hours
+            daily_hours[date_str] = hours_by_date.get(current_date.date(), 0.0)
 
         return daily_hours
 
@@ -181,44 +152,18 @@ class AnalyticsService:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
 
-        # Get all timers
-        all_timers = self.db_service.get_timers()
-
-        # Filter out break timers and incomplete timers
-        work_timers = [
-            timer
-            for timer in all_timers
-            if timer.end
-            and timer.start >= start_date
-            and (
-                timer.type != "pomodoro"
-                or (timer.type == "pomodoro" and timer.pomodoro_session_type == "work")
-            )
-        ]
-
-        # Sort by start date
-        work_timers.sort(key=lambda x: x.start)
+        # Bucket work timers in the window by the date they ended
+        hours_by_end_date = defaultdict(float)
+        for row in self.db_service.get_timer_rows_for_chart():
+            if row.start >= start_date and _is_work_timer(row):
+                hours_by_end_date[row.end.date()] += _timer_hours(row)
 
         # Calculate cumulative hours
         total_hours = 0
-        current_date = start_date
-
         for i in range(days):
             current_date = start_date + timedelta(days=i)
             date_str = current_date.strftime("%Y-%m-%d")
-
-            # Add hours for timers that ended on this date
-            day_timers = [
-                timer
-                for timer in work_timers
-                if timer.end.date() == current_date.date()
-            ]
-
-            day_hours = sum(
-                (timer.end - timer.start).total_seconds() / 3600 for timer in day_timers
-            )
-
-            total_hours += day_hours
+            total_hours += hours_by_end_date.get(current_date.date(), 0.0)
             cumulative_hours[date_str] = total_hours
 
         return cumulative_hours
@@ -232,16 +177,11 @@ class AnalyticsService:
         """
         tag_times = {}
 
-        # Get all timers, excluding break timers
-        all_timers = self.db_service.get_timers()
+        # Get all finished timers, excluding break timers
         work_timers = [
-            timer
-            for timer in all_timers
-            if timer.end
-            and (
-                timer.type != "pomodoro"
-                or (timer.type == "pomodoro" and timer.pomodoro_session_type == "work")
-            )
+            row
+            for row in self.db_service.get_timer_rows_for_chart()
+            if _is_work_timer(row)
         ]
 
         # Get all tasks with their tags
@@ -250,11 +190,11 @@ class AnalyticsService:
 
         for task in all_tasks:
             if task.tags:
-                task_tags[task.id] = [tag["name"] for tag in task.tags]
+                task_tags[task.id] = [tag.name for tag in task.tags]
 
         # Calculate time per tag
         for timer in work_timers:
-            timer_hours = (timer.end - timer.start).total_seconds() / 3600
+            timer_hours = _timer_hours(timer)
 
             if timer.task_id in task_tags and task_tags[timer.task_id]:
                 # Distribute time across all tags for this task
@@ -276,39 +216,19 @@ class AnalyticsService:
             Dictionary mapping project names to total hours worked
         """
         project_times = {}
-
-        # Get all timers, excluding break timers
-        all_timers = self.db_service.get_timers()
-        work_timers = [
-            timer
-            for timer in all_timers
-            if timer.end
-            and (
-                timer.type != "pomodoro"
-                or (timer.type == "pomodoro" and timer.pomodoro_session_type == "work")
+        project_names = {p.id: p.name for p in self.db_service.get_projects()}
+
+        # Timer rows carry their task's project, so no task lookup is needed;
+        # timers whose task no longer exists have no project and are skipped
+        for row in self.db_service.get_timer_rows_for_chart():
+            if row.project_id is None or not _is_work_timer(row):
+                continue
+            project_name = project_names.get(
+                row.project_id, f"Project {row.project_id}"
+            )
+            timer_hours = _timer_hours(row)
+            project_times[project_name] = (
+                project_times.get(project_name, 0) + timer_hours
             )
-        ]
-
-        # Get all tasks with their project info
-        all_tasks = self.db_service.get_tasks()
-        all_projects = self.db_service.get_projects()
-
-        # Create task to project mapping
-        task_project = {}
-        project_names = {p.id: p.name for p in all_projects}
-
-        for task in all_tasks:
-            task_project[task.id] = task.project_id
-
-        # Calculate time per project
-        for timer in work_timers:
-            if timer.task_id in task_project:
-                project_id = task_project[timer.task_id]
-                project_name = project_names.get(project_id, f"Project {project_id}")
-
-                timer_hours = (timer.end - timer.start).total_seconds() / 3600
-                project_times[project_name] = (
-                    project_times.get(project_name, 0) + timer_hours
-                )
 
         return project_times
@@ -6,29 +6,95 @@ for the productivity application.
 """
 
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy import (
     create_engine,
-    Column,
-    Integer,
     String,
-    DateTime,
-    Boolean,
-    Float,
     Text,
     ForeignKey,
+    Index,
+    Row,
+    bindparam,
+    event,
     func,
+    insert,
+    select,
+    text,
 )
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    mapped_column,
+    raiseload,
+    sessionmaker,
+    relationship,
+)
+from sqlalchemy.pool import QueuePool, StaticPool
 from app.models.project import Project
 from app.models.task import Task
-from app.models.tag import Tag
+from app.models.tag import Tag, TagView
 from app.models.timer import Timer
 from app.models.habit import Habit, HabitEntry, HabitType, HabitFrequency
+from app.services._converters import (
+    habit_entry_from_model,
+    optional_float,
+    project_from_model,
+    task_from_model,
+    timer_from_model,
+)
+
+# orjson is an optional speedup for theme (de)serialization
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+class Base(DeclarativeBase):
+    """Declarative base for the application's ORM models."""
+
+
+def _engine_options(db_url: str) -> dict:
+    """Pick pool settings so service calls reuse warm connections."""
+    options = {"echo": False, "query_cache_size": 1200}
+    url = make_url(db_url)
+    if url.get_backend_name() != "sqlite":
+        options["pool_pre_ping"] = True
+        return options
+
+    # Pooled connections may be handed to other threads
+    options["connect_args"] = {"check_same_thread": False}
+    if url.database in (None, "", ":memory:"):
+        # Every connection to :memory: is a new database, so share one
+        options["poolclass"] = StaticPool
+    else:
+        options.update(poolclass=QueuePool, pool_size=8, max_overflow=4)
+    return options
+
 
-Base = declarative_base()
+def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+    """Tune every new SQLite connection for commit-heavy desktop use."""
+    # WAL turns each commit into an append instead of a journal rewrite and
+    # lets readers run alongside the writer; NORMAL syncs at checkpoints only
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
 
 
 class ProjectModel(Base):
@@ -36,22 +102,26 @@ class ProjectModel(Base):
 
     __tablename__ = "projects"
 
-    id = Column(Integer, primary_key=True)
-    name = Column(String(200), nullable=False)
-    description = Column(Text, nullable=True)
-    due_date = Column(DateTime, nullable=True)
-    estimated_hours = Column(Float, nullable=True)
-    priority = Column(String(20), default="medium")  # low, medium, high, urgent
-    status = Column(
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(200))
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    due_date: Mapped[Optional[datetime]]
+    estimated_hours: Mapped[Optional[float]]
+    priority: Mapped[Optional[str]] = mapped_column(
+        String(20), default="medium"
+    )  # low, medium, high, urgent
+    status: Mapped[Optional[str]] = mapped_column(
         String(20), default="active"
     )  # active, completed, paused, cancelled
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
-    completed_at = Column(DateTime, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=func.now(), onupdate=func.now()
+    )
+    completed_at: Mapped[Optional[datetime]]
 
     # Relationships
-    tasks = relationship(
-        "TaskModel", back_populates="project", cascade="all, delete-orphan"
+    tasks: Mapped[List["TaskModel"]] = relationship(
+        back_populates="project", cascade="all, delete-orphan"
     )
 
 
@@ -59,22 +129,25 @@ class TaskModel(Base):
     """SQLAlchemy model for tasks."""
 
     __tablename__ = "tasks"
-
-    id = Column(Integer, primary_key=True)
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
-    name = Column(String(200), nullable=False)
-    description = Column(Text, nullable=True)
-    completed = Column(Boolean, default=False)
-    due_date = Column(DateTime, nullable=True)
-    estimated_hours = Column(Float, nullable=True)
-    priority = Column(String(20), default="medium")
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    __table_args__ = (Index("ix_tasks_project_id", "project_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"))
+    name: Mapped[str] = mapped_column(String(200))
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    completed: Mapped[Optional[bool]] = mapped_column(default=False)
+    due_date: Mapped[Optional[datetime]]
+    estimated_hours: Mapped[Optional[float]]
+    priority: Mapped[Optional[str]] = mapped_column(String(20), default="medium")
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=func.now(), onupdate=func.now()
+    )
 
     # Relationships
-    project = relationship("ProjectModel", back_populates="tasks")
-    timers = relationship(
-        "TimerModel", back_populates="task", cascade="all, delete-orphan"
+    project: Mapped["ProjectModel"] = relationship(back_populates="tasks")
+    timers: Mapped[List["TimerModel"]] = relationship(
+        back_populates="task", cascade="all, delete-orphan"
     )
 
 
@@ -82,38 +155,40 @@ class TagModel(Base):
     """SQLAlchemy model for tags."""
 
     __tablename__ = "tags"
+    __table_args__ = (Index("ix_tags_link", "linked_type", "linked_id"),)
 
-    id = Column(Integer, primary_key=True)
-    name = Column(String(100), nullable=False)
-    linked_type = Column(String(20), nullable=False)  # 'project' or 'task'
-    linked_id = Column(Integer, nullable=False)
-    color = Column(String(7), nullable=True)  # Hex color code (e.g., #FF5733)
-    description = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    linked_type: Mapped[str] = mapped_column(String(20))  # 'project' or 'task'
+    linked_id: Mapped[int]
+    color: Mapped[Optional[str]] = mapped_column(
+        String(7)
+    )  # Hex color code (e.g., #FF5733)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=func.now())
 
 
 class TimerModel(Base):
     """SQLAlchemy model for timers."""
 
     __tablename__ = "timers"
-
-    id = Column(Integer, primary_key=True)
-    task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False)
-    start = Column(DateTime, nullable=False)
-    end = Column(DateTime, nullable=True)
-    type = Column(String(20), default="stopwatch")  # stopwatch, countdown, pomodoro
-    duration = Column(
-        Integer, nullable=True
-    )  # Duration in seconds for countdown/pomodoro
-    pomodoro_session_type = Column(
-        String(20), nullable=True
+    __table_args__ = (Index("ix_timers_task_id", "task_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id"))
+    start: Mapped[datetime]
+    end: Mapped[Optional[datetime]]
+    type: Mapped[Optional[str]] = mapped_column(
+        String(20), default="stopwatch"
+    )  # stopwatch, countdown, pomodoro
+    duration: Mapped[Optional[int]]  # Duration in seconds for countdown/pomodoro
+    pomodoro_session_type: Mapped[Optional[str]] = mapped_column(
+        String(20)
     )  # work, short_break, long_break
-    pomodoro_session_number = Column(
-        Integer, nullable=True
-    )  # Session number in the cycle
+    pomodoro_session_number: Mapped[Optional[int]]  # Session number in the cycle
 
     # Relationships
-    task = relationship("TaskModel", back_populates="timers")
+    task: Mapped["TaskModel"] = relationship(back_populates="timers")
 
 
 class ConfigModel(Base):
@@ -121,39 +196,52 @@ class ConfigModel(Base):
 
     __tablename__ = "config"
 
-    id = Column(Integer, primary_key=True)
-    key = Column(String(100), nullable=False, unique=True)
-    value = Column(String(500), nullable=False)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    key: Mapped[str] = mapped_column(String(100), unique=True)
+    value: Mapped[str] = mapped_column(String(500))
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=func.now(), onupdate=func.now()
+    )
 
 
 class HabitModel(Base):
     """SQLAlchemy model for habits."""
 
     __tablename__ = "habits"
+    __table_args__ = (
+        # Partial index matching get_habits(active_only=True); the predicate
+        # must match the rendered filter (active IS 1) for SQLite to use it
+        Index("ix_habit_active_partial", "id", sqlite_where=text("active IS 1")),
+    )
 
-    id = Column(Integer, primary_key=True)
-    name = Column(String(200), nullable=False)
-    description = Column(Text, nullable=True)
-    habit_type = Column(
-        String(20), nullable=False
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(200))
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    habit_type: Mapped[str] = mapped_column(
+        String(20)
     )  # duration, units, real_number, boolean, rating, count
-    frequency = Column(String(20), default="daily")  # daily, weekly, monthly, custom
-    custom_interval_days = Column(Integer, nullable=True)
-    target_value = Column(Float, nullable=True)
-    unit = Column(String(50), nullable=True)
-    color = Column(String(7), default="#007bff")  # Hex color
-    active = Column(Boolean, default=True)
-    min_value = Column(Float, nullable=True)
-    max_value = Column(Float, nullable=True)
-    rating_scale = Column(Integer, default=10)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    frequency: Mapped[Optional[str]] = mapped_column(
+        String(20), default="daily"
+    )  # daily, weekly, monthly, custom
+    custom_interval_days: Mapped[Optional[int]]
+    target_value: Mapped[Optional[float]]
+    unit: Mapped[Optional[str]] = mapped_column(String(50))
+    color: Mapped[Optional[str]] = mapped_column(
+        String(7), default="#007bff"
+    )  # Hex color
+    active: Mapped[Optional[bool]] = mapped_column(default=True)
+    min_value: Mapped[Optional[float]]
+    max_value: Mapped[Optional[float]]
+    rating_scale: Mapped[Optional[int]] = mapped_column(default=10)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=func.now(), onupdate=func.now()
+    )
 
     # Relationships
-    entries = relationship(
-        "HabitEntryModel", back_populates="habit", cascade="all, delete-orphan"
+    entries: Mapped[List["HabitEntryModel"]] = relationship(
+        back_populates="habit", cascade="all, delete-orphan"
     )
 
 
@@ -162,17 +250,19 @@ class HabitEntryModel(Base):
 
     __tablename__ = "habit_entries"
 
-    id = Column(Integer, primary_key=True)
-    habit_id = Column(Integer, ForeignKey("habits.id"), nullable=False)
-    date = Column(DateTime, nullable=False)  # Store as date
-    value = Column(Float, nullable=False)  # Store all values as float for simplicity
-    value_type = Column(String(20), nullable=False)  # float, int, bool, str
-    notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    habit_id: Mapped[int] = mapped_column(ForeignKey("habits.id"))
+    date: Mapped[datetime]  # Store as date
+    value: Mapped[float]  # Store all values as float for simplicity
+    value_type: Mapped[str] = mapped_column(String(20))  # float, int, bool, str
+    notes: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=func.now(), onupdate=func.now()
+    )
 
     # Relationships
-    habit = relationship("HabitModel", back_populates="entries")
+    habit: Mapped["HabitModel"] = relationship(back_populates="entries")
 
 
 class HabitTagModel(Base):
@@ -180,10 +270,29 @@ class HabitTagModel(Base):
 
     __tablename__ = "habit_tags"
 
-    id = Column(Integer, primary_key=True)
-    habit_id = Column(Integer, ForeignKey("habits.id"), nullable=False)
-    tag_name = Column(String(100), nullable=False)
-    created_at = Column(DateTime, default=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    habit_id: Mapped[int] = mapped_column(ForeignKey("habits.id"))
+    tag_name: Mapped[str] = mapped_column(String(100))
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=func.now())
+
+
+# Statements for the lookups issued on almost every call, built once so that
+# SQLAlchemy only has to hash them against its compiled cache
+_CONFIG_BY_KEY = select(ConfigModel).where(ConfigModel.key == bindparam("key"))
+_CONFIG_VALUE_BY_KEY = select(ConfigModel.value).where(
+    ConfigModel.key == bindparam("key")
+)
+_LINKED_TAGS = select(TagModel.name, TagModel.color, TagModel.description).where(
+    TagModel.linked_type == bindparam("linked_type"),
+    TagModel.linked_id == bindparam("linked_id"),
+)
+_HABIT_TAG_NAMES = select(HabitTagModel.tag_name).where(
+    HabitTagModel.habit_id == bindparam("habit_id")
+)
+
+# Stored enum values mapped to their members, avoiding Enum.__call__ per row
+_HABIT_TYPES = {member.value: member for member in HabitType}
+_HABIT_FREQUENCIES = {member.value: member for member in HabitFrequency}
 
 
 class DatabaseService:
@@ -193,22 +302,67 @@ class DatabaseService:
         """Initialize the database service."""
         try:
             logging.info(f"Initializing database with URL: {db_url}")
-            self.engine = create_engine(db_url, echo=False)
+            self.engine = create_engine(db_url, **_engine_options(db_url))
+            if self.engine.dialect.name == "sqlite":
+                event.listen(self.engine, "connect", _set_sqlite_pragmas)
             self.Session = sessionmaker(bind=self.engine)
 
+            # Connection of the unit of work active in the current context
+            self._uow_connection = ContextVar(
+                f"uow_connection_{id(self)}", default=None
+            )
+
             # Create all tables
             logging.info("Creating database tables...")
             Base.metadata.create_all(self.engine)
+            self._create_missing_indexes()
             logging.info("Database initialization completed successfully")
 
         except Exception as e:
             logging.error(f"Failed to initialize database: {e}", exc_info=True)
             raise
 
+    def _create_missing_indexes(self):
+        """Create indexes added after a database file was first created."""
+        # create_all() only creates indexes together with new tables
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
     def get_session(self):
-        """Get database session."""
+        """Get database session.
+
+        Inside unit_of_work() the session joins the shared transaction, so
+        its commit() only flushes and the real COMMIT happens once at the end.
+        """
+        connection = self._uow_connection.get()
+        if connection is not None:
+            return self.Session(bind=connection, join_transaction_mode="rollback_only")
         return self.Session()
 
+    @contextmanager
+    def unit_of_work(self):
+        """Run several service calls in one transaction with a single commit.
+
+        Yields a session bound to the shared transaction. Nested calls reuse
+        the outer unit of work; any exception rolls the whole batch back.
+        """
+        if self._uow_connection.get() is not None:
+            with self.get_session() as session:
+                yield session
+                session.flush()
+            return
+
+        with self.engine.connect() as connection:
+            with connection.begin():
+                token = self._uow_connection.set(connection)
+                try:
+                    with self.get_session() as session:
+                        yield session
+                        session.flush()
+                finally:
+                    self._uow_connection.reset(token)
+
     # Project CRUD operations
     def create_project(self, **kwargs) -> Project:
         """Create a new project."""
@@ -216,40 +370,40 @@ class DatabaseService:
         tags = kwargs.pop("tags", [])
 
         with self.get_session() as session:
-            db_project = ProjectModel(**kwargs)
-            session.add(db_project)
-            session.commit()
-            session.refresh(db_project)
+            # RETURNING hands back the inserted row, so no refresh is needed
+            db_project = session.execute(
+                insert(ProjectModel).values(**kwargs).returning(ProjectModel)
+            ).scalar_one()
 
             # Get tags for this project
             project_tags = self._get_project_tags(session, db_project.id)
-
-            return self._project_model_to_dataclass(db_project, project_tags)
+            project = self._project_model_to_dataclass(db_project, project_tags)
+            session.commit()
+            return project
 
     def get_projects(self, status: Optional[str] = None) -> List[Project]:
         """Get all projects, optionally filtered by status."""
         with self.get_session() as session:
-            query = session.query(ProjectModel)
+            # Only columns are read below, so any relationship access is a bug
+            query = session.query(ProjectModel).options(raiseload("*"))
             if status:
                 query = query.filter(ProjectModel.status == status)
 
             db_projects = query.all()
-            projects = []
-
-            for db_project in db_projects:
-                tags = self._get_project_tags(session, db_project.id)
-                projects.append(self._project_model_to_dataclass(db_project, tags))
-
-            return projects
+            tags_by_id = self._get_linked_tags_map(
+                session, "project", [db_project.id for db_project in db_projects]
+            )
+            return [
+                self._project_model_to_dataclass(
+                    db_project, tags_by_id.get(db_project.id, [])
+                )
+                for db_project in db_projects
+            ]
 
     def get_project(self, project_id: int) -> Optional[Project]:
         """Get a specific project by ID."""
         with self.get_session() as session:
-            db_project = (
-                session.query(ProjectModel)
-                .filter(ProjectModel.id == project_id)
-                .first()
-            )
+            db_project = session.get(ProjectModel, project_id)
             if db_project:
                 tags = self._get_project_tags(session, db_project.id)
                 return self._project_model_to_dataclass(db_project, tags)
@@ -261,11 +415,7 @@ class DatabaseService:
         tags = kwargs.pop("tags", None)
 
         with self.get_session() as session:
-            db_project = (
-                session.query(ProjectModel)
-                .filter(ProjectModel.id == project_id)
-                .first()
-            )
+            db_project = session.get(ProjectModel, project_id)
             if db_project:
                 # Update fields
                 for key, value in kwargs.items():
@@ -284,11 +434,7 @@ class DatabaseService:
     def delete_project(self, project_id: int) -> bool:
         """Delete a project."""
         with self.get_session() as session:
-            db_project = (
-                session.query(ProjectModel)
-                .filter(ProjectModel.id == project_id)
-                .first()
-            )
+            db_project = session.get(ProjectModel, project_id)
             if db_project:
                 session.delete(db_project)
                 session.commit()
@@ -301,11 +447,7 @@ class DatabaseService:
         """Add a tag to a project and optionally cascade to all its tasks."""
         with self.get_session() as session:
             # Check if project exists
-            project = (
-                session.query(ProjectModel)
-                .filter(ProjectModel.id == project_id)
-                .first()
-            )
+            project = session.get(ProjectModel, project_id)
             if not project:
                 return False
 
@@ -389,7 +531,7 @@ class DatabaseService:
         """Add a tag to a task and optionally cascade to the project if ALL tasks in the project have this tag."""
         with self.get_session() as session:
             # Check if task exists
-            task = session.query(TaskModel).filter(TaskModel.id == task_id).first()
+            task = session.get(TaskModel, task_id)
             if not task:
                 return False
 
@@ -542,9 +684,7 @@ class DatabaseService:
                 # Cascade removal to project if requested
                 if cascade_to_project:
                     # Get the task to find its project
-                    task = (
-                        session.query(TaskModel).filter(TaskModel.id == task_id).first()
-                    )
+                    task = session.get(TaskModel, task_id)
                     if task:
                         # Get all tasks in the project
                         all_tasks_in_project = (
@@ -739,39 +879,36 @@ class DatabaseService:
 
             return [(name, count) for name, count in tag_counts]
 
-    def _get_project_tags(self, session, project_id: int) -> List[dict]:
+    def _get_project_tags(self, session, project_id: int) -> List[TagView]:
         """Get tags for a project with color and description."""
-        tags = (
-            session.query(TagModel)
-            .filter(TagModel.linked_type == "project", TagModel.linked_id == project_id)
-            .all()
-        )
-        return [
-            {
-                "name": tag.name,
-                "color": tag.color or "#FF5733",
-                "description": tag.description or "",
-            }
-            for tag in tags
-        ]
-
-    def _project_model_to_dataclass(
-        self, db_project: ProjectModel, tags: List[dict]
-    ) -> Project:
-        """Convert ProjectModel to Project dataclass."""
-        return Project(
-            id=db_project.id,
-            name=db_project.name,
-            description=db_project.description or "",
-            due_date=db_project.due_date,
-            estimated_hours=db_project.estimated_hours,
-            priority=db_project.priority,
-            status=db_project.status,
-            tags=tags,
-            created_at=db_project.created_at,
-            updated_at=db_project.updated_at,
-            completed_at=db_project.completed_at,
-        )
+        rows = session.execute(
+            _LINKED_TAGS, {"linked_type": "project", "linked_id": project_id}
+        ).all()
+        return [TagView(row[0], row[1], row[2]) for row in rows]
+
+    def _get_linked_tags_map(
+        self, session, linked_type: str, linked_ids: List[int]
+    ) -> Dict[int, List[TagView]]:
+        """Get tags for many projects or tasks in one query, keyed by linked ID."""
+        tags_by_id: Dict[int, List[TagView]] = {}
+        if not linked_ids:
+            return tags_by_id
+        rows = session.execute(
+            select(
+                TagModel.linked_id,
+                TagModel.name,
+                TagModel.color,
+                TagModel.description,
+            ).where(
+                TagModel.linked_type == linked_type,
+                TagModel.linked_id.in_(linked_ids),
+            )
+        ).all()
+        for row in rows:
+            tags_by_id.setdefault(row[0], []).append(TagView(row[1], row[2], row[3]))
+        return tags_by_id
+
+    _project_model_to_dataclass = staticmethod(project_from_model)
 
     # Task CRUD operations
     def create_task(self, **kwargs) -> Task:
@@ -779,11 +916,12 @@ class DatabaseService:
         # Extract tags from kwargs since they're not part of TaskModel
         tags = kwargs.pop("tags", [])
 
-        with self.get_session() as session:
-            db_task = TaskModel(**kwargs)
-            session.add(db_task)
-            session.commit()
-            session.refresh(db_task)
+        # The tag helpers commit per tag, so batch them into one transaction
+        with self.unit_of_work() as session:
+            # RETURNING hands back the inserted row, so no refresh is needed
+            db_task = session.execute(
+                insert(TaskModel).values(**kwargs).returning(TaskModel)
+            ).scalar_one()
 
             # Add tags separately
             for tag_name in tags:
@@ -791,7 +929,8 @@ class DatabaseService:
 
             # Inherit project tags if any
             project_tags = self._get_project_tags(session, db_task.project_id)
-            for tag_name in project_tags:
+            for project_tag in project_tags:
+                tag_name = project_tag.name
                 # Check if tag already exists for this task
                 existing_tag = (
                     session.query(TagModel)
@@ -808,34 +947,54 @@ class DatabaseService:
                     )
                     session.add(task_tag)
 
-            session.commit()
-
             # Get tags for this task
             task_tags = self._get_task_tags(session, db_task.id)
+            task = self._task_model_to_dataclass(db_task, task_tags)
+            session.commit()
+            return task
 
-            return self._task_model_to_dataclass(db_task, task_tags)
+    def create_tasks_bulk(self, rows: List[dict]) -> List[int]:
+        """Create many tasks in one transaction and return their IDs.
+
+        Rows hold TaskModel columns only; tags are not applied here. The
+        returned IDs are in the same order as rows.
+        """
+        if not rows:
+            return []
+
+        with self.get_session() as session:
+            task_ids = list(
+                session.scalars(
+                    insert(TaskModel).returning(
+                        TaskModel.id, sort_by_parameter_order=True
+                    ),
+                    rows,
+                )
+            )
+            session.commit()
+            return task_ids
 
     def get_tasks(self, project_id: Optional[int] = None) -> List[Task]:
         """Get all tasks, optionally filtered by project."""
         with self.get_session() as session:
-            query = session.query(TaskModel)
+            # Only columns are read below, so any relationship access is a bug
+            query = session.query(TaskModel).options(raiseload("*"))
             if project_id:
                 query = query.filter(TaskModel.project_id == project_id)
 
             db_tasks = query.all()
-            tasks = []
-
-            for db_task in db_tasks:
-                task_tags = self._get_task_tags(session, db_task.id)
-                task = self._task_model_to_dataclass(db_task, task_tags)
-                tasks.append(task)
-
-            return tasks
+            tags_by_id = self._get_linked_tags_map(
+                session, "task", [db_task.id for db_task in db_tasks]
+            )
+            return [
+                self._task_model_to_dataclass(db_task, tags_by_id.get(db_task.id, []))
+                for db_task in db_tasks
+            ]
 
     def get_task(self, task_id: int) -> Optional[Task]:
         """Get a specific task by ID."""
         with self.get_session() as session:
-            db_task = session.query(TaskModel).filter(TaskModel.id == task_id).first()
+            db_task = session.get(TaskModel, task_id)
             if db_task:
                 task_tags = self._get_task_tags(session, db_task.id)
                 return self._task_model_to_dataclass(db_task, task_tags)
@@ -846,8 +1005,9 @@ class DatabaseService:
         # Extract tags from kwargs since they're not part of TaskModel
         tags = kwargs.pop("tags", None)
 
-        with self.get_session() as session:
-            db_task = session.query(TaskModel).filter(TaskModel.id == task_id).first()
+        # The tag helpers commit per tag, so batch them into one transaction
+        with self.unit_of_work() as session:
+            db_task = session.get(TaskModel, task_id)
             if db_task:
                 # Update fields
                 for key, value in kwargs.items():
@@ -863,7 +1023,7 @@ class DatabaseService:
                     # Remove old tags
                     current_tags = self._get_task_tags(session, task_id)
                     for tag in current_tags:
-                        self.remove_task_tag(task_id, tag["name"])
+                        self.remove_task_tag(task_id, tag.name)
                     # Add new tags
                     for tag in tags:
                         self.add_task_tag(task_id, tag)
@@ -876,54 +1036,53 @@ class DatabaseService:
     def delete_task(self, task_id: int) -> bool:
         """Delete a task."""
         with self.get_session() as session:
-            db_task = session.query(TaskModel).filter(TaskModel.id == task_id).first()
+            db_task = session.get(TaskModel, task_id)
             if db_task:
                 session.delete(db_task)
                 session.commit()
                 return True
             return False
 
-    def _get_task_tags(self, session, task_id: int) -> List[dict]:
+    def _get_task_tags(self, session, task_id: int) -> List[TagView]:
         """Get tags for a task with color and description."""
-        tags = (
-            session.query(TagModel)
-            .filter(TagModel.linked_type == "task", TagModel.linked_id == task_id)
-            .all()
-        )
-        return [
-            {
-                "name": tag.name,
-                "color": tag.color or "#FF5733",
-                "description": tag.description or "",
-            }
-            for tag in tags
-        ]
-
-    def _task_model_to_dataclass(self, db_task: TaskModel, tags: List[dict]) -> Task:
-        """Convert TaskModel to Task dataclass."""
-        return Task(
-            id=db_task.id,
-            project_id=db_task.project_id,
-            name=db_task.name,
-            description=db_task.description or "",
-            completed=db_task.completed,
-            due_date=db_task.due_date,
-            estimated_hours=db_task.estimated_hours,
-            priority=db_task.priority,
-            tags=tags,
-            created_at=db_task.created_at,
-            updated_at=db_task.updated_at,
-        )
+        rows = session.execute(
+            _LINKED_TAGS, {"linked_type": "task", "linked_id": task_id}
+        ).all()
+        return [TagView(row[0], row[1], row[2]) for row in rows]
+
+    _task_model_to_dataclass = staticmethod(task_from_model)
 
     # Timer CRUD operations
     def create_timer(self, **kwargs) -> Timer:
         """Create a new timer."""
         with self.get_session() as session:
-            db_timer = TimerModel(**kwargs)
-            session.add(db_timer)
+            # RETURNING hands back the inserted row, so no refresh is needed
+            db_timer = session.execute(
+                insert(TimerModel).values(**kwargs).returning(TimerModel)
+            ).scalar_one()
+            timer = self._timer_model_to_dataclass(db_timer)
             session.commit()
-            session.refresh(db_timer)
-            return self._timer_model_to_dataclass(db_timer)
+            return timer
+
+    def create_timers_bulk(self, rows: List[dict]) -> List[int]:
+        """Create many timers in one transaction and return their IDs.
+
+        The returned IDs are in the same order as rows.
+        """
+        if not rows:
+            return []
+
+        with self.get_session() as session:
+            timer_ids = list(
+                session.scalars(
+                    insert(TimerModel).returning(
+                        TimerModel.id, sort_by_parameter_order=True
+                    ),
+                    rows,
+                )
+            )
+            session.commit()
+            return timer_ids
 
     def get_timers(self, task_id: Optional[int] = None) -> List[Timer]:
         """Get all timers, optionally filtered by task."""
@@ -935,12 +1094,54 @@ class DatabaseService:
             db_timers = query.all()
             return [self._timer_model_to_dataclass(timer) for timer in db_timers]
 
+    def get_timer_rows_for_chart(self) -> List[Row]:
+        """
+        Get finished timers as lightweight rows for chart aggregation.
+
+        Each row has task_id, project_id, start, end, type and
+        pomodoro_session_type attributes. No ORM objects or dataclasses are
+        built, which keeps full-history chart queries cheap.
+        """
+        with self.get_session() as session:
+            return session.execute(
+                select(
+                    TimerModel.task_id,
+                    TaskModel.project_id,
+                    TimerModel.start,
+                    TimerModel.end,
+                    TimerModel.type,
+                    TimerModel.pomodoro_session_type,
+                )
+                .outerjoin(TaskModel, TaskModel.id == TimerModel.task_id)
+                .where(TimerModel.end.is_not(None))
+            ).all()
+
+    def get_project_hours(self) -> Dict[str, float]:
+        """
+        Get total tracked hours per project, computed in SQL.
+
+        Projects without any finished timers are included with 0 hours.
+        """
+        timer_hours = (
+            func.julianday(TimerModel.end) - func.julianday(TimerModel.start)
+        ) * 24.0
+        with self.get_session() as session:
+            rows = session.execute(
+                select(ProjectModel.name, func.coalesce(func.sum(timer_hours), 0.0))
+                .outerjoin(TaskModel, TaskModel.project_id == ProjectModel.id)
+                .outerjoin(
+                    TimerModel,
+                    (TimerModel.task_id == TaskModel.id) & TimerModel.end.is_not(None),
+                )
+                .group_by(ProjectModel.id)
+                .order_by(ProjectModel.id)
+            ).all()
+            return dict(rows)
+
     def update_timer(self, timer_id: int, **kwargs) -> Optional[Timer]:
         """Update a timer."""
         with self.get_session() as session:
-            db_timer = (
-                session.query(TimerModel).filter(TimerModel.id == timer_id).first()
-            )
+            db_timer = session.get(TimerModel, timer_id)
             if db_timer:
                 for key, value in kwargs.items():
                     if hasattr(db_timer, key):
@@ -950,58 +1151,17 @@ class DatabaseService:
                 return self._timer_model_to_dataclass(db_timer)
             return None
 
-    def _timer_model_to_dataclass(self, db_timer: TimerModel) -> Timer:
-        """Convert TimerModel to Timer dataclass."""
-        return Timer(
-            id=db_timer.id,
-            task_id=db_timer.task_id,
-            start=db_timer.start,
-            end=db_timer.end,
-            type=db_timer.type,
-            duration=db_timer.duration,
-            pomodoro_session_type=db_timer.pomodoro_session_type,
-            pomodoro_session_number=db_timer.pomodoro_session_number,
-        )
+    _timer_model_to_dataclass = staticmethod(timer_from_model)
 
-    def get_project_tags(self, project_id: int) -> List[dict]:
+    def get_project_tags(self, project_id: int) -> List[TagView]:
         """Get all tags for a specific project."""
         with self.get_session() as session:
-            tags = (
-                session.query(TagModel.name, TagModel.color, TagModel.description)
-                .filter(
-                    TagModel.linked_type == "project",
-                    TagModel.linked_id == project_id,
-                )
-                .all()
-            )
-            return [
-                {
-                    "name": tag[0],
-                    "color": tag[1] or "#FF5733",
-                    "description": tag[2] or "",
-                }
-                for tag in tags
-            ]
+            return self._get_project_tags(session, project_id)
 
-    def get_task_tags(self, task_id: int) -> List[dict]:
+    def get_task_tags(self, task_id: int) -> List[TagView]:
         """Get all tags for a specific task."""
         with self.get_session() as session:
-            tags = (
-                session.query(TagModel.name, TagModel.color, TagModel.description)
-                .filter(
-                    TagModel.linked_type == "task",
-                    TagModel.linked_id == task_id,
-                )
-                .all()
-            )
-            return [
-                {
-                    "name": tag[0],
-                    "color": tag[1] or "#FF5733",
-                    "description": tag[2] or "",
-                }
-                for tag in tags
-            ]
+            return self._get_task_tags(session, task_id)
 
     def sync_project_tags_to_tasks(self, project_id: int) -> bool:
         """Synchronize project tags to all its tasks (add missing tags to tasks)."""
@@ -1051,7 +1211,7 @@ class DatabaseService:
         """Synchronize task tags to project (add task tags to project if not present)."""
         with self.get_session() as session:
             # Get task
-            task = session.query(TaskModel).filter(TaskModel.id == task_id).first()
+            task = session.get(TaskModel, task_id)
             if not task:
                 return False
 
@@ -1091,13 +1251,15 @@ class DatabaseService:
     def get_config(self, key: str, default: str = "") -> str:
         """Get a configuration value by key."""
         with self.get_session() as session:
-            config = session.query(ConfigModel).filter(ConfigModel.key == key).first()
-            return config.value if config else default
+            value = session.execute(
+                _CONFIG_VALUE_BY_KEY, {"key": key}
+            ).scalar_one_or_none()
+            return value if value is not None else default
 
     def set_config(self, key: str, value: str) -> bool:
         """Set a configuration value by key."""
         with self.get_session() as session:
-            config = session.query(ConfigModel).filter(ConfigModel.key == key).first()
+            config = session.execute(_CONFIG_BY_KEY, {"key": key}).scalar_one_or_none()
             if config:
                 config.value = value
                 config.updated_at = func.now()
@@ -1116,49 +1278,52 @@ class DatabaseService:
     def save_timer_settings(self, settings: dict) -> bool:
         """Save timer settings to the database."""
         try:
-            # Save countdown settings
-            self.set_config(
-                "timer_countdown_minutes", str(settings.get("countdown_minutes", 30))
-            )
-            self.set_config(
-                "timer_countdown_seconds", str(settings.get("countdown_seconds", 0))
-            )
-            self.set_config(
-                "timer_countdown_count_down",
-                str(settings.get("countdown_count_down", True)),
-            )
+            with self.unit_of_work():
+                # Save countdown settings
+                self.set_config(
+                    "timer_countdown_minutes",
+                    str(settings.get("countdown_minutes", 30)),
+                )
+                self.set_config(
+                    "timer_countdown_seconds", str(settings.get("countdown_seconds", 0))
+                )
+                self.set_config(
+                    "timer_countdown_count_down",
+                    str(settings.get("countdown_count_down", True)),
+                )
 
-            # Save pomodoro settings
-            self.set_config(
-                "timer_work_duration", str(settings.get("work_duration", 25))
-            )
-            self.set_config(
-                "timer_short_break_duration",
-                str(settings.get("short_break_duration", 5)),
-            )
-            self.set_config(
-                "timer_long_break_duration",
-                str(settings.get("long_break_duration", 15)),
-            )
-            self.set_config(
-                "timer_autostart_breaks", str(settings.get("autostart_breaks", True))
-            )
-            self.set_config(
-                "timer_autostart_work", str(settings.get("autostart_work", True))
-            )
-            self.set_config(
-                "timer_work_count_down", str(settings.get("work_count_down", True))
-            )
-            self.set_config(
-                "timer_short_break_count_down",
-                str(settings.get("short_break_count_down", True)),
-            )
-            self.set_config(
-                "timer_long_break_count_down",
-                str(settings.get("long_break_count_down", True)),
-            )
+                # Save pomodoro settings
+                self.set_config(
+                    "timer_work_duration", str(settings.get("work_duration", 25))
+                )
+                self.set_config(
+                    "timer_short_break_duration",
+                    str(settings.get("short_break_duration", 5)),
+                )
+                self.set_config(
+                    "timer_long_break_duration",
+                    str(settings.get("long_break_duration", 15)),
+                )
+                self.set_config(
+                    "timer_autostart_breaks",
+                    str(settings.get("autostart_breaks", True)),
+                )
+                self.set_config(
+                    "timer_autostart_work", str(settings.get("autostart_work", True))
+                )
+                self.set_config(
+                    "timer_work_count_down", str(settings.get("work_count_down", True))
+                )
+                self.set_config(
+                    "timer_short_break_count_down",
+                    str(settings.get("short_break_count_down", True)),
+                )
+                self.set_config(
+                    "timer_long_break_count_down",
+                    str(settings.get("long_break_count_down", True)),
+                )
 
-            return True
+                return True
         except Exception as e:
             print(f"Error saving timer settings: {e}")
             return False
@@ -1166,45 +1331,46 @@ class DatabaseService:
     def load_timer_settings(self) -> dict:
         """Load timer settings from the database."""
         try:
-            return {
-                "countdown_minutes": int(
-                    self.get_config("timer_countdown_minutes", "30")
-                ),
-                "countdown_seconds": int(
-                    self.get_config("timer_countdown_seconds", "0")
-                ),
-                "countdown_count_down": self.get_config(
-                    "timer_countdown_count_down", "True"
-                ).lower()
-                == "true",
-                "work_duration": int(self.get_config("timer_work_duration", "25")),
-                "short_break_duration": int(
-                    self.get_config("timer_short_break_duration", "5")
-                ),
-                "long_break_duration": int(
-                    self.get_config("timer_long_break_duration", "15")
-                ),
-                "autostart_breaks": self.get_config(
-                    "timer_autostart_breaks", "True"
-                ).lower()
-                == "true",
-                "autostart_work": self.get_config(
-                    "timer_autostart_work", "True"
-                ).lower()
-                == "true",
-                "work_count_down": self.get_config(
-                    "timer_work_count_down", "True"
-                ).lower()
-                == "true",
-                "short_break_count_down": self.get_config(
-                    "timer_short_break_count_down", "True"
-                ).lower()
-                == "true",
-                "long_break_count_down": self.get_config(
-                    "timer_long_break_count_down", "True"
-                ).lower()
-                == "true",
-            }
+            with self.unit_of_work():
+                return {
+                    "countdown_minutes": int(
+                        self.get_config("timer_countdown_minutes", "30")
+                    ),
+                    "countdown_seconds": int(
+                        self.get_config("timer_countdown_seconds", "0")
+                    ),
+                    "countdown_count_down": self.get_config(
+                        "timer_countdown_count_down", "True"
+                    ).lower()
+                    == "true",
+                    "work_duration": int(self.get_config("timer_work_duration", "25")),
+                    "short_break_duration": int(
+                        self.get_config("timer_short_break_duration", "5")
+                    ),
+                    "long_break_duration": int(
+                        self.get_config("timer_long_break_duration", "15")
+                    ),
+                    "autostart_breaks": self.get_config(
+                        "timer_autostart_breaks", "True"
+                    ).lower()
+                    == "true",
+                    "autostart_work": self.get_config(
+                        "timer_autostart_work", "True"
+                    ).lower()
+                    == "true",
+                    "work_count_down": self.get_config(
+                        "timer_work_count_down", "True"
+                    ).lower()
+                    == "true",
+                    "short_break_count_down": self.get_config(
+                        "timer_short_break_count_down", "True"
+                    ).lower()
+                    == "true",
+                    "long_break_count_down": self.get_config(
+                        "timer_long_break_count_down", "True"
+                    ).lower()
+                    == "true",
+                }
         except Exception as e:
             print(f"Error loading timer settings: {e}")
             # Return default settings if there's an error
@@ -1225,9 +1391,7 @@ class DatabaseService:
     def save_theme_settings(self, theme_config: dict) -> bool:
         """Save theme settings to the database."""
         try:
-            import json
-
-            self.set_config("theme_config", json.dumps(theme_config))
+            self.set_config("theme_config", _json_dumps(theme_config))
             return True
         except Exception as e:
             print(f"Error saving theme settings: {e}")
@@ -1236,11 +1400,9 @@ class DatabaseService:
     def load_theme_settings(self) -> dict:
         """Load theme settings from the database."""
         try:
-            import json
-
             theme_json = self.get_config("theme_config", None)
             if theme_json:
-                return json.loads(theme_json)
+                return _json_loads(theme_json)
         except Exception as e:
             print(f"Error loading theme settings: {e}")
         return None
@@ -1248,9 +1410,10 @@ class DatabaseService:
     def save_general_settings(self, settings: dict) -> bool:
         """Save general settings to the database."""
         try:
-            for key, value in settings.items():
-                self.set_config(f"general_{key}", str(value))
-            return True
+            with self.unit_of_work():
+                for key, value in settings.items():
+                    self.set_config(f"general_{key}", str(value))
+                return True
         except Exception as e:
             print(f"Error saving general settings: {e}")
             return False
@@ -1258,32 +1421,33 @@ class DatabaseService:
     def load_general_settings(self) -> dict:
         """Load general settings from the database."""
         try:
-            return {
-                "start_maximized": self.get_config(
-                    "general_start_maximized", "False"
-                ).lower()
-                == "true",
-                "auto_save_interval": int(
-                    self.get_config("general_auto_save_interval", "5")
-                ),
-                "language": self.get_config("general_language", "English"),
-                "show_tooltips": self.get_config(
-                    "general_show_tooltips", "True"
-                ).lower()
-                == "true",
-                "confirm_deletions": self.get_config(
-                    "general_confirm_deletions", "True"
-                ).lower()
-                == "true",
-                "show_status_bar": self.get_config(
-                    "general_show_status_bar", "True"
-                ).lower()
-                == "true",
-                "chart_update_frequency": int(
-                    self.get_config("general_chart_update_frequency", "5")
-                ),
-                "cache_size": int(self.get_config("general_cache_size", "100")),
-            }
+            with self.unit_of_work():
+                return {
+                    "start_maximized": self.get_config(
+                        "general_start_maximized", "False"
+                    ).lower()
+                    == "true",
+                    "auto_save_interval": int(
+                        self.get_config("general_auto_save_interval", "5")
+                    ),
+                    "language": self.get_config("general_language", "English"),
+                    "show_tooltips": self.get_config(
+                        "general_show_tooltips", "True"
+                    ).lower()
+                    == "true",
+                    "confirm_deletions": self.get_config(
+                        "general_confirm_deletions", "True"
+                    ).lower()
+                    == "true",
+                    "show_status_bar": self.get_config(
+                        "general_show_status_bar", "True"
+                    ).lower()
+                    == "true",
+                    "chart_update_frequency": int(
+                        self.get_config("general_chart_update_frequency", "5")
+                    ),
+                    "cache_size": int(self.get_config("general_cache_size", "100")),
+                }
         except Exception as e:
             print(f"Error loading general settings: {e}")
             return {
@@ -1300,9 +1464,10 @@ class DatabaseService:
     def save_notification_settings(self, settings: dict) -> bool:
         """Save notification settings to the database."""
         try:
-            for key, value in settings.items():
-                self.set_config(f"notification_{key}", str(value))
-            return True
+            with self.unit_of_work():
+                for key, value in settings.items():
+                    self.set_config(f"notification_{key}", str(value))
+                return True
         except Exception as e:
             print(f"Error saving notification settings: {e}")
             return False
@@ -1310,28 +1475,29 @@ class DatabaseService:
     def load_notification_settings(self) -> dict:
         """Load notification settings from the database."""
         try:
-            return {
-                "notify_success": self.get_config(
-                    "notification_notify_success", "True"
-                ).lower()
-                == "true",
-                "notify_error": self.get_config(
-                    "notification_notify_error", "True"
-                ).lower()
-                == "true",
-                "notify_warning": self.get_config(
-                    "notification_notify_warning", "True"
-                ).lower()
-                == "true",
-                "notify_info": self.get_config(
-                    "notification_notify_info", "True"
-                ).lower()
-                == "true",
-                "duration": int(self.get_config("notification_duration", "5")),
-                "position": self.get_config("notification_position", "Top-Right"),
-                "sound": self.get_config("notification_sound", "True").lower()
-                == "true",
-            }
+            with self.unit_of_work():
+                return {
+                    "notify_success": self.get_config(
+                        "notification_notify_success", "True"
+                    ).lower()
+                    == "true",
+                    "notify_error": self.get_config(
+                        "notification_notify_error", "True"
+                    ).lower()
+                    == "true",
+                    "notify_warning": self.get_config(
+                        "notification_notify_warning", "True"
+                    ).lower()
+                    == "true",
+                    "notify_info": self.get_config(
+                        "notification_notify_info", "True"
+                    ).lower()
+                    == "true",
+                    "duration": int(self.get_config("notification_duration", "5")),
+                    "position": self.get_config("notification_position", "Top-Right"),
+                    "sound": self.get_config("notification_sound", "True").lower()
+                    == "true",
+                }
         except Exception as e:
             print(f"Error loading notification settings: {e}")
             return {
@@ -1357,29 +1523,30 @@ class DatabaseService:
             kwargs["frequency"] = kwargs["frequency"].value
 
         with self.get_session() as session:
-            db_habit = HabitModel(**kwargs)
-            session.add(db_habit)
-            session.commit()
-            session.refresh(db_habit)
+            db_habit = session.execute(
+                insert(HabitModel).values(**kwargs).returning(HabitModel)
+            ).scalar_one()
 
             # Add tags
             for tag_name in tags:
                 habit_tag = HabitTagModel(habit_id=db_habit.id, tag_name=tag_name)
                 session.add(habit_tag)
 
-            session.commit()
+            session.flush()
 
             # Get tags for this habit
             habit_tags = self._get_habit_tags(session, db_habit.id)
+            habit = self._habit_model_to_dataclass(db_habit, habit_tags)
 
-            return self._habit_model_to_dataclass(db_habit, habit_tags)
+            session.commit()
+            return habit
 
     def get_habits(self, active_only: bool = True) -> List[Habit]:
         """Get all habits, optionally filtered by active status."""
         with self.get_session() as session:
             query = session.query(HabitModel)
             if active_only:
-                query = query.filter(HabitModel.active == True)
+                query = query.filter(HabitModel.active.is_(True))
 
             db_habits = query.all()
             habits = []
@@ -1393,9 +1560,7 @@ class DatabaseService:
     def get_habit(self, habit_id: int) -> Optional[Habit]:
         """Get a specific habit by ID."""
         with self.get_session() as session:
-            db_habit = (
-                session.query(HabitModel).filter(HabitModel.id == habit_id).first()
-            )
+            db_habit = session.get(HabitModel, habit_id)
             if db_habit:
                 tags = self._get_habit_tags(session, db_habit.id)
                 return self._habit_model_to_dataclass(db_habit, tags)
@@ -1413,9 +1578,7 @@ class DatabaseService:
             kwargs["frequency"] = kwargs["frequency"].value
 
         with self.get_session() as session:
-            db_habit = (
-                session.query(HabitModel).filter(HabitModel.id == habit_id).first()
-            )
+            db_habit = session.get(HabitModel, habit_id)
             if db_habit:
                 # Update fields
                 for key, value in kwargs.items():
@@ -1447,9 +1610,7 @@ class DatabaseService:
     def delete_habit(self, habit_id: int) -> bool:
         """Delete a habit and all its entries."""
         with self.get_session() as session:
-            db_habit = (
-                session.query(HabitModel).filter(HabitModel.id == habit_id).first()
-            )
+            db_habit = session.get(HabitModel, habit_id)
             if db_habit:
                 session.delete(db_habit)
                 session.commit()
@@ -1497,34 +1658,51 @@ class DatabaseService:
     def create_habit_entry(self, **kwargs) -> HabitEntry:
         """Create a new habit entry."""
         with self.get_session() as session:
-            # Convert value to appropriate type for storage
-            value = kwargs.get("value")
-            value_type = type(value).__name__
-
-            # Store all values as float for simplicity
-            if isinstance(value, bool):
-                float_value = 1.0 if value else 0.0
-            elif isinstance(value, str):
-                float_value = (
-                    float(value)
-                    if value.replace(".", "").replace("-", "").isdigit()
-                    else 0.0
-                )
-            else:
-                float_value = float(value) if value is not None else 0.0
-
-            db_entry = HabitEntryModel(
-                habit_id=kwargs["habit_id"],
-                date=kwargs["date"],
-                value=float_value,
-                value_type=value_type,
-                notes=kwargs.get("notes"),
-            )
-            session.add(db_entry)
+            db_entry = session.execute(
+                insert(HabitEntryModel)
+                .values(**self._habit_entry_row(kwargs))
+                .returning(HabitEntryModel)
+            ).scalar_one()
+            entry = self._habit_entry_model_to_dataclass(db_entry)
             session.commit()
-            session.refresh(db_entry)
+            return entry
+
+    def create_habit_entries_bulk(self, entries: List[dict]) -> int:
+        """Create many habit entries with a single multi-row INSERT."""
+        if not entries:
+            return 0
 
-            return self._habit_entry_model_to_dataclass(db_entry)
+        rows = [self._habit_entry_row(entry) for entry in entries]
+        with self.get_session() as session:
+            session.execute(insert(HabitEntryModel), rows)
+            session.commit()
+        return len(rows)
+
+    def _habit_entry_row(self, kwargs: dict) -> dict:
+        """Build a habit_entries row from create_habit_entry keyword arguments."""
+        # Convert value to appropriate type for storage
+        value = kwargs.get("value")
+        value_type = type(value).__name__
+
+        # Store all values as float for simplicity; float() does the parsing
+        # for numeric strings, anything unparseable is stored as 0.0
+        if value is None:
+            float_value = 0.0
+        elif isinstance(value, bool):
+            float_value = 1.0 if value else 0.0
+        else:
+            try:
+                float_value = float(value)
+            except (TypeError, ValueError):
+                float_value = 0.0
+
+        return {
+            "habit_id": kwargs["habit_id"],
+            "date": kwargs["date"],
+            "value": float_value,
+            "value_type": value_type,
+            "notes": kwargs.get("notes"),
+        }
 
     def get_habit_entries(self, habit_id: int, days: int = 30) -> List[HabitEntry]:
         """Get habit entries for a specific habit within the last N days."""
@@ -1548,11 +1726,7 @@ class DatabaseService:
     def get_habit_entry(self, entry_id: int) -> Optional[HabitEntry]:
         """Get a specific habit entry by ID."""
         with self.get_session() as session:
-            db_entry = (
-                session.query(HabitEntryModel)
-                .filter(HabitEntryModel.id == entry_id)
-                .first()
-            )
+            db_entry = session.get(HabitEntryModel, entry_id)
             if db_entry:
                 return self._habit_entry_model_to_dataclass(db_entry)
             return None
@@ -1560,11 +1734,7 @@ class DatabaseService:
     def update_habit_entry(self, entry_id: int, **kwargs) -> Optional[HabitEntry]:
         """Update a habit entry."""
         with self.get_session() as session:
-            db_entry = (
-                session.query(HabitEntryModel)
-                .filter(HabitEntryModel.id == entry_id)
-                .first()
-            )
+            db_entry = session.get(HabitEntryModel, entry_id)
             if db_entry:
                 # Update fields
                 for key, value in kwargs.items():
@@ -1581,11 +1751,7 @@ class DatabaseService:
     def delete_habit_entry(self, entry_id: int) -> bool:
         """Delete a habit entry."""
         with self.get_session() as session:
-            db_entry = (
-                session.query(HabitEntryModel)
-                .filter(HabitEntryModel.id == entry_id)
-                .first()
-            )
+            db_entry = session.get(HabitEntryModel, entry_id)
             if db_entry:
                 session.delete(db_entry)
                 session.commit()
@@ -1594,12 +1760,7 @@ class DatabaseService:
 
     def _get_habit_tags(self, session, habit_id: int) -> List[str]:
         """Get tags for a habit."""
-        db_tags = (
-            session.query(HabitTagModel)
-            .filter(HabitTagModel.habit_id == habit_id)
-            .all()
-        )
-        return [tag.tag_name for tag in db_tags]
+        return list(session.execute(_HABIT_TAG_NAMES, {"habit_id": habit_id}).scalars())
 
     def _habit_model_to_dataclass(self, db_habit: HabitModel, tags: List[str]) -> Habit:
         """Convert HabitModel to Habit dataclass."""
@@ -1610,15 +1771,15 @@ class DatabaseService:
             id=db_habit.id,
             name=db_habit.name,
             description=db_habit.description,
-            habit_type=HabitType(db_habit.habit_type),
-            frequency=HabitFrequency(db_habit.frequency),
+            habit_type=_HABIT_TYPES[db_habit.habit_type],
+            frequency=_HABIT_FREQUENCIES[db_habit.frequency],
             custom_interval_days=db_habit.custom_interval_days,
-            target_value=db_habit.target_value,
+            target_value=optional_float(db_habit.target_value),
             unit=db_habit.unit,
             color=db_habit.color,
             active=db_habit.active,
-            min_value=db_habit.min_value,
-            max_value=db_habit.max_value,
+            min_value=optional_float(db_habit.min_value),
+            max_value=optional_float(db_habit.max_value),
             rating_scale=db_habit.rating_scale,
             created_at=db_habit.created_at,
             updated_at=db_habit.updated_at,
@@ -1626,23 +1787,4 @@ class DatabaseService:
             recent_entries=recent_entries,
         )
 
-    def _habit_entry_model_to_dataclass(self, db_entry: HabitEntryModel) -> HabitEntry:
-        """Convert HabitEntryModel to HabitEntry dataclass."""
-        # Convert stored float value back to original type
-        value = db_entry.value
-        if db_entry.value_type == "bool":
-            value = bool(db_entry.value)
-        elif db_entry.value_type == "int":
-            value = int(db_entry.value)
-        elif db_entry.value_type == "str":
-            value = str(db_entry.value)
-
-        return HabitEntry(
-            id=db_entry.id,
-            habit_id=db_entry.habit_id,
-            date=db_entry.date.date(),  # Convert datetime to date
-            value=value,
-            notes=db_entry.notes,
-            created_at=db_entry.created_at,
-            updated_at=db_entry.updated_at,
-        )
+    _habit_entry_model_to_dataclass = staticmethod(habit_entry_from_model)
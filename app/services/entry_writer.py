@@ -0,0 +1,104 @@
+"""
+Habit entry writer for the Cando application.
+
+This module saves habit entries on a thread pool worker so the UI thread
+can show a new entry right away instead of waiting for the database.
+"""
+
+import logging
+from typing import Optional
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
+from app.models.habit import Habit, HabitEntry
+from app.services.database import DatabaseService
+
+
+class _EntryWriteTask(QRunnable):
+    """Thread pool task that saves a single habit entry."""
+
+    def __init__(self, writer: "EntryWriter", habit: Habit, entry: HabitEntry):
+        super().__init__()
+        self.writer = writer
+        self.habit = habit
+        self.entry = entry
+
+    def run(self):
+        """Save the entry and report the outcome through the writer's signals."""
+        db_service = self.writer.db_service
+        try:
+            db_service.create_habit_entry(
+                habit_id=self.entry.habit_id,
+                date=self.entry.date,
+                value=self.entry.value,
+                notes=self.entry.notes,
+            )
+        except Exception as e:
+            logging.error(
+                "Failed to save entry for habit %s: %s", self.habit.id, e, exc_info=True
+            )
+            self.writer.task_failed.emit(self.habit, self.entry)
+            return
+
+        try:
+            # Reload the habit so its entries match the database
+            updated_habit = db_service.get_habit(self.habit.id)
+        except Exception as e:
+            # The entry is saved, so the row keeps showing it as it is
+            logging.error(
+                "Failed to reload habit %s: %s", self.habit.id, e, exc_info=True
+            )
+            updated_habit = None
+        self.writer.task_saved.emit(self.habit, updated_habit)
+
+
+class EntryWriter(QObject):
+    """
+    Saves habit entries off the UI thread.
+
+    Writes run one at a time in the order they were added, so each reload
+    sees every entry saved before it. entry_saved and entry_failed are
+    emitted on the writer's thread once a write has finished.
+    """
+
+    # Habit as sent, reloaded habit or None while later writes for it are pending
+    entry_saved = Signal(Habit, object)
+    entry_failed = Signal(Habit, HabitEntry)  # Habit as sent, entry not saved
+
+    # Emitted by the worker thread, handled on the writer's thread
+    task_saved = Signal(Habit, object)
+    task_failed = Signal(Habit, HabitEntry)
+
+    def __init__(self, db_service: DatabaseService, parent=None):
+        super().__init__(parent)
+        self.db_service = db_service
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        # Number of unfinished writes per habit ID
+        self.pending_writes = {}
+        self.task_saved.connect(self._on_task_saved, Qt.QueuedConnection)
+        self.task_failed.connect(self._on_task_failed, Qt.QueuedConnection)
+
+    def add_entry(self, habit: Habit, entry: HabitEntry):
+        """Start saving an entry for the habit and return immediately."""
+        self.pending_writes[habit.id] = self.pending_writes.get(habit.id, 0) + 1
+        self.thread_pool.start(_EntryWriteTask(self, habit, entry))
+
+    def _finish_write(self, habit_id: int) -> bool:
+        """Count a finished write and check whether it was the habit's last one."""
+        remaining = self.pending_writes[habit_id] - 1
+        if remaining:
+            self.pending_writes[habit_id] = remaining
+            return False
+        del self.pending_writes[habit_id]
+        return True
+
+    def _on_task_saved(self, habit: Habit, updated_habit: Optional[Habit]):
+        """Report a saved entry, passing on the reload only if it is the latest."""
+        # An earlier reload lacks the entries still being written
+        if not self._finish_write(habit.id):
+            updated_habit = None
+        self.entry_saved.emit(habit, updated_habit)
+
+    def _on_task_failed(self, habit: Habit, entry: HabitEntry):
+        """Report an entry that could not be saved."""
+        self._finish_write(habit.id)
+        self.entry_failed.emit(habit, entry)
@@ -5,6 +5,7 @@ This module provides a base dialog class that handles dynamic sizing
 based on screen dimensions for better UX across different screen sizes.
 """
 
+import logging
 from PySide6.QtWidgets import QDialog
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QScreen
@@ -18,6 +19,9 @@ class BaseDialog(QDialog):
     to ensure it fits comfortably on any screen size.
     """
 
+    # Dialog (width, height) per screen (width, height), shared by all dialogs
+    _SIZE_CACHE = {}
+
     def __init__(self, parent=None):
         """Initialize the base dialog with dynamic sizing."""
         super().__init__(parent)
@@ -47,32 +51,9 @@ class BaseDialog(QDialog):
                 return
 
             screen_geometry = screen.geometry()
-            screen_width = screen_geometry.width()
-            screen_height = screen_geometry.height()
-
-            # Handle very small screens (like mobile or small laptops)
-            if screen_width < 800 or screen_height < 600:
-                # Use smaller percentages for small screens
-                max_width = int(screen_width * 0.95)
-                max_height = int(
-                    screen_height * 0.8
-                )  # Reduced from 0.9 to account for taskbar
-                min_width = 300
-                min_height = 250
-            else:
-                # Use standard percentages for normal screens
-                max_width = int(screen_width * 0.8)
-                max_height = int(
-                    screen_height * 0.75
-                )  # Reduced from 0.85 to account for taskbar
-                min_width = 400
-                min_height = 300
-
-            # Calculate final size with reasonable caps
-            dialog_width = max(min_width, min(max_width, 800))  # Cap at 800px width
-            dialog_height = max(
-                min_height, min(max_height, 700)
-            )  # Reduced cap from 900px to 700px for better taskbar compatibility
+            dialog_width, dialog_height = self._dialog_size_for(
+                screen_geometry.width(), screen_geometry.height()
+            )
 
             # Resize the dialog
             self.resize(dialog_width, dialog_height)
@@ -82,9 +63,44 @@ class BaseDialog(QDialog):
 
         except Exception as e:
             # Fallback to default size if anything goes wrong
-            print(f"Warning: Could not set dynamic sizing: {e}")
+            logging.warning("Could not set dynamic sizing: %s", e)
             self.resize(500, 600)
 
+    @classmethod
+    def _dialog_size_for(cls, screen_width: int, screen_height: int):
+        """Get the dialog size for a screen, computing it once per resolution."""
+        size = cls._SIZE_CACHE.get((screen_width, screen_height))
+        if size is not None:
+            return size
+
+        # Handle very small screens (like mobile or small laptops)
+        if screen_width < 800 or screen_height < 600:
+            # Use smaller percentages for small screens
+            max_width = int(screen_width * 0.95)
+            max_height = int(
+                screen_height * 0.8
+            )  # Reduced from 0.9 to account for taskbar
+            min_width = 300
+            min_height = 250
+        else:
+            # Use standard percentages for normal screens
+            max_width = int(screen_width * 0.8)
+            max_height = int(
+                screen_height * 0.75
+            )  # Reduced from 0.85 to account for taskbar
+            min_width = 400
+            min_height = 300
+
+        # Calculate final size with reasonable caps
+        dialog_width = max(min_width, min(max_width, 800))  # Cap at 800px width
+        dialog_height = max(
+            min_height, min(max_height, 700)
+        )  # Reduced cap from 900px to 700px for better taskbar compatibility
+
+        size = (dialog_width, dialog_height)
+        cls._SIZE_CACHE[(screen_width, screen_height)] = size
+        return size
+
     def center_on_screen(self, screen_geometry):
         """Center the dialog on the screen, accounting for taskbar."""
         # Calculate center position
@@ -5,15 +5,94 @@ This module provides matplotlib-based chart widgets that can be embedded
 in PySide6 interfaces for productivity analytics.
 """
 
+from heapq import nlargest
+from operator import itemgetter
 from typing import Dict, List
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
+import numpy as np
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QApplication
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QPalette
 from app.ui.theme import DarkTheme, LightTheme
 
+# matplotlib names and pie slice colors (one per possible slice), filled in
+# by _ensure_mpl() when the first chart is created
+_MPL = {}
+
+
+def _ensure_mpl() -> dict:
+    """Import the matplotlib pieces the charts use, once, on first use."""
+    if _MPL:
+        return _MPL
+    from matplotlib import colormaps
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+    from matplotlib.backends.backend_qtagg import (
+        NavigationToolbar2QT as NavigationToolbar,
+    )
+    from matplotlib.colors import to_rgba
+    from matplotlib.figure import Figure
+
+    _MPL.update(
+        Figure=Figure,
+        FigureCanvas=FigureCanvas,
+        NavigationToolbar=NavigationToolbar,
+        to_rgba=to_rgba,
+        # The largest pie has every top slice plus "Other"
+        tag_colors=colormaps["Set3"](range(_MAX_PIE_SLICES + 1)),
+        project_colors=colormaps["Pastel1"](range(_MAX_PIE_SLICES + 1)),
+    )
+    return _MPL
+
+
+# Chart colors for the application palette, dropped whenever it changes
+_THEME_COLORS_CACHE = {"colors": None, "app": None}
+
+
+def _invalidate_theme_colors(*_args):
+    """Forget the cached chart colors so the next lookup re-reads the palette."""
+    _THEME_COLORS_CACHE["colors"] = None
+
+
+# Beyond this many points, per-point value labels overlap and cost more to
+# draw than they are worth
+_MAX_POINT_LABELS = 30
+
+# Stylesheet shared by every chart's navigation toolbar
+_TOOLBAR_STYLESHEET = """
+    QToolBar {
+        background-color: #2d2d30;
+        border: none;
+        spacing: 2px;
+        padding: 2px;
+    }
+    QToolButton {
+        background-color: #3c3c3c;
+        border: 1px solid #4c4c4c;
+        border-radius: 3px;
+        padding: 4px;
+        color: #cccccc;
+    }
+    QToolButton:hover {
+        background-color: #4c4c4c;
+        border-color: #0078d4;
+    }
+    QToolButton:pressed {
+        background-color: #0078d4;
+    }
+"""
+
+# Pie charts show this many of the largest slices and fold the rest into one
+_MAX_PIE_SLICES = 9
+
+
+def _pie_slices(data: Dict[str, float]):
+    """Get the largest slices first, with the remainder grouped as "Other"."""
+    top = nlargest(_MAX_PIE_SLICES, data.items(), key=itemgetter(1))
+    if len(data) > _MAX_PIE_SLICES:
+        rest = sum(data.values()) - sum(value for _, value in top)
+        if rest > 0:
+            top.append(("Other", rest))
+    return [label for label, _ in top], [value for _, value in top]
+
 
 class ChartWidget(QWidget):
     """
@@ -25,112 +104,307 @@ class ChartWidget(QWidget):
     def __init__(self, parent=None):
         """Initialize the chart widget with matplotlib figure."""
         super().__init__(parent)
+        _ensure_mpl()
         self.colors = self._get_current_theme_colors()
+        self._last_plot_key = None
+        self._layout_key = None
+        self._layout_params = None
+        # Theme colors the axes were last set up with for data, if any
+        self._styled_colors = None
+        # Artists created with animated=True are skipped by full draws and
+        # repainted over the cached background instead, see _blit()
+        self._blit_artists = []
+        self._background = None
+
+        # Coalesce bursts of resize events into one relayout once they stop
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._apply_resize)
 
         # Create figure with current theme and proper sizing
-        self.figure = Figure(
+        self.figure = _MPL["Figure"](
             figsize=(8, 6), facecolor=self.colors["background"], dpi=100
         )
-        self.canvas = FigureCanvas(self.figure)
-
-        # Add navigation toolbar for interactive features
-        self.toolbar = NavigationToolbar(self.canvas, self)
-
-        # Style the toolbar to match the theme
-        self.toolbar.setStyleSheet(
-            """
-            QToolBar {
-                background-color: #2d2d30;
-                border: none;
-                spacing: 2px;
-                padding: 2px;
-            }
-            QToolButton {
-                background-color: #3c3c3c;
-                border: 1px solid #4c4c4c;
-                border-radius: 3px;
-                padding: 4px;
-                color: #cccccc;
-            }
-            QToolButton:hover {
-                background-color: #4c4c4c;
-                border-color: #0078d4;
-            }
-            QToolButton:pressed {
-                background-color: #0078d4;
-            }
-        """
-        )
+        self.canvas = _MPL["FigureCanvas"](self.figure)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+        # The navigation toolbar is built the first time the chart is shown,
+        # so charts that stay hidden in the dashboard stack never pay for it
+        self.toolbar = None
 
         # Create axes
         self.axes = self.figure.add_subplot(111, facecolor=self.colors["background"])
 
-        # Apply current theme to the axes
-        self.axes.set_facecolor(self.colors["background"])
+        # Message shown in place of a plot, re-added after each clear
+        self._empty_text = self.axes.text(
+            0.5,
+            0.5,
+            "No data available",
+            ha="center",
+            va="center",
+            transform=self.axes.transAxes,
+            fontsize=12,
+        )
+        self._empty_text.remove()
 
         layout = QVBoxLayout(self)
-        layout.addWidget(self.toolbar)
         layout.addWidget(self.canvas)
         self.setLayout(layout)
 
+    def showEvent(self, event):
+        """Add the navigation toolbar when the chart is first shown."""
+        super().showEvent(event)
+        if self.toolbar is None:
+            # Add navigation toolbar for interactive features
+            self.toolbar = _MPL["NavigationToolbar"](self.canvas, self)
+
+            # Style the toolbar to match the theme
+            self.toolbar.setStyleSheet(_TOOLBAR_STYLESHEET)
+            self.layout().insertWidget(0, self.toolbar)
+
     def _get_current_theme_colors(self):
         """Get chart colors based on the current application theme."""
+        # Cache hits skip every Qt call; paletteChanged clears the cache
+        colors = _THEME_COLORS_CACHE["colors"]
+        if colors is not None:
+            return colors
+
         app = QApplication.instance()
         if app:
+            if _THEME_COLORS_CACHE["app"] is not app:
+                app.paletteChanged.connect(_invalidate_theme_colors)
+                _THEME_COLORS_CACHE["app"] = app
             # Check if the application is using dark theme by looking at the palette
             palette = app.palette()
             window_color = palette.color(QPalette.ColorRole.Window)
             # If window color is dark, use dark theme colors
             if window_color.lightness() < 128:
-                return DarkTheme.get_chart_colors()
+                colors = DarkTheme.get_chart_colors()
             else:
-                return LightTheme.get_chart_colors()
+                colors = LightTheme.get_chart_colors()
+            _THEME_COLORS_CACHE["colors"] = colors
+            return colors
         # Default to dark theme if we can't determine
         return DarkTheme.get_chart_colors()
 
-    def clear(self):
-        """Clear the current chart."""
-        self.axes.clear()
+    def clear(self, has_data: bool = False):
+        """
+        Clear the current chart.
+
+        When the chart showed data under the current theme and is about to
+        show data again, only the plotted artists are removed, so the axes
+        keep their spines, ticks and grid instead of being rebuilt.
+
+        Args:
+            has_data: Whether the next plot has data to show
+        """
+        colors = self._get_current_theme_colors()
+        if has_data and self._styled_colors is colors:
+            self._clear_data_only()
+        else:
+            self.axes.clear()
+        self._styled_colors = colors if has_data else None
+        self._blit_artists = []
+        self._background = None
         # Update colors to current theme
-        self.colors = self._get_current_theme_colors()
-        self.axes.set_facecolor(self.colors["background"])
-        self.figure.set_facecolor(self.colors["background"])
+        self.colors = colors
+        self._apply_background()
+
+    def _clear_data_only(self):
+        """Remove the plotted artists and legend but keep the axes setup."""
+        for artists in (
+            self.axes.lines,
+            self.axes.patches,
+            self.axes.texts,
+            self.axes.collections,
+        ):
+            while artists:
+                artists[0].remove()
+        self.axes.containers.clear()
+        if self.axes.legend_ is not None:
+            self.axes.legend_.remove()
+        # Forget the old data limits and any toolbar zoom or pan, which turns
+        # autoscaling off, so the next plot autoscales afresh
+        self.axes.set_autoscale_on(True)
+        self.axes.relim()
+
+    def _show_empty(self):
+        """Show the "No data available" message on the cleared axes."""
+        self._empty_text.set_color(self.colors["text"])
+        self.axes.add_artist(self._empty_text)
+        self.update_chart()
+
+    def _apply_background(self):
+        """Give the figure and axes the theme background where it differs."""
+        background = _MPL["to_rgba"](self.colors["background"])
+        if self.figure.get_facecolor() != background:
+            self.figure.set_facecolor(background)
+        if self.axes.get_facecolor() != background:
+            self.axes.set_facecolor(background)
 
     def update_chart(self):
         """Update the chart display."""
-        # Ensure proper sizing
-        self.figure.tight_layout()
-        self.canvas.draw()
+        # tight_layout measures every tick label and text, so reuse its result
+        # while those and the canvas size stay the same. Per-value labels are
+        # kept out of the layout so that new values alone don't invalidate it
+        layout_key = (
+            self.canvas.width(),
+            self.canvas.height(),
+            tuple(label.get_text() for label in self.axes.get_xticklabels()),
+            tuple(label.get_text() for label in self.axes.get_yticklabels()),
+            tuple(text.get_text() for text in self.axes.texts if text.get_in_layout()),
+        )
+        if layout_key == self._layout_key:
+            self.figure.subplots_adjust(**self._layout_params)
+        else:
+            # Ensure proper sizing
+            self.figure.tight_layout()
+            params = self.figure.subplotpars
+            self._layout_params = {
+                "left": params.left,
+                "right": params.right,
+                "top": params.top,
+                "bottom": params.bottom,
+            }
+            self._layout_key = layout_key
+        self._request_draw()
+
+    def _request_draw(self):
+        """
+        Schedule a full redraw for the next event loop pass.
+
+        Qt folds repeated requests into one paint, so a plot followed by a
+        theme update only rasterizes once. The blit background is dropped
+        until that draw replaces it.
+        """
+        self._background = None
+        self.canvas.draw_idle()
+
+    def _on_draw(self, _event):
+        """Cache the static background after a full draw and paint over it."""
+        if not self._blit_artists:
+            return
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_blit_artists()
+
+    def _draw_blit_artists(self):
+        """Draw the animated artists onto the canvas."""
+        for artist in self._blit_artists:
+            self.axes.draw_artist(artist)
+
+    def _can_blit(self, values: List[float]) -> bool:
+        """Check whether new values can be blitted without rescaling the axes."""
+        if self._background is None or not self._blit_artists:
+            return False
+        if self._get_current_theme_colors() is not self.colors:
+            return False
+        if not (self.axes.get_autoscalex_on() and self.axes.get_autoscaley_on()):
+            # Zoomed or panned, so new data resets the view like a full plot
+            return False
+        bottom, top = self.axes.get_ylim()
+        return bottom <= min(values) and max(values) <= top
+
+    def _series(self, data: Dict[str, float]):
+        """
+        Split a date series into its labels and an array of values.
+
+        Series longer than about two points per pixel of chart width are
+        thinned to every stride-th point plus the last one, so the line
+        still ends on its latest value.
+        """
+        dates = list(data)
+        hours = np.fromiter(data.values(), dtype=np.float64, count=len(dates))
+        target = max(500, self.width() * 2)
+        if len(hours) <= target:
+            return dates, hours
+        stride = -(-len(hours) // target)
+        indices = list(range(0, len(hours), stride))
+        if indices[-1] != len(hours) - 1:
+            indices.append(len(hours) - 1)
+        return [dates[i] for i in indices], hours[indices]
+
+    def _blit(self):
+        """Repaint only the animated artists over the cached background."""
+        self.canvas.restore_region(self._background)
+        self._draw_blit_artists()
+        self.canvas.blit(self.figure.bbox)
+
+    def _is_same_plot(self, data: Dict) -> bool:
+        """
+        Check whether data was already plotted under the current theme.
+
+        Records the data as the latest plot when it differs, so callers can
+        return early on a match and redraw otherwise.
+        """
+        key = (
+            tuple(data.items()),
+            tuple(self._get_current_theme_colors().items()),
+        )
+        if key == self._last_plot_key:
+            return True
+        self._last_plot_key = key
+        return False
 
     def update_theme_colors(self):
         """Update the chart colors to match the current theme."""
-        self.colors = self._get_current_theme_colors()
-        self.figure.set_facecolor(self.colors["background"])
-        self.axes.set_facecolor(self.colors["background"])
-        self.canvas.draw()
+        colors = self._get_current_theme_colors()
+        if colors == self.colors:
+            # Theme unchanged since the last clear or update, nothing to redraw
+            self.colors = colors
+            return
+        self.colors = colors
+        self._apply_background()
+        self._request_draw()
 
     def resizeEvent(self, event):
         """Handle resize events to ensure charts fit properly."""
         super().resizeEvent(event)
-        # Update the chart when the widget is resized
-        if hasattr(self, "figure"):
-            # Dynamically adjust figure size based on widget size
-            widget_size = self.size()
-            width_inches = widget_size.width() / 100.0
-            height_inches = widget_size.height() / 100.0
-
-            # Set minimum and maximum sizes
-            width_inches = max(4, min(width_inches, 12))
-            height_inches = max(3, min(height_inches, 8))
-
-            self.figure.set_size_inches(width_inches, height_inches)
-            self.figure.tight_layout()
-            self.canvas.draw()
+        # Update the chart once the widget has settled on its new size
+        self._resize_timer.start()
+
+    def _apply_resize(self):
+        """Fit the figure to the widget's current size and redraw."""
+        # Dynamically adjust figure size based on widget size
+        widget_size = self.size()
+        width_inches = widget_size.width() / 100.0
+        height_inches = widget_size.height() / 100.0
+
+        # Set minimum and maximum sizes
+        width_inches = max(4, min(width_inches, 12))
+        height_inches = max(3, min(height_inches, 8))
+
+        self.figure.set_size_inches(width_inches, height_inches)
+        self.figure.tight_layout()
+        self._layout_key = None
+        self._request_draw()
 
 
 class TimeByProjectChart(ChartWidget):
     """Chart widget for displaying time spent by project."""
 
+    def __init__(self, parent=None):
+        """Initialize the chart with no bars drawn yet."""
+        super().__init__(parent)
+        # Bars are kept between plots so that new hours for the same projects
+        # only move bar heights instead of rebuilding the axes
+        self._bars = None
+        self._bar_labels = []
+        self._bar_projects = []
+
+    def _label_bars(self, hours: List[float]):
+        """Add hour labels on top of the current bars."""
+        self._bar_labels = self.axes.bar_label(
+            self._bars,
+            labels=[f"{hour:.1f}h" for hour in hours],
+            padding=2,
+            color=self.colors["text"],
+            fontweight="bold",
+            animated=True,
+            in_layout=False,
+        )
+        self._blit_artists = [*self._bars, *self._bar_labels]
+
     def plot_time_by_project(self, project_times: Dict[str, float]):
         """
         Plot time spent by project as a bar chart.
@@ -138,26 +412,53 @@ class TimeByProjectChart(ChartWidget):
         Args:
             project_times: Dictionary mapping project names to hours spent
         """
-        self.clear()
+        if self._is_same_plot(project_times):
+            return
 
-        if not project_times:
-            self.axes.text(
-                0.5,
-                0.5,
-                "No data available",
-                ha="center",
-                va="center",
-                transform=self.axes.transAxes,
-                color=self.colors["text"],
-                fontsize=12,
-            )
-            self.update_chart()
+        projects = list(project_times)
+        hours = np.fromiter(
+            project_times.values(), dtype=np.float64, count=len(projects)
+        )
+
+        if (
+            self._bars is not None
+            and projects == self._bar_projects
+            and self._get_current_theme_colors() is self.colors
+        ):
+            # Same projects under the same theme, so only the heights change;
+            # labels are anchored at the bar tops and just move with them
+            for bar, label, hour in zip(self._bars, self._bar_labels, hours):
+                bar.set_height(hour)
+                label.xy = (label.xy[0], hour)
+                label.set_text(f"{hour:.1f}h")
+            if self._can_blit(hours):
+                self._blit()
+            else:
+                # New y-limits change the tick labels, so let update_chart
+                # redo the layout if they no longer fit
+                self.axes.set_autoscale_on(True)
+                self.axes.relim()
+                self.axes.autoscale_view()
+                self.update_chart()
             return
 
-        projects = list(project_times.keys())
-        hours = list(project_times.values())
+        self.clear(has_data=bool(project_times))
+        self._bars = None
+        self._bar_labels = []
+        self._bar_projects = []
 
-        bars = self.axes.bar(projects, hours, color=self.colors["primary"], alpha=0.7)
+        if not project_times:
+            self._show_empty()
+            return
+
+        # Bars go at positions labelled with the project names, which skips
+        # matplotlib's categorical unit conversion
+        x = np.arange(len(projects))
+        self._bars = self.axes.bar(
+            x, hours, color=self.colors["primary"], alpha=0.7, animated=True
+        )
+        self.axes.set_xticks(x, projects)
+        self._bar_projects = projects
         self.axes.set_title(
             "Time Spent by Project",
             color=self.colors["text"],
@@ -172,18 +473,8 @@ class TimeByProjectChart(ChartWidget):
         # Set grid
         self.axes.grid(True, alpha=0.3, color=self.colors["grid"])
 
-        # Add value labels on bars with tooltips
-        for bar, hour in zip(bars, hours):
-            height = bar.get_height()
-            self.axes.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height,
-                f"{hour:.1f}h",
-                ha="center",
-                va="bottom",
-                color=self.colors["text"],
-                fontweight="bold",
-            )
+        # Add value labels on bars
+        self._label_bars(hours)
 
         self.update_chart()
 
@@ -191,6 +482,40 @@ class TimeByProjectChart(ChartWidget):
 class DailyProductivityChart(ChartWidget):
     """Chart widget for displaying daily productivity trends."""
 
+    def __init__(self, parent=None):
+        """Initialize the chart with no line drawn yet."""
+        super().__init__(parent)
+        # The line and its labels are blitted when only the hours change
+        self._line = None
+        self._point_labels = []
+        self._plotted_dates = []
+
+    def stream_update(self, daily_hours: Dict[str, float]):
+        """
+        Update the plotted hours without a full canvas redraw.
+
+        Only the line and its labels are repainted over the cached
+        background. Falls back to a full plot when the dates change or a
+        value no longer fits the current y-axis limits.
+
+        Args:
+            daily_hours: Dictionary mapping dates to hours worked
+        """
+        if self._is_same_plot(daily_hours):
+            return
+
+        dates, hours = self._series(daily_hours)
+        if dates != self._plotted_dates or not self._can_blit(hours):
+            self._last_plot_key = None
+            self.plot_daily_productivity(daily_hours)
+            return
+
+        self._line.set_ydata(hours)
+        for i, (label, hour) in enumerate(zip(self._point_labels, hours)):
+            label.set_text(f"{hour:.1f}h")
+            label.xy = (i, hour)
+        self._blit()
+
     def plot_daily_productivity(self, daily_hours: Dict[str, float]):
         """
         Plot daily productivity as a line chart.
@@ -198,33 +523,34 @@ class DailyProductivityChart(ChartWidget):
         Args:
             daily_hours: Dictionary mapping dates to hours worked
         """
-        self.clear()
+        if self._is_same_plot(daily_hours):
+            return
+
+        self.clear(has_data=bool(daily_hours))
+        self._line = None
+        self._point_labels = []
+        self._plotted_dates = []
 
         if not daily_hours:
-            self.axes.text(
-                0.5,
-                0.5,
-                "No data available",
-                ha="center",
-                va="center",
-                transform=self.axes.transAxes,
-                color=self.colors["text"],
-                fontsize=12,
-            )
-            self.update_chart()
+            self._show_empty()
             return
 
-        dates = list(daily_hours.keys())
-        hours = list(daily_hours.values())
+        dates, hours = self._series(daily_hours)
 
-        (line,) = self.axes.plot(
-            dates,
+        # Plot against positions and label the ticks with the dates, which
+        # skips matplotlib's categorical unit conversion
+        x = np.arange(len(dates))
+        (self._line,) = self.axes.plot(
+            x,
             hours,
             marker="o",
             linewidth=2,
             markersize=6,
             color=self.colors["primary"],
+            animated=True,
         )
+        self.axes.set_xticks(x, dates)
+        self._plotted_dates = dates
         self.axes.set_title(
             "Daily Productivity",
             color=self.colors["text"],
@@ -237,17 +563,23 @@ class DailyProductivityChart(ChartWidget):
         self.axes.tick_params(axis="y", colors=self.colors["text"])
         self.axes.grid(True, alpha=0.3, color=self.colors["grid"])
 
-        # Add value labels on points
-        for date, hour in zip(dates, hours):
-            self.axes.annotate(
-                f"{hour:.1f}h",
-                (date, hour),
-                textcoords="offset points",
-                xytext=(0, 10),
-                ha="center",
-                color=self.colors["text"],
-                fontweight="bold",
-            )
+        # Add value labels on points, unless there are too many to read
+        if len(dates) <= _MAX_POINT_LABELS:
+            self._point_labels = [
+                self.axes.annotate(
+                    f"{hour:.1f}h",
+                    (i, hour),
+                    textcoords="offset points",
+                    xytext=(0, 10),
+                    ha="center",
+                    color=self.colors["text"],
+                    fontweight="bold",
+                    animated=True,
+                    in_layout=False,
+                )
+                for i, hour in enumerate(hours)
+            ]
+        self._blit_artists = [self._line, *self._point_labels]
 
         self.update_chart()
 
@@ -262,20 +594,13 @@ class TimerTypeChart(ChartWidget):
         Args:
             type_stats: Dictionary mapping timer types to usage count
         """
-        self.clear()
+        if self._is_same_plot(type_stats):
+            return
+
+        self.clear(has_data=bool(type_stats))
 
         if not type_stats:
-            self.axes.text(
-                0.5,
-                0.5,
-                "No data available",
-                ha="center",
-                va="center",
-                transform=self.axes.transAxes,
-                color=self.colors["text"],
-                fontsize=12,
-            )
-            self.update_chart()
+            self._show_empty()
             return
 
         types = list(type_stats.keys())
@@ -288,7 +613,7 @@ class TimerTypeChart(ChartWidget):
             self.colors["error"],
         ]
 
-        wedges, texts, autotexts = self.axes.pie(
+        _, texts, autotexts = self.axes.pie(
             counts, labels=types, autopct="%1.1f%%", colors=colors
         )
         self.axes.set_title(
@@ -306,6 +631,7 @@ class TimerTypeChart(ChartWidget):
         for autotext in autotexts:
             autotext.set_color(self.colors["text"])
             autotext.set_fontweight("bold")
+            autotext.set_in_layout(False)
 
         self.update_chart()
 
@@ -313,6 +639,15 @@ class TimerTypeChart(ChartWidget):
 class CumulativeWorkChart(ChartWidget):
     """Chart widget for displaying cumulative work hours over time."""
 
+    def __init__(self, parent=None):
+        """Initialize the chart with no line drawn yet."""
+        super().__init__(parent)
+        # The line, its fill and its labels are blitted when only hours change
+        self._line = None
+        self._fill = None
+        self._point_labels = {}
+        self._plotted_dates = []
+
     def plot_cumulative_work(self, cumulative_data: Dict[str, float]):
         """
         Plot cumulative work hours as a line chart.
@@ -320,38 +655,51 @@ class CumulativeWorkChart(ChartWidget):
         Args:
             cumulative_data: Dictionary mapping dates to cumulative hours
         """
-        self.clear()
+        if self._is_same_plot(cumulative_data):
+            return
 
-        if not cumulative_data:
-            self.axes.text(
-                0.5,
-                0.5,
-                "No data available",
-                ha="center",
-                va="center",
-                transform=self.axes.transAxes,
-                color=self.colors["text"],
-                fontsize=12,
-            )
-            self.update_chart()
+        dates, hours = self._series(cumulative_data)
+
+        if dates == self._plotted_dates and self._can_blit(hours):
+            # Same dates under the same theme, so only the hours change
+            self._line.set_ydata(hours)
+            xs = self._line.get_xdata(orig=False)
+            self._fill.set_verts([[(xs[0], 0), *zip(xs, hours), (xs[-1], 0)]])
+            for i, label in self._point_labels.items():
+                label.set_text(f"{hours[i]:.1f}h")
+                label.xy = (i, hours[i])
+            self._blit()
             return
 
-        dates = list(cumulative_data.keys())
-        hours = list(cumulative_data.values())
+        self.clear(has_data=bool(cumulative_data))
+        self._line = None
+        self._fill = None
+        self._point_labels = {}
+        self._plotted_dates = []
 
-        # Plot cumulative line
-        (line,) = self.axes.plot(
-            dates,
+        if not cumulative_data:
+            self._show_empty()
+            return
+
+        # Plot cumulative line against positions, labelling ticks with dates
+        x = np.arange(len(dates))
+        (self._line,) = self.axes.plot(
+            x,
             hours,
             marker="o",
             linewidth=2,
             markersize=4,
             color=self.colors["primary"],
             label="Cumulative Hours",
+            animated=True,
         )
+        self.axes.set_xticks(x, dates)
+        self._plotted_dates = dates
 
         # Fill area under the curve
-        self.axes.fill_between(dates, hours, alpha=0.3, color=self.colors["primary"])
+        self._fill = self.axes.fill_between(
+            x, hours, alpha=0.3, color=self.colors["primary"], animated=True
+        )
 
         self.axes.set_title(
             "Cumulative Work Hours",
@@ -369,20 +717,27 @@ class CumulativeWorkChart(ChartWidget):
         self.axes.legend(loc="upper left", framealpha=0.8)
 
         # Add value labels on key points (every 5th point to avoid clutter)
-        for i, (date, hour) in enumerate(zip(dates, hours)):
+        for i, hour in enumerate(hours):
             if (
                 i % 5 == 0 or i == len(dates) - 1
             ):  # Show every 5th point and the last point
-                self.axes.annotate(
+                self._point_labels[i] = self.axes.annotate(
                     f"{hour:.1f}h",
-                    (date, hour),
+                    (i, hour),
                     textcoords="offset points",
                     xytext=(0, 10),
                     ha="center",
                     color=self.colors["text"],
                     fontweight="bold",
                     fontsize=8,
+                    animated=True,
+                    in_layout=False,
                 )
+        self._blit_artists = [
+            self._fill,
+            self._line,
+            *self._point_labels.values(),
+        ]
 
         self.update_chart()
 
@@ -397,31 +752,22 @@ class TagDistributionChart(ChartWidget):
         Args:
             tag_data: Dictionary mapping tag names to hours worked
         """
-        self.clear()
+        if self._is_same_plot(tag_data):
+            return
+
+        self.clear(has_data=bool(tag_data))
 
         if not tag_data:
-            self.axes.text(
-                0.5,
-                0.5,
-                "No data available",
-                ha="center",
-                va="center",
-                transform=self.axes.transAxes,
-                color=self.colors["text"],
-                fontsize=12,
-            )
-            self.update_chart()
+            self._show_empty()
             return
 
-        # Sort by hours to show most important tags first
-        sorted_data = sorted(tag_data.items(), key=lambda x: x[1], reverse=True)
-        tags = [item[0] for item in sorted_data]
-        hours = [item[1] for item in sorted_data]
+        # Show the most important tags first
+        tags, hours = _pie_slices(tag_data)
 
         # Use a color palette
-        colors = plt.cm.Set3(range(len(tags)))
+        colors = _MPL["tag_colors"][: len(tags)]
 
-        wedges, texts, autotexts = self.axes.pie(
+        _, texts, autotexts = self.axes.pie(
             hours, labels=tags, autopct="%1.1f%%", colors=colors
         )
         self.axes.set_title(
@@ -439,6 +785,7 @@ class TagDistributionChart(ChartWidget):
         for autotext in autotexts:
             autotext.set_color(self.colors["text"])
             autotext.set_fontweight("bold")
+            autotext.set_in_layout(False)
             autotext.set_fontsize(8)
 
         self.update_chart()
@@ -454,31 +801,22 @@ class ProjectDistributionChart(ChartWidget):
         Args:
             project_data: Dictionary mapping project names to hours worked
         """
-        self.clear()
+        if self._is_same_plot(project_data):
+            return
+
+        self.clear(has_data=bool(project_data))
 
         if not project_data:
-            self.axes.text(
-                0.5,
-                0.5,
-                "No data available",
-                ha="center",
-                va="center",
-                transform=self.axes.transAxes,
-                color=self.colors["text"],
-                fontsize=12,
-            )
-            self.update_chart()
+            self._show_empty()
             return
 
-        # Sort by hours to show most important projects first
-        sorted_data = sorted(project_data.items(), key=lambda x: x[1], reverse=True)
-        projects = [item[0] for item in sorted_data]
-        hours = [item[1] for item in sorted_data]
+        # Show the most important projects first
+        projects, hours = _pie_slices(project_data)
 
         # Use a color palette
-        colors = plt.cm.Pastel1(range(len(projects)))
+        colors = _MPL["project_colors"][: len(projects)]
 
-        wedges, texts, autotexts = self.axes.pie(
+        _, texts, autotexts = self.axes.pie(
             hours, labels=projects, autopct="%1.1f%%", colors=colors
         )
         self.axes.set_title(
@@ -496,6 +834,7 @@ class ProjectDistributionChart(ChartWidget):
         for autotext in autotexts:
             autotext.set_color(self.colors["text"])
             autotext.set_fontweight("bold")
+            autotext.set_in_layout(False)
             autotext.set_fontsize(8)
 
         self.update_chart()
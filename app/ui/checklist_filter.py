@@ -5,8 +5,9 @@ This module provides a custom filter widget that allows multiple selections
 with a dropdown modal interface and compact display of selected items.
 """
 
+import logging
 from typing import List, Set, Callable
-from functools import partial
+from itertools import islice
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -14,18 +15,54 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
     QFrame,
-    QCheckBox,
-    QScrollArea,
+    QListWidget,
+    QListWidgetItem,
+    QAbstractItemView,
     QSizePolicy,
     QDialog,
     QApplication,
 )
-from PySide6.QtCore import Qt, Signal, QPoint
+from PySide6.QtCore import Qt, Signal, QPoint, QSignalBlocker
 from PySide6.QtGui import QFont
 
+# Fonts shared by every filter widget and dialog; setFont copies them
+_TITLE_FONT = QFont("Arial", 10, QFont.Bold)
+_LABEL_FONT = QFont("Arial", 9)
+
+# Primary screen geometry, dropped when the primary screen or its size changes
+_SCREEN_RECT_CACHE = {"rect": None, "screen": None, "app": None}
+
+
+def _invalidate_screen_rect(*_args):
+    """Forget the cached screen geometry so the next lookup re-reads it."""
+    _SCREEN_RECT_CACHE["rect"] = None
+
+
+def _primary_screen_rect():
+    """Get the primary screen geometry, reading it from Qt only after changes."""
+    rect = _SCREEN_RECT_CACHE["rect"]
+    if rect is not None:
+        return rect
+
+    app = QApplication.instance()
+    if _SCREEN_RECT_CACHE["app"] is not app:
+        app.primaryScreenChanged.connect(_invalidate_screen_rect)
+        _SCREEN_RECT_CACHE["app"] = app
+    screen = QApplication.primaryScreen()
+    if _SCREEN_RECT_CACHE["screen"] is not screen:
+        screen.geometryChanged.connect(_invalidate_screen_rect)
+        _SCREEN_RECT_CACHE["screen"] = screen
+    rect = _SCREEN_RECT_CACHE["rect"] = screen.geometry()
+    return rect
+
 
 class ChecklistFilterDialog(QDialog):
-    """Modal dialog for checklist filter selection."""
+    """
+    Modal dialog for checklist filter selection.
+
+    The dialog takes ownership of the selected_items set it is given and
+    updates it in place, so callers pass a set they no longer use.
+    """
 
     def __init__(
         self, title: str, items: List[str], selected_items: Set[str], parent=None
@@ -33,9 +70,10 @@ class ChecklistFilterDialog(QDialog):
         super().__init__(parent)
         self.title = title
         self.items = items
-        self.selected_items = selected_items.copy()
+        self.selected_items = selected_items
         self.result_items = set()
-        self.checkboxes = {}  # Store checkboxes by item name
+        self.list_items = {}  # Store list rows by item name
+        self._pressed_state = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -71,7 +109,7 @@ class ChecklistFilterDialog(QDialog):
 
         # Title
         title_label = QLabel(f"Select {self.title}:")
-        title_label.setFont(QFont("Arial", 10, QFont.Bold))
+        title_label.setFont(_TITLE_FONT)
         title_label.setStyleSheet("color: #cccccc;")
         layout.addWidget(title_label)
 
@@ -80,144 +118,86 @@ class ChecklistFilterDialog(QDialog):
 
         select_all_btn = QPushButton("Select All")
         select_all_btn.clicked.connect(self.select_all)
-        select_all_btn.setStyleSheet(
-            """
-            QPushButton {
-                border: 1px solid #4c4c4c;
-                border-radius: 3px;
-                background-color: #3c3c3c;
-                color: #cccccc;
-                font-size: 9px;
-                padding: 4px 8px;
-            }
-            QPushButton:hover {
-                background-color: #4c4c4c;
-            }
-        """
-        )
 
         clear_btn = QPushButton("Clear")
         clear_btn.clicked.connect(self.clear_selection)
-        clear_btn.setStyleSheet(
-            """
-            QPushButton {
-                border: 1px solid #4c4c4c;
-                border-radius: 3px;
-                background-color: #3c3c3c;
-                color: #cccccc;
-                font-size: 9px;
-                padding: 4px 8px;
-            }
-            QPushButton:hover {
-                background-color: #4c4c4c;
-            }
-        """
-        )
 
         button_layout.addWidget(select_all_btn)
         button_layout.addWidget(clear_btn)
         button_layout.addStretch()
 
         ok_btn = QPushButton("OK")
+        ok_btn.setProperty("class", "confirm-button")
         ok_btn.clicked.connect(self.accept)
-        ok_btn.setStyleSheet(
-            """
-            QPushButton {
-                border: 1px solid #0078d4;
-                border-radius: 3px;
-                background-color: #0078d4;
-                color: white;
-                font-size: 9px;
-                padding: 4px 12px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-        """
-        )
 
         cancel_btn = QPushButton("Cancel")
+        cancel_btn.setProperty("class", "cancel-button")
         cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet(
-            """
-            QPushButton {
-                border: 1px solid #4c4c4c;
-                border-radius: 3px;
-                background-color: #3c3c3c;
-                color: #cccccc;
-                font-size: 9px;
-                padding: 4px 12px;
-            }
-            QPushButton:hover {
-                background-color: #4c4c4c;
-            }
-        """
-        )
 
         button_layout.addWidget(ok_btn)
         button_layout.addWidget(cancel_btn)
         layout.addLayout(button_layout)
 
-        # Scroll area for checkboxes
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet(
+        # Checkable list of items. The view only paints the visible rows and
+        # every row shares the list's stylesheet, so long lists open quickly
+        self.item_list = QListWidget()
+        self.item_list.setSelectionMode(QAbstractItemView.NoSelection)
+        # Every row is one line of text, so the view can size them all from one
+        self.item_list.setUniformItemSizes(True)
+        self.item_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.item_list.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.item_list.setStyleSheet(
             """
-            QScrollArea {
+            QListWidget {
                 border: 1px solid #4c4c4c;
                 border-radius: 4px;
                 background-color: #2d2d30;
+                color: #cccccc;
+                font-size: 10px;
+                padding: 6px;
+            }
+            QListWidget::item {
+                padding: 2px;
+                color: #cccccc;
+            }
+            QListWidget::item:hover {
+                background-color: transparent;
+            }
+            QListWidget::indicator {
+                width: 14px;
+                height: 14px;
+                border: 1px solid #4c4c4c;
+                border-radius: 2px;
+                background-color: #2d2d30;
+            }
+            QListWidget::indicator:checked {
+                background-color: #0078d4;
+                border-color: #0078d4;
+            }
+            QListWidget::indicator:hover {
+                border-color: #0078d4;
             }
         """
         )
 
-        # Container for checkboxes
-        checkbox_container = QWidget()
-        checkbox_layout = QVBoxLayout(checkbox_container)
-        checkbox_layout.setContentsMargins(8, 8, 8, 8)
-        checkbox_layout.setSpacing(4)
-
-        # Add checkboxes for each item
+        # Add a checkable row for each item
         for item in self.items:
-            checkbox = QCheckBox(item)
-            # Store the item as a property on the checkbox for easy access
-            checkbox.item_name = item
-            # Set the initial state before connecting the signal to avoid triggering it
-            checkbox.setChecked(item in self.selected_items)
-            checkbox.stateChanged.connect(self.on_checkbox_changed)
-            # Store the checkbox for later access
-            self.checkboxes[item] = checkbox
-            checkbox.setStyleSheet(
-                """
-                QCheckBox {
-                    color: #cccccc;
-                    font-size: 10px;
-                    spacing: 6px;
-                }
-                QCheckBox::indicator {
-                    width: 14px;
-                    height: 14px;
-                    border: 1px solid #4c4c4c;
-                    border-radius: 2px;
-                    background-color: #2d2d30;
-                }
-                QCheckBox::indicator:checked {
-                    background-color: #0078d4;
-                    border-color: #0078d4;
-                }
-                QCheckBox::indicator:hover {
-                    border-color: #0078d4;
-                }
-            """
+            list_item = QListWidgetItem(item)
+            list_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
+            list_item.setCheckState(
+                Qt.Checked if item in self.selected_items else Qt.Unchecked
             )
-            checkbox_layout.addWidget(checkbox)
+            self.item_list.addItem(list_item)
+            # Store the row for later access
+            self.list_items[item] = list_item
 
-        scroll_area.setWidget(checkbox_container)
-        layout.addWidget(scroll_area)
+        # Connect after the initial states are set to avoid triggering the slot
+        self.item_list.itemChanged.connect(self.on_item_changed)
+        self.item_list.itemPressed.connect(self.on_item_pressed)
+        self.item_list.itemClicked.connect(self.on_item_clicked)
+        layout.addWidget(self.item_list)
 
-        # Set dialog styling
+        # Set dialog styling, including the buttons, in one stylesheet
         self.setStyleSheet(
             """
             QDialog {
@@ -225,66 +205,95 @@ class ChecklistFilterDialog(QDialog):
                 border: 1px solid #4c4c4c;
                 border-radius: 6px;
             }
+            QPushButton {
+                border: 1px solid #4c4c4c;
+                border-radius: 3px;
+                background-color: #3c3c3c;
+                color: #cccccc;
+                font-size: 9px;
+                padding: 4px 8px;
+            }
+            QPushButton:hover {
+                background-color: #4c4c4c;
+            }
+            QPushButton[class="cancel-button"] {
+                padding: 4px 12px;
+            }
+            QPushButton[class="confirm-button"] {
+                border: 1px solid #0078d4;
+                background-color: #0078d4;
+                color: white;
+                padding: 4px 12px;
+            }
+            QPushButton[class="confirm-button"]:hover {
+                background-color: #106ebe;
+            }
         """
         )
 
-    def on_checkbox_changed(self, state: int):
-        """Handle checkbox state changes."""
-        # Get the item name from the sender checkbox
-        checkbox = self.sender()
-        if checkbox and hasattr(checkbox, "item_name"):
-            item = checkbox.item_name
-            # Get the actual current state of the checkbox
-            actual_state = checkbox.isChecked()
-            print(
-                f"DEBUG: Checkbox '{item}' signal state: {state}, actual state: {actual_state}"
+    def on_item_changed(self, list_item: QListWidgetItem):
+        """Handle check state changes of an item."""
+        item = list_item.text()
+        if list_item.checkState() == Qt.Checked:
+            self.selected_items.add(item)
+            logging.debug(
+                "Dialog - added %s, selected_items now: %s",
+                item,
+                self.selected_items,
+            )
+        else:
+            self.selected_items.discard(item)
+            logging.debug(
+                "Dialog - removed %s, selected_items now: %s",
+                item,
+                self.selected_items,
             )
 
-            # Use the actual checkbox state instead of the signal parameter
-            if actual_state:
-                self.selected_items.add(item)
-                print(
-                    f"DEBUG: Dialog - added {item}, selected_items now: {self.selected_items}"
-                )
-            else:
-                self.selected_items.discard(item)
-                print(
-                    f"DEBUG: Dialog - removed {item}, selected_items now: {self.selected_items}"
+    def on_item_pressed(self, list_item: QListWidgetItem):
+        """Remember the check state of an item as the mouse goes down on it."""
+        # Presses on the check indicator are taken by the view and not emitted
+        self._pressed_state = list_item.checkState()
+
+    def on_item_clicked(self, list_item: QListWidgetItem):
+        """Toggle an item when its text, not its indicator, was clicked."""
+        pressed_state, self._pressed_state = self._pressed_state, None
+        if list_item.checkState() == pressed_state:
+            list_item.setCheckState(
+                Qt.Unchecked if pressed_state == Qt.Checked else Qt.Checked
+            )
+
+    def _set_all_check_states(self, state: Qt.CheckState):
+        """Set every item's check state without a per-item slot call."""
+        with QSignalBlocker(self.item_list):
+            for list_item in self.list_items.values():
+                list_item.setCheckState(state)
+
+    def reset(self, selected_items: Set[str]):
+        """Show a new selection on the existing rows before reopening."""
+        self.selected_items = selected_items
+        with QSignalBlocker(self.item_list):
+            for item, list_item in self.list_items.items():
+                list_item.setCheckState(
+                    Qt.Checked if item in self.selected_items else Qt.Unchecked
                 )
 
     def select_all(self):
         """Select all items."""
         self.selected_items = set(self.items)
-        # Update all checkboxes
-        for i in range(self.layout().count()):
-            item = self.layout().itemAt(i)
-            if isinstance(item.widget(), QScrollArea):
-                scroll_widget = item.widget().widget()
-                for j in range(scroll_widget.layout().count()):
-                    checkbox_item = scroll_widget.layout().itemAt(j)
-                    if isinstance(checkbox_item.widget(), QCheckBox):
-                        checkbox_item.widget().setChecked(True)
-                break
+        # Update all rows; selected_items is already set
+        self._set_all_check_states(Qt.Checked)
 
     def clear_selection(self):
         """Clear all selections."""
         # When clearing, we want to show all items, so return empty list
         self.selected_items.clear()
-        # Update all checkboxes to unchecked
-        for i in range(self.layout().count()):
-            item = self.layout().itemAt(i)
-            if isinstance(item.widget(), QScrollArea):
-                scroll_widget = item.widget().widget()
-                for j in range(scroll_widget.layout().count()):
-                    checkbox_item = scroll_widget.layout().itemAt(j)
-                    if isinstance(checkbox_item.widget(), QCheckBox):
-                        checkbox_item.widget().setChecked(False)
-                break
+        # Update all rows to unchecked; selected_items is already cleared
+        self._set_all_check_states(Qt.Unchecked)
 
     def get_selected_items(self) -> List[str]:
         """Get the selected items."""
         result = list(self.selected_items)
-        print(f"DEBUG: Dialog get_selected_items returning: {result}")
+        logging.debug("Dialog get_selected_items returning: %s", result)
         return result
 
 
@@ -302,9 +311,13 @@ class ChecklistFilterWidget(QWidget):
         """Initialize the checklist filter widget."""
         super().__init__(parent)
         self.title = title
-        self.items = []
+        self.items = ()
+        self._n_items = 0
         self.selected_items = set()
         self.on_selection_changed_callback = None
+        # The dropdown dialog is kept and reused while the items stay the same
+        self._dialog = None
+        self._dialog_items = ()
         self.setup_ui()
 
     def setup_ui(self):
@@ -318,13 +331,13 @@ class ChecklistFilterWidget(QWidget):
 
         # Title label
         self.title_label = QLabel(self.title + ":")
-        self.title_label.setFont(QFont("Arial", 9))
+        self.title_label.setFont(_LABEL_FONT)
         self.title_label.setStyleSheet("color: #cccccc;")
         layout.addWidget(self.title_label)
 
         # Selected items display (clickable) with integrated dropdown arrow
         self.selected_display = QPushButton("All ▼")
-        self.selected_display.setFont(QFont("Arial", 9))
+        self.selected_display.setFont(_LABEL_FONT)
         self.selected_display.clicked.connect(self.show_dropdown)
         self.selected_display.setStyleSheet(
             """
@@ -347,7 +360,9 @@ class ChecklistFilterWidget(QWidget):
 
     def set_items(self, items: List[str]):
         """Set the available items for selection."""
-        self.items = items
+        # Kept as a tuple so the items and their cached count can't drift apart
+        self.items = tuple(items)
+        self._n_items = len(self.items)
         # Start with all items selected (show "All" by default)
         self.selected_items = set(items)
         self.update_display()
@@ -366,50 +381,61 @@ class ChecklistFilterWidget(QWidget):
     def get_selected_items(self) -> List[str]:
         """Get the currently selected items."""
         # If all items are selected OR no items are selected, return empty list to indicate "show all"
-        if len(self.selected_items) == len(self.items) or len(self.selected_items) == 0:
-            print(
-                f"DEBUG: {self.title} - {'all' if len(self.selected_items) == len(self.items) else 'no'} items selected, returning []"
+        if len(self.selected_items) == self._n_items or len(self.selected_items) == 0:
+            logging.debug(
+                "%s - %s items selected, returning []",
+                self.title,
+                "all" if len(self.selected_items) == self._n_items else "no",
             )
             return []
         result = list(self.selected_items)
-        print(f"DEBUG: {self.title} - returning selected items: {result}")
+        logging.debug("%s - returning selected items: %s", self.title, result)
         return result
 
     def update_display(self):
         """Update the display of selected items."""
-        if not self.selected_items or len(self.selected_items) == len(self.items):
+        count = len(self.selected_items)
+        if not count or count == self._n_items:
             self.selected_display.setText("All ▼")
-        elif len(self.selected_items) == 1:
-            self.selected_display.setText(f"{list(self.selected_items)[0]} ▼")
         else:
-            # Show first few items with count
-            items_list = list(self.selected_items)
-            if len(items_list) <= 2:
-                self.selected_display.setText(f"{', '.join(items_list)} ▼")
+            # Show the first two items with a count of the rest; only those
+            # two are taken from the set rather than listing all of it
+            shown = ", ".join(islice(self.selected_items, 2))
+            if count <= 2:
+                self.selected_display.setText(f"{shown} ▼")
             else:
-                self.selected_display.setText(
-                    f"{items_list[0]}, {items_list[1]} +{len(items_list)-2} ▼"
-                )
+                self.selected_display.setText(f"{shown} +{count-2} ▼")
 
     def show_dropdown(self):
         """Show the dropdown modal."""
         if not self.items:
             return
+        previous_items = self.selected_items
 
         # Position the dialog relative to the widget
         global_pos = self.mapToGlobal(self.rect().bottomLeft())
 
-        # Create dialog with current selection state
-        # If we're showing "All", pass all items as selected to the dialog
-        if len(self.selected_items) == len(self.items) or len(self.selected_items) == 0:
+        # Create dialog with current selection state, as a fresh set the dialog
+        # can own. If we're showing "All", pass all items as selected
+        if len(self.selected_items) == self._n_items or len(self.selected_items) == 0:
             dialog_selected = set(self.items)  # Start with all selected
         else:
             dialog_selected = self.selected_items.copy()
 
-        dialog = ChecklistFilterDialog(self.title, self.items, dialog_selected, self)
+        dialog = self._dialog
+        if dialog is not None and self._dialog_items == self.items:
+            dialog.reset(dialog_selected)
+        else:
+            if dialog is not None:
+                dialog.deleteLater()
+            dialog = ChecklistFilterDialog(
+                self.title, self.items, dialog_selected, self
+            )
+            self._dialog = dialog
+            self._dialog_items = self.items
 
         # Adjust position to keep dialog on screen
-        screen = QApplication.primaryScreen().geometry()
+        screen = _primary_screen_rect()
         dialog_width = dialog.width()
         dialog_height = dialog.height()
 
@@ -426,7 +452,7 @@ class ChecklistFilterWidget(QWidget):
 
         if dialog.exec() == QDialog.Accepted:
             dialog_items = dialog.get_selected_items()
-            print(f"DEBUG: Dialog accepted, items from dialog: {dialog_items}")
+            logging.debug("Dialog accepted, items from dialog: %s", dialog_items)
 
             # If dialog returns empty list, it means "show all"
             if not dialog_items:
@@ -434,14 +460,17 @@ class ChecklistFilterWidget(QWidget):
             else:
                 self.selected_items = set(dialog_items)
 
-            print(f"DEBUG: Set selected_items to: {self.selected_items}")
+            logging.debug("Set selected_items to: %s", self.selected_items)
+            if self.selected_items == previous_items:
+                # Nothing changed, so spare the listeners a refilter
+                return
             self.update_display()
             final_items = self.get_selected_items()
-            print(f"DEBUG: Emitting selection_changed with: {final_items}")
+            logging.debug("Emitting selection_changed with: %s", final_items)
             self.selection_changed.emit(final_items)
 
             if self.on_selection_changed_callback:
-                print(f"DEBUG: Calling callback for {self.title}")
+                logging.debug("Calling callback for %s", self.title)
                 self.on_selection_changed_callback()
 
     def set_selection_changed_callback(self, callback: Callable):
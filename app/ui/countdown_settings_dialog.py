@@ -2,6 +2,7 @@
 Countdown settings dialog for the timer widget.
 """
 
+import logging
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -26,8 +27,11 @@ class CountdownSettingsDialog(QDialog):
         self.minutes = minutes
         self.seconds = seconds
         self.count_down = count_down
-        print(
-            f"CountdownSettingsDialog initialized with: {minutes}m {seconds}s, count_down={count_down}"
+        logging.debug(
+            "CountdownSettingsDialog initialized with: %sm %ss, count_down=%s",
+            minutes,
+            seconds,
+            count_down,
         )
         self.setup_ui()
         self.setup_behavior()
@@ -38,13 +42,6 @@ class CountdownSettingsDialog(QDialog):
         self.setModal(True)
         self.setFixedSize(400, 280)
 
-        # Center the dialog on the parent
-        if self.parent():
-            parent_rect = self.parent().geometry()
-            x = parent_rect.x() + (parent_rect.width() - self.width()) // 2
-            y = parent_rect.y() + (parent_rect.height() - self.height()) // 2
-            self.move(x, y)
-
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
 
@@ -95,6 +92,16 @@ class CountdownSettingsDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def showEvent(self, event):
+        """Center the dialog on the parent's geometry at the time it is shown."""
+        super().showEvent(event)
+        parent = self.parent()
+        if parent:
+            parent_rect = parent.geometry()
+            x = parent_rect.x() + (parent_rect.width() - self.width()) // 2
+            y = parent_rect.y() + (parent_rect.height() - self.height()) // 2
+            self.move(x, y)
+
     def setup_behavior(self):
         """Set up dialog behavior."""
         # Set focus to OK button
@@ -108,7 +115,7 @@ class CountdownSettingsDialog(QDialog):
             "seconds": self.seconds_spin.value(),
             "count_down": self.count_down_checkbox.isChecked(),
         }
-        print(f"CountdownSettingsDialog.get_settings() returning: {settings}")
+        logging.debug("CountdownSettingsDialog.get_settings() returning: %s", settings)
         return settings
 
     def set_settings(self, minutes: int, seconds: int, count_down: bool):
@@ -5,6 +5,8 @@ This module provides a dialog for creating and editing habits
 with support for all habit types and configurations.
 """
 
+import re
+from dataclasses import replace
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -25,47 +27,88 @@ from PySide6.QtWidgets import (
     QFrame,
     QScrollArea,
     QWidget,
+    QStyle,
+    QStackedWidget,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer, QSize
 from PySide6.QtGui import QFont, QColor
 from datetime import datetime
 from typing import Optional, List
 from app.models.habit import Habit, HabitType, HabitFrequency
 
+# Habit types and frequencies in the order of the dialog combo boxes
+_HABIT_TYPE_ORDER = (
+    HabitType.BOOLEAN,
+    HabitType.DURATION,
+    HabitType.UNITS,
+    HabitType.REAL_NUMBER,
+    HabitType.RATING,
+    HabitType.COUNT,
+)
+_HABIT_TYPE_INDEX = {t: i for i, t in enumerate(_HABIT_TYPE_ORDER)}
+
+_FREQUENCY_ORDER = (
+    HabitFrequency.DAILY,
+    HabitFrequency.WEEKLY,
+    HabitFrequency.MONTHLY,
+    HabitFrequency.CUSTOM,
+)
+_FREQUENCY_INDEX = {f: i for i, f in enumerate(_FREQUENCY_ORDER)}
+
+# Comma between tags, along with the whitespace around it
+_TAG_SEPARATOR_RE = re.compile(r"\s*,\s*")
+
 
 class HabitDialog(QDialog):
     """Dialog for creating and editing habits."""
 
+    # Color picker shared by all habit dialogs, created on first use
+    _color_dialog = None
+
     def __init__(self, habit: Optional[Habit] = None, parent=None):
         super().__init__(parent)
         self.habit = habit
         self.is_editing = habit is not None
+        self.secondary_ui_built = False
         self.setup_ui()
         self.load_habit_data()
         self.center_on_screen()
 
-    def center_on_screen(self):
-        """Center the dialog on the screen."""
-        screen = self.screen()
-        screen_geometry = screen.geometry()
-
-        # Calculate maximum available size (leave some margin)
-        max_width = min(500, screen_geometry.width() - 100)
-        max_height = min(600, screen_geometry.height() - 100)
-
-        # Resize dialog to fit screen
-        self.resize(max_width, max_height)
+        # Build the less used groups once the dialog has had a chance to paint
+        QTimer.singleShot(0, self, self._build_secondary_ui)
 
-        # Center the dialog
-        dialog_geometry = self.geometry()
-        x = (screen_geometry.width() - dialog_geometry.width()) // 2
-        y = (screen_geometry.height() - dialog_geometry.height()) // 2
-
-        # Ensure dialog doesn't go off-screen
-        x = max(0, min(x, screen_geometry.width() - dialog_geometry.width()))
-        y = max(0, min(y, screen_geometry.height() - dialog_geometry.height()))
+    def center_on_screen(self):
+        """Size the dialog to fit the screen and center it there."""
+        # Available geometry leaves out taskbars and docks
+        screen_geometry = self.screen().availableGeometry()
+        size = QSize(
+            min(500, screen_geometry.width() - 100),
+            min(600, screen_geometry.height() - 100),
+        )
+        self.setGeometry(
+            QStyle.alignedRect(Qt.LeftToRight, Qt.AlignCenter, size, screen_geometry)
+        )
 
-        self.move(x, y)
+    @staticmethod
+    def _make_double_spin(low: float, high: float) -> QDoubleSpinBox:
+        """Create a spin box for habit values in the given range."""
+        spin = QDoubleSpinBox()
+        spin.setRange(low, high)
+        spin.setDecimals(4)  # Allow up to 4 decimal places
+        spin.setSingleStep(0.01)  # Step by 0.01 for easier navigation
+        return spin
+
+    @staticmethod
+    def _make_optional_row(spin: QDoubleSpinBox):
+        """Pair a spin box with a check box that says whether its value is set."""
+        check = QCheckBox("Set")
+        spin.setEnabled(False)
+        check.toggled.connect(spin.setEnabled)
+
+        row_layout = QHBoxLayout()
+        row_layout.addWidget(check)
+        row_layout.addWidget(spin, 1)
+        return check, row_layout
 
     def setup_ui(self):
         """Set up the user interface."""
@@ -90,6 +133,7 @@ class HabitDialog(QDialog):
         # Create widget to hold form content
         form_widget = QWidget()
         form_layout = QVBoxLayout(form_widget)
+        self.form_layout = form_layout
         form_layout.setSpacing(8)
         form_layout.setContentsMargins(4, 4, 4, 4)
 
@@ -124,13 +168,15 @@ class HabitDialog(QDialog):
                 "Count (Simple counter)",
             ]
         )
-        self.habit_type_combo.currentIndexChanged.connect(self.on_habit_type_changed)
+        self.habit_type_combo.currentIndexChanged[int].connect(
+            self.on_habit_type_changed
+        )
         config_layout.addRow("Type:", self.habit_type_combo)
 
         # Frequency
         self.frequency_combo = QComboBox()
         self.frequency_combo.addItems(["Daily", "Weekly", "Monthly", "Custom"])
-        self.frequency_combo.currentIndexChanged.connect(self.on_frequency_changed)
+        self.frequency_combo.currentIndexChanged[int].connect(self.on_frequency_changed)
         config_layout.addRow("Frequency:", self.frequency_combo)
 
         # Custom interval
@@ -144,18 +190,33 @@ class HabitDialog(QDialog):
 
         # Type-specific settings
         self.type_settings_group = QGroupBox("Type Settings")
-        self.type_settings_layout = QFormLayout(self.type_settings_group)
+        type_settings_layout = QVBoxLayout(self.type_settings_group)
+
+        # One settings page per habit type, in combo box order
+        self.type_settings_stack = QStackedWidget()
+        for habit_type in _HABIT_TYPE_ORDER:
+            page = QWidget()
+            if habit_type == HabitType.RATING:
+                page_layout = QFormLayout(page)
+                page_layout.setContentsMargins(0, 0, 0, 0)
+                self.rating_scale_spin = QSpinBox()
+                self.rating_scale_spin.setRange(2, 20)
+                self.rating_scale_spin.setValue(10)
+                page_layout.addRow("Rating scale:", self.rating_scale_spin)
+            self.type_settings_stack.addWidget(page)
+        type_settings_layout.addWidget(self.type_settings_stack)
+
         form_layout.addWidget(self.type_settings_group)
 
         # Target and unit settings
         target_group = QGroupBox("Target & Unit")
         target_layout = QFormLayout(target_group)
 
-        self.target_value_spin = QDoubleSpinBox()
-        self.target_value_spin.setRange(0, 999999)
-        self.target_value_spin.setDecimals(4)  # Allow up to 4 decimal places
-        self.target_value_spin.setSingleStep(0.01)  # Step by 0.01 for easier navigation
-        target_layout.addRow("Target value:", self.target_value_spin)
+        self.target_value_spin = self._make_double_spin(0, 999999)
+        self.target_enabled_check, target_row = self._make_optional_row(
+            self.target_value_spin
+        )
+        target_layout.addRow("Target value:", target_row)
 
         self.unit_edit = QLineEdit()
         self.unit_edit.setPlaceholderText("e.g., steps, minutes, kg")
@@ -163,23 +224,45 @@ class HabitDialog(QDialog):
 
         form_layout.addWidget(target_group)
 
+        # Add stretch to push content to top
+        form_layout.addStretch()
+
+        # Set the form widget as the scroll area's widget
+        scroll_area.setWidget(form_widget)
+        main_layout.addWidget(scroll_area, 1)  # Give scroll area stretch factor
+
+        # Buttons - always visible at bottom
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        main_layout.addWidget(button_box, 0)  # No stretch for buttons
+
+        # Initialize with default values
+        self.current_color = "#007bff"
+        self.on_habit_type_changed(0)
+
+    def _build_secondary_ui(self):
+        """Build the value range, appearance and status groups."""
+        if self.secondary_ui_built:
+            return
+        self.secondary_ui_built = True
+
+        # Secondary groups go above the stretch that ends the form
+        form_layout = self.form_layout
+
         # Value range settings
         range_group = QGroupBox("Value Range (Optional)")
         range_layout = QFormLayout(range_group)
 
-        self.min_value_spin = QDoubleSpinBox()
-        self.min_value_spin.setRange(-999999, 999999)
-        self.min_value_spin.setDecimals(4)  # Allow up to 4 decimal places
-        self.min_value_spin.setSingleStep(0.01)  # Step by 0.01 for easier navigation
-        range_layout.addRow("Minimum value:", self.min_value_spin)
+        self.min_value_spin = self._make_double_spin(-999999, 999999)
+        self.min_enabled_check, min_row = self._make_optional_row(self.min_value_spin)
+        range_layout.addRow("Minimum value:", min_row)
 
-        self.max_value_spin = QDoubleSpinBox()
-        self.max_value_spin.setRange(-999999, 999999)
-        self.max_value_spin.setDecimals(4)  # Allow up to 4 decimal places
-        self.max_value_spin.setSingleStep(0.01)  # Step by 0.01 for easier navigation
-        range_layout.addRow("Maximum value:", self.max_value_spin)
+        self.max_value_spin = self._make_double_spin(-999999, 999999)
+        self.max_enabled_check, max_row = self._make_optional_row(self.max_value_spin)
+        range_layout.addRow("Maximum value:", max_row)
 
-        form_layout.addWidget(range_group)
+        form_layout.insertWidget(form_layout.count() - 1, range_group)
 
         # Color and tags
         appearance_group = QGroupBox("Appearance")
@@ -189,9 +272,8 @@ class HabitDialog(QDialog):
         color_layout = QHBoxLayout()
         self.color_preview = QFrame()
         self.color_preview.setFixedSize(24, 24)
-        self.color_preview.setStyleSheet(
-            "background-color: #007bff; border: 1px solid #ccc; border-radius: 3px;"
-        )
+        self.preview_color = None
+        self._apply_color(self.current_color)
         color_layout.addWidget(self.color_preview)
 
         self.color_btn = QPushButton("Choose Color")
@@ -206,7 +288,7 @@ class HabitDialog(QDialog):
         self.tags_edit.setPlaceholderText("Enter tags separated by commas...")
         appearance_layout.addRow("Tags:", self.tags_edit)
 
-        form_layout.addWidget(appearance_group)
+        form_layout.insertWidget(form_layout.count() - 1, appearance_group)
 
         # Status
         status_group = QGroupBox("Status")
@@ -216,24 +298,9 @@ class HabitDialog(QDialog):
         self.active_check.setChecked(True)
         status_layout.addRow("", self.active_check)
 
-        form_layout.addWidget(status_group)
-
-        # Add stretch to push content to top
-        form_layout.addStretch()
-
-        # Set the form widget as the scroll area's widget
-        scroll_area.setWidget(form_widget)
-        main_layout.addWidget(scroll_area, 1)  # Give scroll area stretch factor
+        form_layout.insertWidget(form_layout.count() - 1, status_group)
 
-        # Buttons - always visible at bottom
-        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        button_box.accepted.connect(self.accept)
-        button_box.rejected.connect(self.reject)
-        main_layout.addWidget(button_box, 0)  # No stretch for buttons
-
-        # Initialize with default values
-        self.current_color = "#007bff"
-        self.on_habit_type_changed(0)
+        self.load_secondary_habit_data()
 
     def load_habit_data(self):
         """Load existing habit data if editing."""
@@ -245,27 +312,13 @@ class HabitDialog(QDialog):
             self.description_edit.setPlainText(self.habit.description)
 
         # Set habit type
-        type_index_map = {
-            HabitType.BOOLEAN: 0,
-            HabitType.DURATION: 1,
-            HabitType.UNITS: 2,
-            HabitType.REAL_NUMBER: 3,
-            HabitType.RATING: 4,
-            HabitType.COUNT: 5,
-        }
         self.habit_type_combo.setCurrentIndex(
-            type_index_map.get(self.habit.habit_type, 0)
+            _HABIT_TYPE_INDEX.get(self.habit.habit_type, 0)
         )
 
         # Set frequency
-        freq_index_map = {
-            HabitFrequency.DAILY: 0,
-            HabitFrequency.WEEKLY: 1,
-            HabitFrequency.MONTHLY: 2,
-            HabitFrequency.CUSTOM: 3,
-        }
         self.frequency_combo.setCurrentIndex(
-            freq_index_map.get(self.habit.frequency, 0)
+            _FREQUENCY_INDEX.get(self.habit.frequency, 0)
         )
 
         if self.habit.custom_interval_days:
@@ -273,20 +326,25 @@ class HabitDialog(QDialog):
 
         if self.habit.target_value is not None:
             self.target_value_spin.setValue(self.habit.target_value)
+            self.target_enabled_check.setChecked(True)
 
         if self.habit.unit:
             self.unit_edit.setText(self.habit.unit)
 
+        self.current_color = self.habit.color
+
+    def load_secondary_habit_data(self):
+        """Load existing habit data into the value range, appearance and status groups."""
+        if not self.habit:
+            return
+
         if self.habit.min_value is not None:
             self.min_value_spin.setValue(self.habit.min_value)
+            self.min_enabled_check.setChecked(True)
 
         if self.habit.max_value is not None:
             self.max_value_spin.setValue(self.habit.max_value)
-
-        self.current_color = self.habit.color
-        self.color_preview.setStyleSheet(
-            f"background-color: {self.current_color}; border: 1px solid #ccc; border-radius: 3px;"
-        )
+            self.max_enabled_check.setChecked(True)
 
         if self.habit.tags:
             self.tags_edit.setText(", ".join(self.habit.tags))
@@ -295,9 +353,7 @@ class HabitDialog(QDialog):
 
     def on_habit_type_changed(self, index: int):
         """Handle habit type change."""
-        # Clear existing widgets
-        while self.type_settings_layout.rowCount() > 0:
-            self.type_settings_layout.removeRow(0)
+        self.type_settings_stack.setCurrentIndex(index)
 
         if index == 0:  # Boolean
             # No additional settings needed
@@ -312,10 +368,6 @@ class HabitDialog(QDialog):
             self.unit_edit.setEnabled(True)
             self.unit_edit.setPlaceholderText("e.g., kg, miles, hours")
         elif index == 4:  # Rating
-            self.rating_scale_spin = QSpinBox()
-            self.rating_scale_spin.setRange(2, 20)
-            self.rating_scale_spin.setValue(10)
-            self.type_settings_layout.addRow("Rating scale:", self.rating_scale_spin)
             self.unit_edit.setText("points")
             self.unit_edit.setEnabled(False)
         elif index == 5:  # Count
@@ -328,40 +380,47 @@ class HabitDialog(QDialog):
 
     def choose_color(self):
         """Open color picker dialog."""
-        color = QColorDialog.getColor(
-            QColor(self.current_color), self, "Choose Habit Color"
-        )
+        dialog = HabitDialog._color_dialog
+        if dialog is None:
+            # No parent, so the picker outlives the habit dialog that opened it
+            dialog = QColorDialog()
+            dialog.setWindowTitle("Choose Habit Color")
+            dialog.setModal(True)
+            HabitDialog._color_dialog = dialog
+
+        dialog.setCurrentColor(QColor(self.current_color))
+        if dialog.exec() != QDialog.Accepted:
+            return
+
+        color = dialog.currentColor()
         if color.isValid():
             self.current_color = color.name()
-            self.color_preview.setStyleSheet(
-                f"background-color: {self.current_color}; border: 1px solid #ccc; border-radius: 3px;"
-            )
+            self._apply_color(self.current_color)
 
-    def get_habit(self) -> Optional[Habit]:
-        """Get the habit data from the dialog."""
+    def _apply_color(self, color: str):
+        """Show a color in the preview, restyling it only when the color changes."""
+        # The application style sheet paints every QWidget background, so the
+        # preview has to be colored through its own style sheet, not a palette
+        if color == self.preview_color:
+            return
+        self.preview_color = color
+        self.color_preview.setStyleSheet(
+            f"background-color: {color}; border: 1px solid #ccc; border-radius: 3px;"
+        )
+
+    def get_habit_data(self) -> Optional[dict]:
+        """Get the editable habit fields from the dialog."""
         name = self.name_edit.text().strip()
         if not name:
             return None
 
+        self._build_secondary_ui()
+
         # Get habit type
-        type_map = [
-            HabitType.BOOLEAN,
-            HabitType.DURATION,
-            HabitType.UNITS,
-            HabitType.REAL_NUMBER,
-            HabitType.RATING,
-            HabitType.COUNT,
-        ]
-        habit_type = type_map[self.habit_type_combo.currentIndex()]
+        habit_type = _HABIT_TYPE_ORDER[self.habit_type_combo.currentIndex()]
 
         # Get frequency
-        freq_map = [
-            HabitFrequency.DAILY,
-            HabitFrequency.WEEKLY,
-            HabitFrequency.MONTHLY,
-            HabitFrequency.CUSTOM,
-        ]
-        frequency = freq_map[self.frequency_combo.currentIndex()]
+        frequency = _FREQUENCY_ORDER[self.frequency_combo.currentIndex()]
 
         # Get custom interval
         custom_interval_days = None
@@ -369,13 +428,9 @@ class HabitDialog(QDialog):
             custom_interval_days = self.custom_interval_spin.value()
 
         # Get target value
-        target_value = self.target_value_spin.value()
-        # Only set to None if it's exactly 0 and the user hasn't explicitly set a target
-        # For real number habits, 0.0 might be a valid target
-        if (
-            target_value == 0.0 and self.habit_type_combo.currentIndex() != 3
-        ):  # Not REAL_NUMBER
-            target_value = None
+        target_value = None
+        if self.target_enabled_check.isChecked():
+            target_value = self.target_value_spin.value()
 
         # Get unit
         unit = self.unit_edit.text().strip()
@@ -383,26 +438,23 @@ class HabitDialog(QDialog):
             unit = None
 
         # Get min/max values
-        min_value = self.min_value_spin.value()
-        if min_value == -999999:
-            min_value = None
+        min_value = None
+        if self.min_enabled_check.isChecked():
+            min_value = self.min_value_spin.value()
 
-        max_value = self.max_value_spin.value()
-        if max_value == 999999:
-            max_value = None
-        elif max_value == 0.0:
-            # 0.0 is not a reasonable maximum for most habits, treat as no maximum
-            max_value = None
+        max_value = None
+        if self.max_enabled_check.isChecked():
+            max_value = self.max_value_spin.value()
 
         # Get rating scale
         rating_scale = 10
-        if habit_type == HabitType.RATING and hasattr(self, "rating_scale_spin"):
+        if habit_type == HabitType.RATING:
             rating_scale = self.rating_scale_spin.value()
 
         # Get tags
         tags_text = self.tags_edit.text().strip()
         tags = (
-            [tag.strip() for tag in tags_text.split(",") if tag.strip()]
+            [tag for tag in _TAG_SEPARATOR_RE.split(tags_text) if tag]
             if tags_text
             else []
         )
@@ -424,17 +476,38 @@ class HabitDialog(QDialog):
             "tags": tags,
         }
 
+        return habit_data
+
+    def get_habit_patch(self) -> Optional[dict]:
+        """Get only the habit fields that differ from the habit being edited."""
+        habit_data = self.get_habit_data()
+        if habit_data is None or not self.is_editing:
+            return habit_data
+
+        return {
+            key: value
+            for key, value in habit_data.items()
+            if getattr(self.habit, key) != value
+        }
+
+    def get_habit(self) -> Optional[Habit]:
+        """Get the habit data from the dialog."""
         if self.is_editing:
-            # Update existing habit
-            habit_data["id"] = self.habit.id
-            habit_data["created_at"] = self.habit.created_at
-            habit_data["updated_at"] = datetime.now()
-            habit_data["recent_entries"] = self.habit.recent_entries
-        else:
-            # Create new habit
-            habit_data["id"] = 0  # Will be set by database
-            habit_data["created_at"] = datetime.now()
-            habit_data["updated_at"] = datetime.now()
-            habit_data["recent_entries"] = []
-
-        return Habit(**habit_data)
+            # Update existing habit, keeping the fields the dialog doesn't edit
+            patch = self.get_habit_patch()
+            if patch is None:
+                return None
+            return replace(self.habit, **patch, updated_at=datetime.now())
+
+        habit_data = self.get_habit_data()
+        if habit_data is None:
+            return None
+
+        # Create new habit
+        return Habit(
+            id=0,  # Will be set by database
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            recent_entries=[],
+            **habit_data,
+        )
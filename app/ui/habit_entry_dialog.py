@@ -5,6 +5,7 @@ This module provides a dialog for adding habit entries
 with different input types based on the habit type.
 """
 
+import logging
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -23,8 +24,9 @@ from PySide6.QtWidgets import (
     QDateEdit,
     QTimeEdit,
     QFrame,
+    QStyle,
 )
-from PySide6.QtCore import Qt, Signal, QTime
+from PySide6.QtCore import Qt, Signal, QTime, QSize
 from PySide6.QtGui import QFont
 from datetime import datetime, date, timedelta
 from typing import Optional, Union
@@ -41,27 +43,16 @@ class HabitEntryDialog(QDialog):
         self.center_on_screen()
 
     def center_on_screen(self):
-        """Center the dialog on the screen."""
-        screen = self.screen()
-        screen_geometry = screen.geometry()
-
-        # Calculate maximum available size (leave some margin)
-        max_width = min(400, screen_geometry.width() - 100)
-        max_height = min(400, screen_geometry.height() - 100)
-
-        # Resize dialog to fit screen
-        self.resize(max_width, max_height)
-
-        # Center the dialog
-        dialog_geometry = self.geometry()
-        x = (screen_geometry.width() - dialog_geometry.width()) // 2
-        y = (screen_geometry.height() - dialog_geometry.height()) // 2
-
-        # Ensure dialog doesn't go off-screen
-        x = max(0, min(x, screen_geometry.width() - dialog_geometry.width()))
-        y = max(0, min(y, screen_geometry.height() - dialog_geometry.height()))
-
-        self.move(x, y)
+        """Size the dialog to fit the screen and center it there."""
+        # Available geometry leaves out taskbars and docks
+        screen_geometry = self.screen().availableGeometry()
+        size = QSize(
+            min(400, screen_geometry.width() - 100),
+            min(400, screen_geometry.height() - 100),
+        )
+        self.setGeometry(
+            QStyle.alignedRect(Qt.LeftToRight, Qt.AlignCenter, size, screen_geometry)
+        )
 
     def setup_ui(self):
         """Set up the user interface."""
@@ -123,104 +114,149 @@ class HabitEntryDialog(QDialog):
 
     def create_value_widget(self):
         """Create the appropriate value input widget based on habit type."""
-        if self.habit.habit_type == HabitType.BOOLEAN:
-            # Checkbox for yes/no
-            widget = QCheckBox("Completed")
-            widget.setChecked(True)
-            return widget
-        elif self.habit.habit_type == HabitType.DURATION:
-            # Time input for duration
-            widget = QFrame()
-            layout = QHBoxLayout(widget)
-            layout.setContentsMargins(0, 0, 0, 0)
-
-            self.hours_spin = QSpinBox()
-            self.hours_spin.setRange(0, 24)
-            self.hours_spin.setSuffix("h")
-            layout.addWidget(self.hours_spin)
-
-            self.minutes_spin = QSpinBox()
-            self.minutes_spin.setRange(0, 59)
-            self.minutes_spin.setSuffix("m")
-            layout.addWidget(self.minutes_spin)
-
-            self.seconds_spin = QSpinBox()
-            self.seconds_spin.setRange(0, 59)
-            self.seconds_spin.setSuffix("s")
-            layout.addWidget(self.seconds_spin)
-
-            return widget
-        elif self.habit.habit_type == HabitType.UNITS:
-            # Integer input for units
-            widget = QSpinBox()
-            widget.setRange(0, 999999)
-            if self.habit.min_value is not None:
-                widget.setMinimum(int(self.habit.min_value))
-            if self.habit.max_value is not None:
-                widget.setMaximum(int(self.habit.max_value))
-            if self.habit.target_value:
-                widget.setValue(int(self.habit.target_value))
-            return widget
-        elif self.habit.habit_type == HabitType.REAL_NUMBER:
-            # Float input for real numbers - use QLineEdit for better decimal input
-            widget = QLineEdit()
-            widget.setPlaceholderText("Enter decimal value (e.g., 0.75)")
-            # Always start with 0.0 for new entries, not the target value
-            widget.setText("0.0")
-            return widget
-        elif self.habit.habit_type == HabitType.RATING:
-            # Rating scale input
-            widget = QComboBox()
-            widget.addItems([str(i) for i in range(1, self.habit.rating_scale + 1)])
-            widget.setCurrentText(
-                str(self.habit.rating_scale // 2)
-            )  # Default to middle
-            return widget
-        elif self.habit.habit_type == HabitType.COUNT:
-            # Integer input for count
-            widget = QSpinBox()
-            widget.setRange(0, 999999)
-            if self.habit.min_value is not None:
-                widget.setMinimum(int(self.habit.min_value))
-            if self.habit.max_value is not None:
-                widget.setMaximum(int(self.habit.max_value))
-            widget.setValue(1)  # Default to 1 for count
-            return widget
-        else:
-            # Fallback to text input
-            widget = QLineEdit()
-            widget.setPlaceholderText("Enter value...")
-            return widget
+        build = self._VALUE_WIDGET_BUILDERS.get(
+            self.habit.habit_type, HabitEntryDialog._build_text_widget
+        )
+        return build(self)
+
+    def _build_boolean_widget(self):
+        """Create a checkbox for yes/no habits."""
+        widget = QCheckBox("Completed")
+        widget.setChecked(True)
+        return widget
+
+    def _build_duration_widget(self):
+        """Create hour, minute and second inputs for duration habits."""
+        widget = QFrame()
+        layout = QHBoxLayout(widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.hours_spin = self._make_time_spin(24, "h")
+        layout.addWidget(self.hours_spin)
+
+        self.minutes_spin = self._make_time_spin(59, "m")
+        layout.addWidget(self.minutes_spin)
+
+        self.seconds_spin = self._make_time_spin(59, "s")
+        layout.addWidget(self.seconds_spin)
+
+        return widget
+
+    @staticmethod
+    def _make_time_spin(maximum: int, suffix: str) -> QSpinBox:
+        """Create one of the duration spin boxes."""
+        spin = QSpinBox()
+        spin.setRange(0, maximum)
+        spin.setSuffix(suffix)
+        return spin
+
+    def _build_units_widget(self):
+        """Create an integer input for unit habits."""
+        widget = QSpinBox()
+        widget.setRange(0, 999999)
+        if self.habit.min_value is not None:
+            widget.setMinimum(int(self.habit.min_value))
+        if self.habit.max_value is not None:
+            widget.setMaximum(int(self.habit.max_value))
+        if self.habit.target_value:
+            widget.setValue(int(self.habit.target_value))
+        return widget
+
+    def _build_real_number_widget(self):
+        """Create a text input for real number habits."""
+        # Use QLineEdit for better decimal input
+        widget = QLineEdit()
+        widget.setPlaceholderText("Enter decimal value (e.g., 0.75)")
+        # Always start with 0.0 for new entries, not the target value
+        widget.setText("0.0")
+        return widget
+
+    def _build_rating_widget(self):
+        """Create a rating scale input for rating habits."""
+        widget = QComboBox()
+        widget.addItems([str(i) for i in range(1, self.habit.rating_scale + 1)])
+        widget.setCurrentText(str(self.habit.rating_scale // 2))  # Default to middle
+        return widget
+
+    def _build_count_widget(self):
+        """Create an integer input for count habits."""
+        widget = QSpinBox()
+        widget.setRange(0, 999999)
+        if self.habit.min_value is not None:
+            widget.setMinimum(int(self.habit.min_value))
+        if self.habit.max_value is not None:
+            widget.setMaximum(int(self.habit.max_value))
+        widget.setValue(1)  # Default to 1 for count
+        return widget
+
+    def _build_text_widget(self):
+        """Create a text input as a fallback for unknown habit types."""
+        widget = QLineEdit()
+        widget.setPlaceholderText("Enter value...")
+        return widget
+
+    # Value widget builder for each habit type, only the one needed is built
+    _VALUE_WIDGET_BUILDERS = {
+        HabitType.BOOLEAN: _build_boolean_widget,
+        HabitType.DURATION: _build_duration_widget,
+        HabitType.UNITS: _build_units_widget,
+        HabitType.REAL_NUMBER: _build_real_number_widget,
+        HabitType.RATING: _build_rating_widget,
+        HabitType.COUNT: _build_count_widget,
+    }
 
     def get_value(self) -> Union[bool, int, float, str]:
         """Get the value from the appropriate widget."""
-        if self.habit.habit_type == HabitType.BOOLEAN:
-            return self.value_widget.isChecked()
-        elif self.habit.habit_type == HabitType.DURATION:
-            # Convert to seconds
-            hours = self.hours_spin.value()
-            minutes = self.minutes_spin.value()
-            seconds = self.seconds_spin.value()
-            return hours * 3600 + minutes * 60 + seconds
-        elif self.habit.habit_type == HabitType.UNITS:
-            return self.value_widget.value()
-        elif self.habit.habit_type == HabitType.REAL_NUMBER:
-            try:
-                return float(self.value_widget.text())
-            except ValueError:
-                # If invalid input, return 0.0 as fallback
-                return 0.0
-        elif self.habit.habit_type == HabitType.RATING:
-            return int(self.value_widget.currentText())
-        elif self.habit.habit_type == HabitType.COUNT:
-            return self.value_widget.value()
-        else:
-            return self.value_widget.text()
+        read = self._VALUE_READERS.get(
+            self.habit.habit_type, HabitEntryDialog._read_text_value
+        )
+        return read(self)
+
+    def _read_boolean_value(self) -> bool:
+        """Read a yes/no value."""
+        return self.value_widget.isChecked()
+
+    def _read_duration_value(self) -> int:
+        """Read a duration value in seconds."""
+        hours = self.hours_spin.value()
+        minutes = self.minutes_spin.value()
+        seconds = self.seconds_spin.value()
+        return hours * 3600 + minutes * 60 + seconds
+
+    def _read_spin_value(self) -> int:
+        """Read a unit or count value."""
+        return self.value_widget.value()
+
+    def _read_real_number_value(self) -> float:
+        """Read a real number value."""
+        try:
+            return float(self.value_widget.text())
+        except ValueError:
+            # If invalid input, return 0.0 as fallback
+            return 0.0
+
+    def _read_rating_value(self) -> int:
+        """Read a rating value."""
+        return int(self.value_widget.currentText())
+
+    def _read_text_value(self) -> str:
+        """Read a free text value."""
+        return self.value_widget.text()
+
+    # Value reader for each habit type, matching _VALUE_WIDGET_BUILDERS
+    _VALUE_READERS = {
+        HabitType.BOOLEAN: _read_boolean_value,
+        HabitType.DURATION: _read_duration_value,
+        HabitType.UNITS: _read_spin_value,
+        HabitType.REAL_NUMBER: _read_real_number_value,
+        HabitType.RATING: _read_rating_value,
+        HabitType.COUNT: _read_spin_value,
+    }
 
     def get_entry(self) -> Optional[HabitEntry]:
         """Get the habit entry from the dialog."""
         value = self.get_value()
-        print(f"DEBUG: get_entry called with value: {value} (type: {type(value)})")
+        logging.debug("get_entry called with value: %r (type: %s)", value, type(value))
 
         # Validate value
         if self.habit.habit_type == HabitType.BOOLEAN:
@@ -228,18 +264,20 @@ class HabitEntryDialog(QDialog):
             pass
         elif self.habit.habit_type == HabitType.DURATION:
             if value <= 0:
-                print("DEBUG: Duration validation failed - value <= 0")
+                logging.debug("Duration validation failed - value %s <= 0", value)
                 return None  # Duration must be positive
         elif self.habit.habit_type == HabitType.UNITS:
             if value < 0:
-                print("DEBUG: Units validation failed - value < 0")
+                logging.debug("Units validation failed - value %s < 0", value)
                 return None  # Units must be non-negative
         elif self.habit.habit_type == HabitType.REAL_NUMBER:
             # Real numbers can be negative unless constrained
             # Check min/max constraints if set
             if self.habit.min_value is not None and value < self.habit.min_value:
-                print(
-                    f"DEBUG: Real number validation failed - value {value} < min {self.habit.min_value}"
+                logging.debug(
+                    "Real number validation failed - value %s < min %s",
+                    value,
+                    self.habit.min_value,
                 )
                 return None  # Value below minimum
             if (
@@ -247,22 +285,26 @@ class HabitEntryDialog(QDialog):
                 and self.habit.max_value > 0
                 and value > self.habit.max_value
             ):
-                print(
-                    f"DEBUG: Real number validation failed - value {value} > max {self.habit.max_value}"
+                logging.debug(
+                    "Real number validation failed - value %s > max %s",
+                    value,
+                    self.habit.max_value,
                 )
                 return None  # Value above maximum
         elif self.habit.habit_type == HabitType.RATING:
             if not (1 <= value <= self.habit.rating_scale):
-                print(
-                    f"DEBUG: Rating validation failed - value {value} not in range 1-{self.habit.rating_scale}"
+                logging.debug(
+                    "Rating validation failed - value %s not in range 1-%s",
+                    value,
+                    self.habit.rating_scale,
                 )
                 return None  # Rating must be within scale
         elif self.habit.habit_type == HabitType.COUNT:
             if value < 0:
-                print("DEBUG: Count validation failed - value < 0")
+                logging.debug("Count validation failed - value %s < 0", value)
                 return None  # Count must be non-negative
 
-        print(f"DEBUG: Validation passed, creating entry with value: {value}")
+        logging.debug("Validation passed, creating entry with value: %s", value)
         return HabitEntry(
             id=0,  # Will be set by database
             habit_id=self.habit.id,
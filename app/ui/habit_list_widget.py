@@ -5,6 +5,8 @@ This module provides a widget for displaying and managing habits
 with various tracking types and entry management.
 """
 
+import logging
+from dataclasses import replace
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -13,7 +15,6 @@ from PySide6.QtWidgets import (
     QPushButton,
     QListWidget,
     QListWidgetItem,
-    QFrame,
     QScrollArea,
     QSpinBox,
     QDoubleSpinBox,
@@ -29,14 +30,110 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QGridLayout,
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QDate
-from PySide6.QtGui import QFont, QColor, QPalette
+from PySide6.QtCore import Qt, Signal, QTimer, QDate, QSize
+from PySide6.QtGui import QFont, QFontMetrics, QColor, QPalette, QPainter
 from datetime import datetime, date, timedelta
 from typing import List, Optional, Union
 from app.models.habit import Habit, HabitEntry, HabitType, HabitFrequency
 from app.ui.habit_dialog import HabitDialog
 from app.ui.habit_entry_dialog import HabitEntryDialog
 
+# Size of a habit row whose widget hasn't been built yet, about that of a row
+# without description or tags
+_PLACEHOLDER_ROW_SIZE = QSize(0, 90)
+
+
+class HabitColorDot(QWidget):
+    """Round habit color indicator, painted directly rather than styled."""
+
+    def __init__(self, color: str, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(16, 16)
+        self.color = QColor(color)
+
+    def set_color(self, color: str):
+        """Change the color of the dot."""
+        color = QColor(color)
+        if color != self.color:
+            self.color = color
+            self.update()
+
+    def paintEvent(self, event):
+        """Paint the dot in the habit color."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.color)
+        painter.drawEllipse(self.rect())
+
+
+class TagStripWidget(QWidget):
+    """Row of habit tag pills, all painted by one widget."""
+
+    BACKGROUND = QColor("#2d2d30")
+    PADDING_X = 6
+    PADDING_Y = 2
+    SPACING = 8
+    RADIUS = 3
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tags: List[str] = []
+        font = self.font()
+        font.setPixelSize(9)
+        self.setFont(font)
+
+    def set_tags(self, tags: List[str]):
+        """Change the tags shown in the strip."""
+        tags = list(tags)
+        if tags != self.tags:
+            self.tags = tags
+            self.updateGeometry()
+            self.update()
+
+    def pill_height(self) -> int:
+        """Get the height of a single tag pill."""
+        return QFontMetrics(self.font()).height() + 2 * self.PADDING_Y
+
+    def sizeHint(self) -> QSize:
+        """Get the size needed to show every tag."""
+        metrics = QFontMetrics(self.font())
+        width = sum(
+            metrics.horizontalAdvance(tag) + 2 * self.PADDING_X for tag in self.tags
+        )
+        width += self.SPACING * max(len(self.tags) - 1, 0)
+        return QSize(width, self.pill_height())
+
+    def minimumSizeHint(self) -> QSize:
+        """Keep every tag visible rather than letting the layout squeeze them."""
+        return self.sizeHint()
+
+    def paintEvent(self, event):
+        """Paint every tag pill in one pass."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        metrics = QFontMetrics(self.font())
+        height = self.pill_height()
+        top = (self.height() - height) // 2
+        text_color = self.palette().color(QPalette.WindowText)
+
+        x = 0
+        for tag in self.tags:
+            width = metrics.horizontalAdvance(tag) + 2 * self.PADDING_X
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.BACKGROUND)
+            painter.drawRoundedRect(x, top, width, height, self.RADIUS, self.RADIUS)
+            painter.setPen(text_color)
+            painter.drawText(
+                x + self.PADDING_X,
+                top + self.PADDING_Y,
+                width - 2 * self.PADDING_X,
+                height - 2 * self.PADDING_Y,
+                Qt.AlignLeft | Qt.AlignVCenter,
+                tag,
+            )
+            x += width + self.SPACING
+
 
 class HabitItemWidget(QWidget):
     """Widget for displaying a single habit item."""
@@ -45,14 +142,30 @@ class HabitItemWidget(QWidget):
     habit_updated = Signal(Habit)  # Emitted when habit is updated
     habit_deleted = Signal(int)  # Emitted when habit is deleted
 
+    # Style sheets shared by every habit row
+    _DESC_STYLE = "color: #888888; font-size: 10px;"
+    _STREAK_STYLE = "color: #007bff; font-size: 10px;"
+    _STATUS_STYLE = "color: %s; font-weight: bold;"
+
     def __init__(self, habit: Habit, parent=None):
         super().__init__(parent)
         self.habit = habit
+        # Color of the today status label, restyled only when it changes
+        self.status_color = None
+
+        # Refresh the display once per event loop pass however often it's asked
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(0)
+        self.update_timer.timeout.connect(self._update_display_now)
+
         self.setup_ui()
-        self.update_display()
+        self._update_display_now()
 
     def setup_ui(self):
         """Set up the user interface."""
+        self.built_layout_key = self.layout_key(self.habit)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 8, 10, 8)
         layout.setSpacing(8)
@@ -61,11 +174,7 @@ class HabitItemWidget(QWidget):
         info_layout = QHBoxLayout()
 
         # Color indicator
-        self.color_indicator = QFrame()
-        self.color_indicator.setFixedSize(16, 16)
-        self.color_indicator.setStyleSheet(
-            f"background-color: {self.habit.color}; border-radius: 8px;"
-        )
+        self.color_indicator = HabitColorDot(self.habit.color)
         info_layout.addWidget(self.color_indicator)
 
         # Habit name and description
@@ -77,7 +186,7 @@ class HabitItemWidget(QWidget):
         if self.habit.description:
             self.desc_label = QLabel(self.habit.description)
             self.desc_label.setWordWrap(True)
-            self.desc_label.setStyleSheet("color: #888888; font-size: 10px;")
+            self.desc_label.setStyleSheet(self._DESC_STYLE)
             name_layout.addWidget(self.desc_label)
 
         info_layout.addLayout(name_layout)
@@ -94,7 +203,7 @@ class HabitItemWidget(QWidget):
         # Streak info
         self.streak_label = QLabel()
         self.streak_label.setAlignment(Qt.AlignRight)
-        self.streak_label.setStyleSheet("color: #007bff; font-size: 10px;")
+        self.streak_label.setStyleSheet(self._STREAK_STYLE)
         status_layout.addWidget(self.streak_label)
 
         info_layout.addLayout(status_layout)
@@ -104,12 +213,9 @@ class HabitItemWidget(QWidget):
         if self.habit.tags:
             tags_layout = QHBoxLayout()
             tags_layout.addWidget(QLabel("Tags:"))
-            for tag in self.habit.tags:
-                tag_label = QLabel(tag)
-                tag_label.setStyleSheet(
-                    "background-color: #2d2d30; padding: 2px 6px; border-radius: 3px; font-size: 9px;"
-                )
-                tags_layout.addWidget(tag_label)
+            self.tag_strip = TagStripWidget()
+            self.tag_strip.set_tags(self.habit.tags)
+            tags_layout.addWidget(self.tag_strip)
             tags_layout.addStretch()
             layout.addLayout(tags_layout)
 
@@ -156,6 +262,11 @@ class HabitItemWidget(QWidget):
         self.setMinimumHeight(120)
 
     def update_display(self):
+        """Schedule a display update, merging requests made in a burst."""
+        if not self.update_timer.isActive():
+            self.update_timer.start()
+
+    def _update_display_now(self):
         """Update the display with current habit data."""
         # Update today's status
         today_value = self.habit.get_today_value()
@@ -175,7 +286,9 @@ class HabitItemWidget(QWidget):
             status_color = "#6c757d"
 
         self.today_status.setText(status_text)
-        self.today_status.setStyleSheet(f"color: {status_color}; font-weight: bold;")
+        if status_color != self.status_color:
+            self.status_color = status_color
+            self.today_status.setStyleSheet(self._STATUS_STYLE % status_color)
 
         # Update streak
         streak = self.habit.get_streak_days()
@@ -184,20 +297,53 @@ class HabitItemWidget(QWidget):
         else:
             self.streak_label.setText("No streak")
 
+    @staticmethod
+    def layout_key(habit: Habit) -> tuple:
+        """Get the habit fields that decide which child widgets are created."""
+        return (
+            habit.habit_type,
+            habit.rating_scale,
+            bool(habit.description),
+            bool(habit.tags),
+        )
+
+    def needs_rebuild(self, habit: Habit) -> bool:
+        """Check whether a habit needs different child widgets than the built ones."""
+        return self.layout_key(habit) != self.built_layout_key
+
+    def set_habit(self, habit: Habit):
+        """Show new data for the habit, reusing the existing child widgets."""
+        self.habit = habit
+        self.name_label.setText(habit.name)
+        if habit.description:
+            self.desc_label.setText(habit.description)
+        if habit.tags:
+            self.tag_strip.set_tags(habit.tags)
+        self.color_indicator.set_color(habit.color)
+        self.update_display()
+
+    def show_entry(self, entry: HabitEntry):
+        """Show a new entry right away, before it has been saved."""
+        self.set_habit(
+            replace(self.habit, recent_entries=[*self.habit.recent_entries, entry])
+        )
+
     def add_entry(self):
         """Open dialog to add a new habit entry."""
         dialog = HabitEntryDialog(self.habit, self)
         if dialog.exec() == QDialog.Accepted:
             entry = dialog.get_entry()
-            print(f"DEBUG: Dialog accepted, entry: {entry}")
+            logging.debug("Dialog accepted, entry: %s", entry)
             if entry:
-                print(
-                    f"DEBUG: Emitting entry_added signal with habit: {self.habit.name}, entry value: {entry.value}"
+                logging.debug(
+                    "Emitting entry_added signal with habit: %s, entry value: %s",
+                    self.habit.name,
+                    entry.value,
                 )
                 self.entry_added.emit(self.habit, entry)
-                self.update_display()
+                self.show_entry(entry)
             else:
-                print("DEBUG: Entry is None, not emitting signal")
+                logging.debug("Entry is None, not emitting signal")
 
     def quick_add_entry(self, value: Union[bool, int, float]):
         """Quickly add an entry with the given value."""
@@ -223,7 +369,7 @@ class HabitItemWidget(QWidget):
             notes="",
         )
         self.entry_added.emit(self.habit, entry)
-        self.update_display()
+        self.show_entry(entry)
 
     def quick_rating_entry(self, rating_text: str):
         """Quickly add a rating entry."""
@@ -266,6 +412,9 @@ class HabitListWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.habits = []
+        # Habit id -> (list item, item widget) for the rows currently shown,
+        # the widget is None until the row is first scrolled into view
+        self.habit_items = {}
         self.setup_ui()
 
     def setup_ui(self):
@@ -294,6 +443,25 @@ class HabitListWidget(QWidget):
         self.habits_list.setVerticalScrollMode(QListWidget.ScrollPerPixel)
         layout.addWidget(self.habits_list)
 
+        # Build row widgets once the list has settled after adds and scrolling
+        self.row_build_timer = QTimer(self)
+        self.row_build_timer.setSingleShot(True)
+        self.row_build_timer.setInterval(0)
+        self.row_build_timer.timeout.connect(self.build_visible_rows)
+        self.habits_list.verticalScrollBar().valueChanged.connect(
+            lambda _value: self.row_build_timer.start()
+        )
+
+    def showEvent(self, event):
+        """Build the widgets of the rows in view when the list is shown."""
+        super().showEvent(event)
+        self.row_build_timer.start()
+
+    def resizeEvent(self, event):
+        """Build the widgets of rows brought into view by a resize."""
+        super().resizeEvent(event)
+        self.row_build_timer.start()
+
     def set_habits(self, habits: List[Habit]):
         """Set the list of habits to display."""
         self.habits = habits
@@ -301,20 +469,62 @@ class HabitListWidget(QWidget):
 
     def refresh_display(self):
         """Refresh the display of habits."""
-        self.habits_list.clear()
-
+        # Lay out and paint the list once, after all rows are added
+        self.habits_list.setUpdatesEnabled(False)
+        self.habits_list.blockSignals(True)
+        try:
+            self.habits_list.clear()
+            self.habit_items.clear()
+
+            for habit in self.habits:
+                self.add_habit_item(habit)
+        finally:
+            self.habits_list.blockSignals(False)
+            self.habits_list.setUpdatesEnabled(True)
+
+    def create_habit_widget(self, habit: Habit) -> HabitItemWidget:
+        """Create the widget for one habit, connected to the list's signals."""
+        habit_widget = HabitItemWidget(habit)
+
+        # Connect signals
+        habit_widget.entry_added.connect(self.entry_added.emit)
+        habit_widget.habit_updated.connect(self.habit_updated.emit)
+        habit_widget.habit_deleted.connect(self.habit_deleted.emit)
+
+        return habit_widget
+
+    def add_habit_item(self, habit: Habit):
+        """Add a row for a habit at the end of the list."""
+        item = QListWidgetItem()
+        item.setSizeHint(_PLACEHOLDER_ROW_SIZE)
+        self.habits_list.addItem(item)
+        self.habit_items[habit.id] = (item, None)
+        self.row_build_timer.start()
+
+    def build_visible_rows(self):
+        """Create the item widgets of rows in view that don't have one yet."""
+        self.habits_list.doItemsLayout()
+        viewport_rect = self.habits_list.viewport().rect()
+
+        built = False
+        # Rows line up with self.habits, top to bottom
         for habit in self.habits:
-            item = QListWidgetItem()
-            habit_widget = HabitItemWidget(habit)
-
-            # Connect signals
-            habit_widget.entry_added.connect(self.entry_added.emit)
-            habit_widget.habit_updated.connect(self.habit_updated.emit)
-            habit_widget.habit_deleted.connect(self.habit_deleted.emit)
+            item, habit_widget = self.habit_items[habit.id]
+            item_rect = self.habits_list.visualItemRect(item)
+            if item_rect.top() > viewport_rect.bottom():
+                break
+            if habit_widget is not None or item_rect.bottom() < viewport_rect.top():
+                continue
 
-            self.habits_list.addItem(item)
+            habit_widget = self.create_habit_widget(habit)
             self.habits_list.setItemWidget(item, habit_widget)
             item.setSizeHint(habit_widget.sizeHint())
+            self.habit_items[habit.id] = (item, habit_widget)
+            built = True
+
+        if built:
+            # Built rows can be taller than their placeholders, check again
+            self.row_build_timer.start()
 
     def add_habit(self):
         """Open dialog to create a new habit."""
@@ -327,7 +537,7 @@ class HabitListWidget(QWidget):
     def add_habit_to_list(self, habit: Habit):
         """Add a new habit to the display."""
         self.habits.append(habit)
-        self.refresh_display()
+        self.add_habit_item(habit)
 
     def update_habit_in_list(self, habit: Habit):
         """Update a habit in the display."""
@@ -335,9 +545,41 @@ class HabitListWidget(QWidget):
             if existing_habit.id == habit.id:
                 self.habits[i] = habit
                 break
-        self.refresh_display()
+
+        if habit.id not in self.habit_items:
+            self.refresh_display()
+            return
+
+        item, habit_widget = self.habit_items[habit.id]
+        if habit_widget is None:
+            # Built from the updated habit once scrolled into view
+            return
+        if habit_widget.needs_rebuild(habit):
+            # Replacing the item widget deletes the old one
+            habit_widget = self.create_habit_widget(habit)
+            self.habits_list.setItemWidget(item, habit_widget)
+            self.habit_items[habit.id] = (item, habit_widget)
+        else:
+            habit_widget.set_habit(habit)
+        item.setSizeHint(habit_widget.sizeHint())
+
+    def remove_entry_from_list(self, habit_id: int, entry: HabitEntry):
+        """Take an entry shown before it was saved back out of a habit row."""
+        _item, habit_widget = self.habit_items.get(habit_id, (None, None))
+        if habit_widget is None:
+            # Unsaved entries are only ever shown by built rows
+            return
+        habit = habit_widget.habit
+        entries = [shown for shown in habit.recent_entries if shown is not entry]
+        if len(entries) != len(habit.recent_entries):
+            self.update_habit_in_list(replace(habit, recent_entries=entries))
 
     def remove_habit_from_list(self, habit_id: int):
         """Remove a habit from the display."""
         self.habits = [h for h in self.habits if h.id != habit_id]
-        self.refresh_display()
+
+        entry = self.habit_items.pop(habit_id, None)
+        if entry is not None:
+            item = entry[0]
+            self.habits_list.removeItemWidget(item)
+            self.habits_list.takeItem(self.habits_list.row(item))
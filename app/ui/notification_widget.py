@@ -5,6 +5,7 @@ This module provides a toast-style notification system that displays
 non-intrusive notifications for success and error messages.
 """
 
+from functools import partial
 from typing import Optional
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
 from PySide6.QtCore import (
@@ -14,7 +15,7 @@ from PySide6.QtCore import (
     QEasingCurve,
     QRect,
 )
-from PySide6.QtGui import QFont, QPalette, QColor, QPainter, QPainterPath
+from PySide6.QtGui import QFont, QPalette, QColor, QPainter, QPainterPath, QPixmap
 
 
 class NotificationWidget(QWidget):
@@ -25,9 +26,31 @@ class NotificationWidget(QWidget):
     and can be manually dismissed.
     """
 
+    _SUCCESS_STYLE = """
+            QWidget#notification-content {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #4CAF50, stop:1 #45a049);
+                border-radius: 8px;
+                border: 1px solid #4CAF50;
+            }
+        """
+
+    _ERROR_STYLE = """
+            QWidget#notification-content {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #f44336, stop:1 #d32f2f);
+                border-radius: 8px;
+                border: 1px solid #f44336;
+            }
+        """
+
     def __init__(self, parent=None):
         """Initialize the notification widget."""
         super().__init__(parent)
+        # Shadow rendered for the current size, painted on every frame
+        self.shadow_pixmap = None
+        # "success" or "error", the style sheets are only set when it changes
+        self.current_style = None
         self.setup_ui()
         self.setup_animations()
 
@@ -58,6 +81,9 @@ class NotificationWidget(QWidget):
         self.icon_label = QLabel()
         self.icon_label.setFixedSize(24, 24)
         self.icon_label.setAlignment(Qt.AlignCenter)
+        self.icon_label.setStyleSheet(
+            "color: white; font-size: 16px; font-weight: bold;"
+        )
         content_layout.addWidget(self.icon_label)
 
         # Text layout
@@ -67,6 +93,7 @@ class NotificationWidget(QWidget):
         self.title_label = QLabel()
         self.title_label.setFont(QFont("Arial", 10, QFont.Bold))
         self.title_label.setWordWrap(True)
+        self.title_label.setStyleSheet("color: white;")
         text_layout.addWidget(self.title_label)
 
         self.message_label = QLabel()
@@ -124,39 +151,19 @@ class NotificationWidget(QWidget):
 
     def set_success_style(self):
         """Set the success notification style (green)."""
-        self.content_widget.setStyleSheet(
-            """
-            QWidget#notification-content {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4CAF50, stop:1 #45a049);
-                border-radius: 8px;
-                border: 1px solid #4CAF50;
-            }
-        """
-        )
-        self.title_label.setStyleSheet("color: white;")
+        if self.current_style == "success":
+            return
+        self.current_style = "success"
+        self.content_widget.setStyleSheet(self._SUCCESS_STYLE)
         self.icon_label.setText("✓")
-        self.icon_label.setStyleSheet(
-            "color: white; font-size: 16px; font-weight: bold;"
-        )
 
     def set_error_style(self):
         """Set the error notification style (red)."""
-        self.content_widget.setStyleSheet(
-            """
-            QWidget#notification-content {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f44336, stop:1 #d32f2f);
-                border-radius: 8px;
-                border: 1px solid #f44336;
-            }
-        """
-        )
-        self.title_label.setStyleSheet("color: white;")
+        if self.current_style == "error":
+            return
+        self.current_style = "error"
+        self.content_widget.setStyleSheet(self._ERROR_STYLE)
         self.icon_label.setText("✗")
-        self.icon_label.setStyleSheet(
-            "color: white; font-size: 16px; font-weight: bold;"
-        )
 
     def show_success(self, title: str, message: str = "", duration: int = 4000):
         """Show a success notification."""
@@ -170,6 +177,9 @@ class NotificationWidget(QWidget):
 
     def show_notification(self, title: str, message: str = "", duration: int = 4000):
         """Show a notification with the given title and message."""
+        # A reused notification may still be fading or waiting to hide
+        self.stop_animations()
+
         self.title_label.setText(title)
         self.message_label.setText(message)
         self.message_label.setVisible(bool(message))
@@ -206,9 +216,25 @@ class NotificationWidget(QWidget):
         self.auto_hide_timer.stop()
         self.fade_out_animation.start()
 
-    def paintEvent(self, event):
-        """Custom paint event for rounded corners and shadow."""
-        painter = QPainter(self)
+    def stop_animations(self):
+        """Stop any running fade and the auto-hide timer, e.g. before reuse."""
+        self.auto_hide_timer.stop()
+        self.fade_in_animation.stop()
+        self.fade_out_animation.stop()
+
+    def resizeEvent(self, event):
+        """Drop the rendered shadow so it is redrawn for the new size."""
+        super().resizeEvent(event)
+        self.shadow_pixmap = None
+
+    def render_shadow(self) -> QPixmap:
+        """Render the rounded shadow for the current size into a pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Create shadow effect
@@ -218,6 +244,19 @@ class NotificationWidget(QWidget):
             painter.setPen(Qt.NoPen)
             painter.setBrush(shadow_color)
             painter.drawRoundedRect(self.rect().adjusted(i, i, -i, -i), 8, 8)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        """Custom paint event for rounded corners and shadow."""
+        if (
+            self.shadow_pixmap is None
+            or self.shadow_pixmap.devicePixelRatio() != self.devicePixelRatioF()
+        ):
+            self.shadow_pixmap = self.render_shadow()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.shadow_pixmap)
 
 
 class NotificationManager:
@@ -235,6 +274,16 @@ class NotificationManager:
         self.max_notifications = 3
         self.notification_spacing = 10
 
+        # Hidden notifications ready to be shown again, at most
+        # max_notifications widgets are ever created
+        self.free_notifications = []
+
+        # Reposition once per event loop pass after notifications come and go
+        self.reposition_timer = QTimer()
+        self.reposition_timer.setSingleShot(True)
+        self.reposition_timer.setInterval(0)
+        self.reposition_timer.timeout.connect(self._reposition_notifications)
+
     def show_success(self, title: str, message: str = "", duration: int = 4000):
         """Show a success notification."""
         self._show_notification("success", title, message, duration)
@@ -247,13 +296,7 @@ class NotificationManager:
         self, notification_type: str, title: str, message: str, duration: int
     ):
         """Show a notification of the specified type."""
-        # Create new notification
-        notification = NotificationWidget(self.parent)
-
-        # Connect to removal signal
-        notification.fade_out_animation.finished.connect(
-            lambda: self._remove_notification(notification)
-        )
+        notification = self._take_notification()
 
         # Show notification
         if notification_type == "success":
@@ -265,19 +308,36 @@ class NotificationManager:
         self.notifications.append(notification)
 
         # Reposition all notifications
-        self._reposition_notifications()
+        self._schedule_reposition()
+
+    def _take_notification(self) -> NotificationWidget:
+        """Get a notification widget to show, reusing hidden or old ones."""
+        if self.free_notifications:
+            return self.free_notifications.pop()
+
+        if len(self.notifications) >= self.max_notifications:
+            # Reuse the oldest notification still on screen
+            return self.notifications.pop(0)
+
+        notification = NotificationWidget(self.parent)
 
-        # Remove oldest if too many
-        if len(self.notifications) > self.max_notifications:
-            oldest = self.notifications.pop(0)
-            oldest.hide_notification()
+        # Connect to removal signal, once for the lifetime of the widget
+        notification.fade_out_animation.finished.connect(
+            partial(self._remove_notification, notification)
+        )
+        return notification
 
     def _remove_notification(self, notification: NotificationWidget):
-        """Remove a notification from the list."""
+        """Remove a faded out notification from the list, keeping it for reuse."""
         if notification in self.notifications:
             self.notifications.remove(notification)
-            notification.deleteLater()
-            self._reposition_notifications()
+            self.free_notifications.append(notification)
+            self._schedule_reposition()
+
+    def _schedule_reposition(self):
+        """Reposition the notifications once the current burst of changes is done."""
+        if not self.reposition_timer.isActive():
+            self.reposition_timer.start()
 
     def _reposition_notifications(self):
         """Reposition all active notifications."""
@@ -2,6 +2,7 @@
 Pomodoro settings dialog for the timer widget.
 """
 
+import logging
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -40,8 +41,18 @@ class PomodoroSettingsDialog(QDialog):
         self.work_count_down = work_count_down
         self.short_break_count_down = short_break_count_down
         self.long_break_count_down = long_break_count_down
-        print(
-            f"PomodoroSettingsDialog initialized with: work={work_duration}m, short={short_break_duration}m, long={long_break_duration}m, autostart_breaks={autostart_breaks}, autostart_work={autostart_work}, work_count_down={work_count_down}, short_break_count_down={short_break_count_down}, long_break_count_down={long_break_count_down}"
+        logging.debug(
+            "PomodoroSettingsDialog initialized with: work=%sm, short=%sm, long=%sm, "
+            "autostart_breaks=%s, autostart_work=%s, work_count_down=%s, "
+            "short_break_count_down=%s, long_break_count_down=%s",
+            work_duration,
+            short_break_duration,
+            long_break_duration,
+            autostart_breaks,
+            autostart_work,
+            work_count_down,
+            short_break_count_down,
+            long_break_count_down,
         )
         self.setup_ui()
         self.setup_behavior()
@@ -162,7 +173,7 @@ class PomodoroSettingsDialog(QDialog):
             "short_break_count_down": self.short_break_count_down_checkbox.isChecked(),
             "long_break_count_down": self.long_break_count_down_checkbox.isChecked(),
         }
-        print(f"PomodoroSettingsDialog.get_settings() returning: {settings}")
+        logging.debug("PomodoroSettingsDialog.get_settings() returning: %s", settings)
         return settings
 
     def set_settings(
@@ -29,6 +29,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QDate
 from PySide6.QtGui import QFont, QColor
 from app.models.project import Project
+from app.models.tag import TagView
 from app.ui.base_dialog import BaseDialog
 
 
@@ -240,9 +241,9 @@ class ProjectDialog(BaseDialog):
 
         # Tags
         for tag in self.project.tags:
-            # Handle both old string format and new dict format
-            if isinstance(tag, dict):
-                self.add_tag_to_list(tag["name"])
+            # Handle both old string format and TagView format
+            if isinstance(tag, TagView):
+                self.add_tag_to_list(tag.name)
             else:
                 self.add_tag_to_list(tag)
 
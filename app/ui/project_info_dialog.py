@@ -22,6 +22,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 from app.models.project import Project
+from app.models.tag import TagView
 from app.ui.base_dialog import BaseDialog
 
 
@@ -187,9 +188,9 @@ class ProjectInfoDialog(BaseDialog):
         # Tags
         if self.project.tags:
             for tag in self.project.tags:
-                # Handle both old string format and new dict format
-                if isinstance(tag, dict):
-                    self.add_tag_to_list(tag["name"])
+                # Handle both old string format and TagView format
+                if isinstance(tag, TagView):
+                    self.add_tag_to_list(tag.name)
                 else:
                     self.add_tag_to_list(tag)
         else:
@@ -190,10 +190,10 @@ class ProjectItemWidget(QWidget):
 
             # Display first 3 tags with colors
             for i, tag in enumerate(self.project.tags[:3]):
-                tag_label = QLabel(tag["name"])
+                tag_label = QLabel(tag.name)
                 tag_label.setFont(QFont("Arial", 8))
                 tag_label.setStyleSheet(
-                    f"color: white; background-color: {tag['color']}; "
+                    f"color: white; background-color: {tag.color}; "
                     f"padding: 2px 6px; border-radius: 8px;"
                 )
                 tags_container_layout.addWidget(tag_label)
@@ -30,6 +30,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QDate
 from PySide6.QtGui import QFont, QColor
 from app.models.task import Task
+from app.models.tag import TagView
 from app.ui.base_dialog import BaseDialog
 
 
@@ -243,9 +244,9 @@ class TaskDialog(BaseDialog):
 
         # Tags
         for tag in self.task.tags:
-            # Handle both old string format and new dict format
-            if isinstance(tag, dict):
-                self.add_tag_to_list(tag["name"])
+            # Handle both old string format and TagView format
+            if isinstance(tag, TagView):
+                self.add_tag_to_list(tag.name)
             else:
                 self.add_tag_to_list(tag)
 
@@ -197,10 +197,10 @@ class TaskItemWidget(QWidget):
 
             # Display first 2 tags with colors
             for i, tag in enumerate(self.task.tags[:2]):
-                tag_label = QLabel(tag["name"])
+                tag_label = QLabel(tag.name)
                 tag_label.setFont(QFont("Arial", 8))
                 tag_label.setStyleSheet(
-                    f"color: white; background-color: {tag['color']}; "
+                    f"color: white; background-color: {tag.color}; "
                     f"padding: 2px 6px; border-radius: 8px;"
                 )
                 tags_container_layout.addWidget(tag_label)
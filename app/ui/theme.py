@@ -8,8 +8,6 @@ including PySide6 widgets and matplotlib charts.
 from PySide6.QtGui import QPalette, QColor, QFont
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 from matplotlib import rcParams
 
 
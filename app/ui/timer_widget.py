@@ -2,6 +2,7 @@
 Timer widget for the Cando application.
 """
 
+import logging
 from datetime import datetime, timedelta
 from typing import Optional
 from PySide6.QtWidgets import (
@@ -88,8 +89,8 @@ class TimerWidget(QWidget):
         self.update_display()
         self.update_start_button_state()  # Set initial button state
 
-        # Print initial settings for debugging
-        print("=== Initial Timer Widget Settings ===")
+        # Log initial settings for debugging
+        logging.debug("=== Initial Timer Widget Settings ===")
         self.print_current_settings()
 
     def setup_ui(self):
@@ -304,7 +305,7 @@ class TimerWidget(QWidget):
     def on_mode_changed(self, button):
         """Handle timer mode changes."""
         mode = self.get_current_mode()
-        print(f"Timer mode changed to: {mode}")
+        logging.debug("Timer mode changed to: %s", mode)
 
         # Enable/disable settings button based on mode
         self.settings_button.setEnabled(mode in ["countdown", "pomodoro"])
@@ -320,8 +321,8 @@ class TimerWidget(QWidget):
         mode = self.get_current_mode()
 
         if mode == "countdown":
-            print(
-                "Opening countdown dialog with values:",
+            logging.debug(
+                "Opening countdown dialog with values: %s %s",
                 self.countdown_minutes,
                 self.countdown_seconds,
             )
@@ -336,8 +337,8 @@ class TimerWidget(QWidget):
                 self.countdown_minutes = settings["minutes"]
                 self.countdown_seconds = settings["seconds"]
                 self.countdown_count_down = settings["count_down"]
-                print(
-                    "Countdown settings now:",
+                logging.debug(
+                    "Countdown settings now: %s %s",
                     self.countdown_minutes,
                     self.countdown_seconds,
                 )
@@ -345,8 +346,8 @@ class TimerWidget(QWidget):
                 self.print_current_settings()
 
         elif mode == "pomodoro":
-            print(
-                "Opening pomodoro dialog with values:",
+            logging.debug(
+                "Opening pomodoro dialog with values: %s %s %s %s %s",
                 self.work_duration,
                 self.short_break_duration,
                 self.long_break_duration,
@@ -374,8 +375,8 @@ class TimerWidget(QWidget):
                 self.work_count_down = settings["work_count_down"]
                 self.short_break_count_down = settings["short_break_count_down"]
                 self.long_break_count_down = settings["long_break_count_down"]
-                print(
-                    "Pomodoro settings now:",
+                logging.debug(
+                    "Pomodoro settings now: %s %s %s %s %s",
                     self.work_duration,
                     self.short_break_duration,
                     self.long_break_duration,
@@ -408,23 +409,32 @@ class TimerWidget(QWidget):
         self.db_service.save_timer_settings(settings)
 
     def print_current_settings(self):
-        """Print current settings for debugging."""
-        print("=== Current Settings ===")
-        print(
-            f"Countdown: {self.countdown_minutes}m {self.countdown_seconds}s (count down: {self.countdown_count_down})"
+        """Log current settings for debugging."""
+        logging.debug("=== Current Settings ===")
+        logging.debug(
+            "Countdown: %sm %ss (count down: %s)",
+            self.countdown_minutes,
+            self.countdown_seconds,
+            self.countdown_count_down,
         )
-        print(
-            f"Pomodoro Work: {self.work_duration}m (count down: {self.work_count_down})"
+        logging.debug(
+            "Pomodoro Work: %sm (count down: %s)",
+            self.work_duration,
+            self.work_count_down,
         )
-        print(
-            f"Pomodoro Short Break: {self.short_break_duration}m (count down: {self.short_break_count_down})"
+        logging.debug(
+            "Pomodoro Short Break: %sm (count down: %s)",
+            self.short_break_duration,
+            self.short_break_count_down,
         )
-        print(
-            f"Pomodoro Long Break: {self.long_break_duration}m (count down: {self.long_break_count_down})"
+        logging.debug(
+            "Pomodoro Long Break: %sm (count down: %s)",
+            self.long_break_duration,
+            self.long_break_count_down,
         )
-        print(f"Autostart Breaks: {self.autostart_breaks}")
-        print(f"Autostart Work: {self.autostart_work}")
-        print("=======================")
+        logging.debug("Autostart Breaks: %s", self.autostart_breaks)
+        logging.debug("Autostart Work: %s", self.autostart_work)
+        logging.debug("=======================")
 
     def get_current_mode(self):
         """Get the currently selected timer mode from radio buttons."""
@@ -483,8 +493,8 @@ class TimerWidget(QWidget):
         else:
             # Start a new timer
             if mode == "pomodoro":
-                print(
-                    "Starting pomodoro with values:",
+                logging.debug(
+                    "Starting pomodoro with values: %s %s %s",
                     self.work_duration,
                     self.short_break_duration,
                     self.long_break_duration,
@@ -501,13 +511,13 @@ class TimerWidget(QWidget):
                     long_break_count_down=self.long_break_count_down,
                 )
             elif mode == "countdown":
-                print(
-                    "Starting countdown with values:",
+                logging.debug(
+                    "Starting countdown with values: %s %s",
                     self.countdown_minutes,
                     self.countdown_seconds,
                 )
                 duration = self.countdown_minutes * 60 + self.countdown_seconds
-                print(f"Calculated countdown duration: {duration} seconds")
+                logging.debug("Calculated countdown duration: %s seconds", duration)
                 if duration <= 0:
                     if self.notification_manager:
                         self.notification_manager.show_error(
@@ -539,7 +549,7 @@ class TimerWidget(QWidget):
                 self.status_label.setText(f"Running: {self.current_task.name}")
 
             self.timer_started.emit(timer)
-            print("Timer started successfully with mode:", mode)
+            logging.debug("Timer started successfully with mode: %s", mode)
 
     def pause_timer(self):
         """Pause the timer."""
@@ -860,8 +870,8 @@ class TimerWidget(QWidget):
                 )
             return
 
-        print(
-            "Starting work session with values:",
+        logging.debug(
+            "Starting work session with values: %s %s %s",
             self.work_duration,
             self.short_break_duration,
             self.long_break_duration,
@@ -895,8 +905,8 @@ class TimerWidget(QWidget):
                 )
             return
 
-        print(
-            "Starting break session with values:",
+        logging.debug(
+            "Starting break session with values: %s %s %s",
             self.work_duration,
             self.short_break_duration,
             self.long_break_duration,
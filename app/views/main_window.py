@@ -54,9 +54,10 @@ from app.models.timer import Timer
 from app.models.habit import Habit, HabitEntry
 from app.services.database import DatabaseService
 from app.services.analytics import AnalyticsService
+from app.services.entry_writer import EntryWriter
 from app.controllers.timer_controller import TimerController
 from app.utils.fuzzy_search import fuzzy_search
-from app.models.tag import Tag
+from app.models.tag import Tag, TagView
 
 
 class MainWindow(QMainWindow):
@@ -572,6 +573,15 @@ class MainWindow(QMainWindow):
         """Set up the habits tab for managing habits."""
         layout = QVBoxLayout(self.habits_tab)
 
+        # Saves habit entries on a worker thread
+        self.entry_writer = EntryWriter(self.db_service, self)
+        self.entry_writer.entry_saved.connect(
+            self.on_habit_entry_saved, Qt.QueuedConnection
+        )
+        self.entry_writer.entry_failed.connect(
+            self.on_habit_entry_failed, Qt.QueuedConnection
+        )
+
         # Habit list widget
         self.habit_list_widget = HabitListWidget()
         self.habit_list_widget.habit_created.connect(self.on_habit_created)
@@ -1462,7 +1472,7 @@ class MainWindow(QMainWindow):
             filtered_projects = [
                 p
                 for p in filtered_projects
-                if any(tag["name"] in tag_filters for tag in p.tags)
+                if any(tag.name in tag_filters for tag in p.tags)
             ]
             after_count = len(filtered_projects)
             print(f"DEBUG: tag filter: {before_count} -> {after_count} projects")
@@ -1508,9 +1518,9 @@ class MainWindow(QMainWindow):
         project_times = self.analytics_service.get_time_by_project()
         self.project_chart.plot_time_by_project(project_times)
 
-        # Update productivity chart
+        # Update productivity chart, blitting when only the hours changed
         daily_hours = self.analytics_service.get_daily_productivity()
-        self.productivity_chart.plot_daily_productivity(daily_hours)
+        self.productivity_chart.stream_update(daily_hours)
 
         # Update timer type chart
         timer_stats = self.analytics_service.get_timer_type_stats()
@@ -1630,7 +1640,7 @@ class MainWindow(QMainWindow):
             filtered_tasks = [
                 t
                 for t in filtered_tasks
-                if any(tag["name"] in tag_filters for tag in t.tags)
+                if any(tag.name in tag_filters for tag in t.tags)
             ]
 
         # Apply fuzzy search if there's a search query
@@ -1686,12 +1696,15 @@ class MainWindow(QMainWindow):
             # Extract tags for separate handling
             tags = project_data.pop("tags", [])
 
-            # Create project
-            project = self.db_service.create_project(**project_data)
+            with self.db_service.unit_of_work():
+                # Create project
+                project = self.db_service.create_project(**project_data)
 
-            # Add tags separately (with cascading to tasks)
-            for tag in tags:
-                self.db_service.add_project_tag(project.id, tag, cascade_to_tasks=True)
+                # Add tags separately (with cascading to tasks)
+                for tag in tags:
+                    self.db_service.add_project_tag(
+                        project.id, tag, cascade_to_tasks=True
+                    )
 
             self.refresh_project_list()
             self.populate_project_tag_filter()  # Update project tag filter
@@ -1733,23 +1746,24 @@ class MainWindow(QMainWindow):
                 # Extract tags for separate handling
                 new_tags = project_data.pop("tags", [])
 
-                # Update project
-                updated_project = self.db_service.update_project(
-                    project.id, **project_data
-                )
-
-                # Update tags (remove old ones, add new ones with cascading)
-                for tag in project.tags:
-                    # Handle both old string format and new dict format
-                    tag_name = tag["name"] if isinstance(tag, dict) else tag
-                    self.db_service.remove_project_tag(
-                        project.id, tag_name, cascade_to_tasks=True
-                    )
-                for tag in new_tags:
-                    self.db_service.add_project_tag(
-                        project.id, tag, cascade_to_tasks=True
+                with self.db_service.unit_of_work():
+                    # Update project
+                    updated_project = self.db_service.update_project(
+                        project.id, **project_data
                     )
 
+                    # Update tags (remove old ones, add new ones with cascading)
+                    for tag in project.tags:
+                        # Handle both old string format and TagView format
+                        tag_name = tag.name if isinstance(tag, TagView) else tag
+                        self.db_service.remove_project_tag(
+                            project.id, tag_name, cascade_to_tasks=True
+                        )
+                    for tag in new_tags:
+                        self.db_service.add_project_tag(
+                            project.id, tag, cascade_to_tasks=True
+                        )
+
                 # Refresh both project list and task list to show updated tags
                 self.refresh_project_list()
                 if self.current_project_id == project.id:
@@ -1901,12 +1915,13 @@ class MainWindow(QMainWindow):
             # Extract tags for separate handling
             tags = task_data.pop("tags", [])
 
-            # Create task
-            task = self.db_service.create_task(**task_data)
+            with self.db_service.unit_of_work():
+                # Create task
+                task = self.db_service.create_task(**task_data)
 
-            # Add tags separately (with cascading to project)
-            for tag in tags:
-                self.db_service.add_task_tag(task.id, tag, cascade_to_project=True)
+                # Add tags separately (with cascading to project)
+                for tag in tags:
+                    self.db_service.add_task_tag(task.id, tag, cascade_to_project=True)
 
             # Refresh both task list and project list to show updated tags
             self.refresh_task_list(self.current_project_id)
@@ -1945,18 +1960,21 @@ class MainWindow(QMainWindow):
                 # Extract tags for separate handling
                 new_tags = task_data.pop("tags", [])
 
-                # Update task
-                updated_task = self.db_service.update_task(task.id, **task_data)
-
-                # Update tags (remove old ones, add new ones with cascading)
-                for tag in task.tags:
-                    # Handle both old string format and new dict format
-                    tag_name = tag["name"] if isinstance(tag, dict) else tag
-                    self.db_service.remove_task_tag(
-                        task.id, tag_name, cascade_to_project=True
-                    )
-                for tag in new_tags:
-                    self.db_service.add_task_tag(task.id, tag, cascade_to_project=True)
+                with self.db_service.unit_of_work():
+                    # Update task
+                    updated_task = self.db_service.update_task(task.id, **task_data)
+
+                    # Update tags (remove old ones, add new ones with cascading)
+                    for tag in task.tags:
+                        # Handle both old string format and TagView format
+                        tag_name = tag.name if isinstance(tag, TagView) else tag
+                        self.db_service.remove_task_tag(
+                            task.id, tag_name, cascade_to_project=True
+                        )
+                    for tag in new_tags:
+                        self.db_service.add_task_tag(
+                            task.id, tag, cascade_to_project=True
+                        )
 
                 # Refresh both task list and project list to show updated tags
                 self.refresh_task_list(self.current_project_id)
@@ -2318,24 +2336,24 @@ class MainWindow(QMainWindow):
 
     def on_habit_entry_added(self, habit: Habit, entry: HabitEntry):
         """Handle habit entry addition."""
-        # Create entry in database
-        created_entry = self.db_service.create_habit_entry(
-            habit_id=entry.habit_id,
-            date=entry.date,
-            value=entry.value,
-            notes=entry.notes,
+        # The habit row already shows the entry, save it without blocking the UI
+        self.entry_writer.add_entry(habit, entry)
+
+    def on_habit_entry_saved(self, habit: Habit, updated_habit: Habit):
+        """Handle a habit entry saved by the entry writer."""
+        if updated_habit:
+            self.habit_list_widget.update_habit_in_list(updated_habit)
+
+        self.notification_manager.show_success(
+            "Entry Added", f"Entry added to '{habit.name}' successfully!"
         )
 
-        if created_entry:
-            # Refresh the habit to get updated data
-            updated_habit = self.db_service.get_habit(habit.id)
-            if updated_habit:
-                self.habit_list_widget.update_habit_in_list(updated_habit)
+    def on_habit_entry_failed(self, habit: Habit, entry: HabitEntry):
+        """Handle a habit entry the entry writer failed to save."""
+        # Take back the entry the habit row showed before it was saved,
+        # keeping any shown or saved since
+        self.habit_list_widget.remove_entry_from_list(habit.id, entry)
 
-            self.notification_manager.show_success(
-                "Entry Added", f"Entry added to '{habit.name}' successfully!"
-            )
-        else:
-            self.notification_manager.show_error(
-                "Entry Failed", f"Failed to add entry to '{habit.name}'."
-            )
+        self.notification_manager.show_error(
+            "Entry Failed", f"Failed to add entry to '{habit.name}'."
+        )